@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark of check_existing_report.py, one scenario per exit code.
+
+Each scenario runs the gate as a fresh interpreter ``--runs`` times against the
+test fixtures staged under a temporary HOME and reports wall-clock statistics
+in milliseconds. ``python_startup`` is the floor: ``python -c pass``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CHECK_SCRIPT = ROOT / "scripts" / "check_existing_report.py"
+FIXTURES = ROOT / "tests" / "fixtures"
+PERIOD = "weekly"
+DATE = "2026-02-17"
+
+# name -> (fixture dir or None, extra args, expected exit code)
+SCENARIOS = {
+    "missing": (None, [], 10),
+    "existing_valid_cached": (FIXTURES / "pass" / PERIOD / DATE, [], 0),
+    "existing_valid": (FIXTURES / "pass" / PERIOD / DATE, ["--no-cache"], 0),
+    "existing_invalid": (FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE, ["--no-cache"], 20),
+}
+
+
+def time_command(cmd: list[str], env: dict[str, str], runs: int, expected_exit_code: int) -> dict[str, object]:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(cmd, capture_output=True, env=env)
+        samples.append((time.perf_counter() - started) * 1000)
+        if completed.returncode != expected_exit_code:
+            raise SystemExit(f"{cmd} exited {completed.returncode}, expected {expected_exit_code}")
+    return {
+        "exit_code": expected_exit_code,
+        "median_ms": round(statistics.median(samples), 2),
+        "min_ms": round(min(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def run_benchmark(runs: int) -> dict[str, object]:
+    results: dict[str, object] = {}
+    with tempfile.TemporaryDirectory() as temp_home:
+        env = {**os.environ, "HOME": temp_home}
+        results["python_startup"] = time_command([sys.executable, "-c", "pass"], env, runs, 0)
+        for name, (fixture_dir, extra_args, exit_code) in SCENARIOS.items():
+            report_dir = Path(temp_home) / ".github_trending" / PERIOD / DATE
+            shutil.rmtree(report_dir, ignore_errors=True)
+            if fixture_dir is not None:
+                shutil.copytree(fixture_dir, report_dir)
+            cmd = [sys.executable, str(CHECK_SCRIPT), "--period", PERIOD, "--date", DATE, *extra_args]
+            results[name] = time_command(cmd, env, runs, exit_code)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure gate cold-start time for each exit code.")
+    parser.add_argument("--runs", type=int, default=20, help="Interpreter launches per scenario (default: 20).")
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.runs), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Throughput of each installed HTML backend on synthetic trending pages and reports.
+
+For every backend and page size (``--repos``) the source page extractor and the
+HTML report parser run ``--runs`` times in-process; median milliseconds are
+reported. Every backend's output is checked against ``stdlib`` first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from corpus import synthetic_pages  # noqa: E402
+from html_backends import available_backends  # noqa: E402
+from validate_report import extract_source_repos, parse_html_cards  # noqa: E402
+
+
+def median_ms(func: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run_benchmark(repo_counts: list[int], runs: int) -> dict[str, object]:
+    results: dict[str, object] = {}
+    for repo_count in repo_counts:
+        source_html, report_html = synthetic_pages(repo_count)
+        expected_repos = extract_source_repos(source_html, "stdlib")
+        expected_cards = parse_html_cards(report_html, "stdlib").cards
+        row: dict[str, object] = {"source_bytes": len(source_html.encode()), "report_bytes": len(report_html.encode())}
+        for backend in available_backends():
+            if extract_source_repos(source_html, backend) != expected_repos:
+                raise SystemExit(f"{backend}: source repos differ from stdlib")
+            if parse_html_cards(report_html, backend).cards != expected_cards:
+                raise SystemExit(f"{backend}: report cards differ from stdlib")
+            row[backend] = {
+                "source_ms": median_ms(lambda: extract_source_repos(source_html, backend), runs),
+                "report_ms": median_ms(lambda: parse_html_cards(report_html, backend), runs),
+            }
+        results[str(repo_count)] = row
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare HTML backend throughput on synthetic pages.")
+    parser.add_argument(
+        "--repos",
+        type=int,
+        action="append",
+        help="Repos per synthetic page (repeatable; default: 25, 250, 2500).",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per backend and page (default: 10).")
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.repos or [25, 250, 2500], args.runs), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""Worst-case time of each check on pathological inputs, under guarded validation.
+
+For every installed HTML backend, every ``corpus.STRESS_CASES`` case and every
+size (``--sizes``, characters; default 100000 and 1000000) a valid synthetic
+report directory gets the case's text as one artifact and is validated with
+``validate_report_dir(budget=...)``. The time of the check that reads that
+artifact (worker round trip included) is reported per case and size, with
+``"timed_out": true`` where the check hit ``--check-seconds``.
+
+``worst`` lists the slowest case per backend and check at the largest size.
+``exponent`` is the log-log slope of a case's time between the smallest and
+largest size (1 is linear, 2 quadratic); it is left out below
+``MIN_EXPONENT_MS``, where the worker round trip dominates.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from corpus import STRESS_CASES, write_stress_report_dir  # noqa: E402
+from html_backends import available_backends  # noqa: E402
+from phase_timing import PhaseTimer  # noqa: E402
+from validate_report import OUTPUT_ROOT_NAME, validate_report_dir  # noqa: E402
+from validation_budget import DEFAULT_MAX_BYTES, MIB, ValidationBudget  # noqa: E402
+
+PERIOD = "weekly"
+DATE = "2026-02-17"
+DEFAULT_SIZES = [100_000, 1_000_000]
+MIN_EXPONENT_MS = 50.0
+# The check that reads each artifact, and the phase it is timed under.
+CHECKS = {
+    "source_file": ("source", "source_extraction"),
+    "md_file": ("markdown", "markdown_parse"),
+    "html_file": ("html", "html_parse"),
+    "manifest_file": ("manifest", "manifest_checks"),
+}
+
+
+def run_case(temp_home: str, backend: str, artifact: str, case: str, size: int, check_seconds: float) -> dict:
+    report_dir = Path(temp_home) / OUTPUT_ROOT_NAME / PERIOD / DATE
+    write_stress_report_dir(report_dir, artifact, case, size, PERIOD, DATE)
+    check, phase_name = CHECKS[artifact]
+    # Every case fits the size budget, so it is timed rather than refused.
+    budget = ValidationBudget(check_seconds, dict.fromkeys(DEFAULT_MAX_BYTES, 64 * MIB))
+    timer = PhaseTimer()
+    result = validate_report_dir(
+        report_dir, PERIOD, DATE, html_backend=backend, timer=timer, source_sidecar=False, budget=budget
+    )
+    stats = timer.phases.get(phase_name)
+    return {
+        "ms": round(stats.wall_seconds * 1000, 3) if stats else None,
+        "timed_out": f"{check} check exceeded its time budget of {check_seconds:g} s." in result.errors,
+        "crashed": any(error.startswith(f"{check} check failed:") for error in result.errors),
+    }
+
+
+def exponent(small: dict, large: dict, sizes: list[int]) -> float | None:
+    if small["ms"] is None or large["ms"] is None or large["timed_out"] or large["ms"] < MIN_EXPONENT_MS:
+        return None
+    return round(math.log(large["ms"] / small["ms"]) / math.log(sizes[-1] / sizes[0]), 2)
+
+
+def run_benchmark(sizes: list[int], backends: list[str], check_seconds: float) -> dict[str, object]:
+    sizes = sorted(sizes)
+    results: dict[str, dict] = {}
+    worst: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as temp_home:
+        previous_home = os.environ.get("HOME")
+        os.environ["HOME"] = temp_home
+        try:
+            for backend in backends:
+                for artifact, cases in STRESS_CASES.items():
+                    check = CHECKS[artifact][0]
+                    for case in cases:
+                        by_size = {
+                            str(size): run_case(temp_home, backend, artifact, case, size, check_seconds)
+                            for size in sizes
+                        }
+                        if len(sizes) > 1:
+                            by_size["exponent"] = exponent(by_size[str(sizes[0])], by_size[str(sizes[-1])], sizes)
+                        results.setdefault(backend, {}).setdefault(check, {})[case] = by_size
+                        largest = by_size[str(sizes[-1])]
+                        current = worst.setdefault(backend, {}).get(check)
+                        if current is None or (largest["ms"] or 0) > current["ms"]:
+                            worst[backend][check] = {"case": case, **largest}
+        finally:
+            if previous_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = previous_home
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "sizes": sizes,
+            "check_seconds": check_seconds,
+        },
+        "worst": worst,
+        "cases": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time each check on pathological inputs under guarded validation.")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Pathological artifact sizes in characters (default: 100000 1000000).",
+    )
+    parser.add_argument(
+        "--html-backend",
+        action="append",
+        default=None,
+        help="HTML backend to measure; repeatable (default: every installed backend).",
+    )
+    parser.add_argument("--check-seconds", type=float, default=10.0, help="Time budget per check (default: 10).")
+    parser.add_argument("--output", type=Path, default=None, help="Write JSON here instead of stdout.")
+    args = parser.parse_args()
+    payload = json.dumps(
+        run_benchmark(args.sizes, args.html_backend or available_backends(), args.check_seconds), indent=2
+    )
+    if args.output is None:
+        print(payload)
+    else:
+        args.output.write_text(payload + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
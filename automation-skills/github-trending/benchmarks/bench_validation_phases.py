@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""How validation scales with report size, phase by phase.
+
+For each size (``--repos``, default 25, 100, 1000, 10000) a synthetic report
+directory is generated (``corpus.py``) under a temporary HOME, and every
+phase of ``validate_report_dir`` is timed on its own, plus the whole call:
+
+- ``read``: reading the four artifacts
+- ``source_extraction``: ``extract_source_repos``
+- ``source_extraction_mapped``: ``extract_source_repos_mapped``, read included
+- ``markdown_parse``: ``parse_markdown_lines``
+- ``html_parse``: ``parse_html_cards``
+- ``manifest_checks``: ``json.loads`` + ``validate_manifest``
+- ``cross_file``: ``compare_artifacts``
+- ``total``: ``validate_report_dir(source_sidecar=False)``
+- ``total_parallel``: the same with ``parallel=True`` (serial on one CPU)
+- ``total_gzip_source``: ``total`` with the source page stored as
+  ``original_trending.html.gz`` (as left by ``compact_reports.py``)
+- ``total_sidecar_hit``: ``validate_report_dir`` with its default
+  ``source_sidecar=True`` once the sidecar is written, so the source page is
+  not parsed at all
+
+The ``total*`` rows other than ``total_sidecar_hit`` bypass the source sidecar
+(``source_sidecar.py``): they time a cold validation that parses every
+artifact, and are comparable with the sum of the phases above them.
+
+Median milliseconds per phase go to stdout (or ``--output``) as JSON. Pass a
+previous output as ``--compare`` to flag phases that got slower than
+``--threshold`` (relative) and ``--min-delta-ms`` (absolute); the exit code is
+1 if any did.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from artifact_io import compress_file  # noqa: E402
+from corpus import write_report_dir  # noqa: E402
+from html_backends import resolve_backend  # noqa: E402
+from validate_report import (  # noqa: E402
+    OUTPUT_ROOT_NAME,
+    ValidationResult,
+    compare_artifacts,
+    extract_source_repos,
+    extract_source_repos_mapped,
+    parse_html_cards,
+    parse_markdown_lines,
+    validate_manifest,
+    validate_report_dir,
+)
+
+PERIOD = "weekly"
+DATE = "2026-02-17"
+DEFAULT_SIZES = [25, 100, 1000, 10000]
+
+
+def median_ms(func: Callable[[], object], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def bench_report_dir(report_dir: Path, backend: str, runs: int) -> dict[str, object]:
+    files = {
+        "source": report_dir / "original_trending.html",
+        "markdown": report_dir / f"report_{DATE}.md",
+        "html": report_dir / f"report_{DATE}.html",
+        "manifest": report_dir / "report_manifest.json",
+    }
+
+    def read_all() -> dict[str, str]:
+        return {name: path.read_text(encoding="utf-8", errors="ignore") for name, path in files.items()}
+
+    texts = read_all()
+    md_lines = texts["markdown"].splitlines()
+    source_repos = extract_source_repos(texts["source"], backend)
+    markdown_entries, _ = parse_markdown_lines(md_lines, ValidationResult())
+    html_cards = parse_html_cards(texts["html"], backend).cards
+
+    def manifest_checks() -> tuple[dict, list[dict]]:
+        manifest = json.loads(texts["manifest"])
+        return manifest, validate_manifest(manifest, PERIOD, DATE, ValidationResult())
+
+    manifest, manifest_repos = manifest_checks()
+    final = validate_report_dir(report_dir, PERIOD, DATE, html_backend=backend)
+    if final.errors:
+        raise SystemExit(f"synthetic report in {report_dir} is invalid: {final.errors[:3]}")
+
+    phases = {
+        "read": lambda: read_all(),
+        "source_extraction": lambda: extract_source_repos(texts["source"], backend),
+        "source_extraction_mapped": lambda: extract_source_repos_mapped(files["source"], backend=backend),
+        "markdown_parse": lambda: parse_markdown_lines(md_lines, ValidationResult()),
+        "html_parse": lambda: parse_html_cards(texts["html"], backend),
+        "manifest_checks": manifest_checks,
+        "cross_file": lambda: compare_artifacts(
+            source_repos, markdown_entries, html_cards, manifest, manifest_repos, ValidationResult()
+        ),
+        "total": lambda: validate_report_dir(report_dir, PERIOD, DATE, html_backend=backend, source_sidecar=False),
+        "total_parallel": lambda: validate_report_dir(
+            report_dir, PERIOD, DATE, html_backend=backend, source_sidecar=False, parallel=True
+        ),
+        "total_sidecar_hit": lambda: validate_report_dir(report_dir, PERIOD, DATE, html_backend=backend),
+    }
+    phases_ms = {name: median_ms(func, runs) for name, func in phases.items()}
+    sizes = {name: path.stat().st_size for name, path in files.items()}
+
+    compressed = files["source"].with_name(files["source"].name + ".gz")
+    compress_file(files["source"], compressed, "gzip")
+    hidden = files["source"].with_name(files["source"].name + ".bench")
+    files["source"].rename(hidden)
+    try:
+        phases_ms["total_gzip_source"] = median_ms(
+            lambda: validate_report_dir(report_dir, PERIOD, DATE, html_backend=backend, source_sidecar=False), runs
+        )
+        sizes["source_gzip"] = compressed.stat().st_size
+    finally:
+        hidden.rename(files["source"])
+        compressed.unlink()
+    return {"bytes": sizes, "phases_ms": phases_ms}
+
+
+def run_benchmark(sizes: list[int], runs: int, backend: str | None) -> dict[str, object]:
+    backend = resolve_backend(backend)
+    results: dict[str, object] = {}
+    previous_home = os.environ.get("HOME")
+    with tempfile.TemporaryDirectory() as temp_home:
+        os.environ["HOME"] = temp_home
+        try:
+            for size in sizes:
+                report_dir = write_report_dir(Path(temp_home) / OUTPUT_ROOT_NAME / PERIOD / DATE, size, PERIOD, DATE)
+                results[str(size)] = bench_report_dir(report_dir, backend, runs)
+        finally:
+            if previous_home is None:
+                os.environ.pop("HOME", None)
+            else:
+                os.environ["HOME"] = previous_home
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "html_backend": backend,
+            "runs": runs,
+            "cpus": len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[dict[str, object]]:
+    """Phases slower than the baseline by more than ``threshold`` and ``min_delta_ms``."""
+    regressions = []
+    for size, row in current["results"].items():
+        base_row = baseline.get("results", {}).get(size)
+        if not base_row:
+            continue
+        for phase, value in row["phases_ms"].items():
+            base_value = base_row["phases_ms"].get(phase)
+            if base_value is None:
+                continue
+            if value > base_value * (1 + threshold) and value - base_value > min_delta_ms:
+                regressions.append(
+                    {
+                        "repos": int(size),
+                        "phase": phase,
+                        "baseline_ms": base_value,
+                        "current_ms": value,
+                        "ratio": round(value / base_value, 3) if base_value else None,
+                    }
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Time each validation phase on synthetic reports of growing size.")
+    parser.add_argument(
+        "--repos",
+        type=int,
+        action="append",
+        help=f"Repos per synthetic report (repeatable; default: {', '.join(map(str, DEFAULT_SIZES))}).",
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per phase (default: 5).")
+    parser.add_argument("--html-backend", default=None, help="HTML backend to measure (default: auto).")
+    parser.add_argument("--output", default=None, help="Write the results JSON here (a new baseline).")
+    parser.add_argument("--compare", default=None, help="Baseline JSON from an earlier run to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Relative slowdown that counts as a regression (default: 0.25).",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this many milliseconds (default: 1.0).",
+    )
+    args = parser.parse_args()
+    if args.runs < 1 or any(size < 1 for size in args.repos or []):
+        parser.error("--runs and --repos must be positive integers.")
+    try:
+        current = run_benchmark(args.repos or DEFAULT_SIZES, args.runs, args.html_backend)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+    if not args.compare:
+        print(json.dumps(current, indent=2))
+        return 0
+
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    regressions = compare(current, baseline, args.threshold, args.min_delta_ms)
+    print(json.dumps({"baseline_meta": baseline.get("meta"), "current": current, "regressions": regressions}, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""Synthetic report corpus: consistent report directories of any size.
+
+``write_report_dir`` produces the four artifacts the validator expects for N
+repos: a trending page with realistic chrome around the ``Box-row`` list, the
+Markdown report, the HTML report and ``report_manifest.json``. The output is
+deterministic for a given ``seed`` and passes ``validate_report.py``.
+
+``STRESS_CASES`` are pathological artifacts (unclosed tags, deep nesting,
+oversized numbers, ...) for the guarded mode and ``bench_stress.py``;
+``write_stress_report_dir`` puts one of them into an otherwise valid directory.
+
+Usage:
+    python3 corpus.py --repos 1000 --output-dir /tmp/report [--period weekly] [--date 2026-02-17]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable
+
+PERIOD_TITLES = {"daily": "今日", "weekly": "本周", "monthly": "本月"}
+TAGS = ["🟢 开箱即用", "🟡 需配置", "🔵 AI Agent", "🟣 学习资源"]
+OWNER_WORDS = ["open", "deep", "fast", "micro", "astro", "data", "cloud", "neural", "rust", "byte", "quant", "edge"]
+REPO_WORDS = ["agent", "kit", "lab", "flow", "db", "ui", "engine", "bench", "graph", "cli", "vision", "sdk"]
+SENTENCES = [
+    "面向开发者的开源工具，聚焦于降低部署与集成成本。",
+    "提供完整的命令行与 Python API，可直接嵌入现有工作流。",
+    "通过缓存与增量计算显著缩短了大型项目的构建时间。",
+    "社区活跃，文档覆盖安装、配置与常见问题排查。",
+    "适合需要快速验证想法的小团队以及个人开发者。",
+    "核心模块以插件形式组织，便于按需裁剪与二次开发。",
+]
+
+# Markup around each repo on the live trending page is mostly SVG icons and link rows.
+SOURCE_ROW = """  <article class="Box-row">
+    <div class="float-right"><a href="/login?return_to=%2F{owner}%2F{repo}" class="btn-sm btn">
+      <svg aria-hidden="true" height="16" viewBox="0 0 16 16" width="16"><path d="M8 .25a.75.75 0 0 1 .673.418l1.882 3.815 4.21.612a.75.75 0 0 1 .416 1.279l-3.046 2.97.719 4.192a.751.751 0 0 1-1.088.791L8 12.347l-3.766 1.98a.75.75 0 0 1-1.088-.79l.72-4.194L.818 6.374a.75.75 0 0 1 .416-1.28l4.21-.611L7.327.668A.75.75 0 0 1 8 .25Z"></path></svg>
+      Star</a></div>
+    <h2 class="h3 lh-condensed"><a data-hydro-click="{{&quot;event_type&quot;:&quot;explore.click&quot;}}" href="/{owner}/{repo}" class="Link">
+      <svg aria-hidden="true" height="16" viewBox="0 0 16 16" width="16" class="octicon octicon-repo mr-1 color-fg-muted"><path d="M2 2.5A2.5 2.5 0 0 1 4.5 0h8.75a.75.75 0 0 1 .75.75v12.5a.75.75 0 0 1-.75.75h-2.5a.75.75 0 0 1 0-1.5h1.75v-2h-8a1 1 0 0 0-.714 1.7.75.75 0 1 1-1.072 1.05A2.495 2.495 0 0 1 2 11.5Z"></path></svg>
+      <span data-view-component="true" class="text-normal">{owner} /</span> {repo}</a></h2>
+    <p class="col-9 color-fg-muted my-1 pr-4">Synthetic description for {owner}/{repo} with enough words to look real.</p>
+    <div class="f6 color-fg-muted mt-2">
+      <span class="d-inline-block ml-0 mr-3"><span class="repo-language-color" style="background-color: #3572A5"></span> <span itemprop="programmingLanguage">Python</span></span>
+      <a href="/{owner}/{repo}/stargazers" class="Link d-inline-block mr-3">12,345</a>
+      <a href="/{owner}/{repo}/forks" class="Link d-inline-block mr-3">1,234</a>
+      <span class="d-inline-block float-sm-right">1,024 stars this week</span>
+    </div>
+  </article>
+"""
+
+# Page chrome around the list: navigation menus, inline scripts, footer links.
+SOURCE_HEADER_BLOCK = """  <li class="HeaderMenu-item"><a class="HeaderMenu-link" href="/features/{index}" data-analytics-event="{{&quot;category&quot;:&quot;Header menu&quot;}}">
+    <svg aria-hidden="true" height="24" viewBox="0 0 24 24" width="24"><path d="M1 2.75C1 1.784 1.784 1 2.75 1h18.5c.966 0 1.75.784 1.75 1.75v18.5A1.75 1.75 0 0 1 21.25 23H2.75A1.75 1.75 0 0 1 1 21.25Z"></path></svg>
+    <div><div class="color-fg-default h4">Feature {index}</div>Short blurb about feature {index}.</div></a></li>
+"""
+SOURCE_SCRIPT = """<script type="application/json" id="client-env">{"locale":"en","featureFlags":["a","b","c"],"payload":"%s"}</script>
+"""
+SOURCE_FOOTER_BLOCK = """  <li class="mr-3"><a href="/site/page-{index}" class="Link--secondary" data-analytics-event="footer">Footer link {index}</a></li>
+"""
+
+REPORT_CARD = """  <div class="repo-card">
+    <div class="repo-title">{rank}. <a href="https://github.com/{owner}/{repo}">{owner}/{repo}</a></div>
+    <div><span class="tag">{tag}</span></div>
+    <div class="detail-row"><span class="label">是什么:</span> {what}</div>
+    <div class="detail-row"><span class="label">作用:</span> {role}</div>
+    <div class="detail-row"><span class="label">效果:</span> {effect}</div>
+    <div class="detail-row"><span class="label">项目分析:</span> {analysis}</div>
+    <div class="suggestion-box"><strong>建议:</strong> {advice}</div>
+  </div>
+"""
+
+MARKDOWN_ENTRY = """### {rank}. [{owner}/{repo}](https://github.com/{owner}/{repo})
+`{tag}`
+* **是什么**: {what}
+* **作用**: {role}
+* **效果**: {effect}
+* **项目分析**: {analysis}
+* **建议**: {advice}
+"""
+
+
+def synthetic_repos(count: int, seed: int = 0) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    return [
+        (f"{rng.choice(OWNER_WORDS)}-{index}", f"{rng.choice(REPO_WORDS)}{rng.choice(REPO_WORDS)}")
+        for index in range(1, count + 1)
+    ]
+
+
+def source_page(repos: list[tuple[str, str]]) -> str:
+    return (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        + SOURCE_SCRIPT % ("x" * 20000)
+        + "</head>\n<body>\n<header><ul>\n"
+        + "".join(SOURCE_HEADER_BLOCK.format(index=index) for index in range(120))
+        + '</ul></header>\n<main><div class="Box"><div data-hpc>\n'
+        + "".join(SOURCE_ROW.format(owner=owner, repo=repo) for owner, repo in repos)
+        + "</div></div></main>\n<footer><ul>\n"
+        + "".join(SOURCE_FOOTER_BLOCK.format(index=index) for index in range(200))
+        + "</ul></footer>\n</body>\n</html>\n"
+    )
+
+
+def _entry_fields(rng: random.Random) -> dict[str, str]:
+    def text() -> str:
+        return "".join(rng.sample(SENTENCES, rng.randint(1, 3)))
+
+    return {
+        "tag": rng.choice(TAGS),
+        "what": text(),
+        "role": text(),
+        "effect": text(),
+        "analysis": text(),
+        "advice": text(),
+    }
+
+
+def markdown_report(repos: list[tuple[str, str]], period: str, date: str, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    entries = [
+        MARKDOWN_ENTRY.format(rank=rank, owner=owner, repo=repo, **_entry_fields(rng))
+        for rank, (owner, repo) in enumerate(repos, start=1)
+    ]
+    return (
+        f"# GitHub {PERIOD_TITLES[period]}技术趋势报告({date})\n\n"
+        "## 📊 概述与趋势分析\n"
+        f"* **本期核心趋势**: {SENTENCES[0]}\n"
+        f"* **关注建议**: {SENTENCES[1]}\n"
+        "* **建议行动**:\n  1. 行动一。\n  2. 行动二。\n  3. 行动三。\n\n---\n\n"
+        "## 🚀 热门项目详细分析\n\n" + "\n".join(entries)
+    )
+
+
+def html_report(repos: list[tuple[str, str]], period: str, date: str, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    title = f"GitHub {PERIOD_TITLES[period]}技术趋势报告({date})"
+    cards = [
+        REPORT_CARD.format(rank=rank, owner=owner, repo=repo, **_entry_fields(rng))
+        for rank, (owner, repo) in enumerate(repos, start=1)
+    ]
+    return (
+        '<!DOCTYPE html>\n<html lang="zh-CN">\n<head>\n  <meta charset="UTF-8">\n'
+        f"  <title>{title}</title>\n"
+        "  <style>\n    .overview-section { margin: 1em; }\n    .repo-card { border: 1px solid #ddd; }\n"
+        "    .tag { border-radius: 4px; }\n    .suggestion-box { background: #f6f8fa; }\n  </style>\n"
+        f"</head>\n<body>\n  <h1>{title}</h1>\n"
+        f'  <div class="overview-section">\n    <p>{SENTENCES[0]}</p>\n  </div>\n\n'
+        "  <h2>🚀 热门项目详细分析</h2>\n\n" + "\n".join(cards) + "</body>\n</html>\n"
+    )
+
+
+def manifest(repos: list[tuple[str, str]], period: str, date: str) -> dict[str, object]:
+    return {
+        "date": date,
+        "period": period,
+        "source_item_count": len(repos),
+        "reported_item_count": len(repos),
+        "repos": [
+            {"rank": rank, "repo": f"{owner}/{repo}", "url": f"https://github.com/{owner}/{repo}"}
+            for rank, (owner, repo) in enumerate(repos, start=1)
+        ],
+    }
+
+
+def synthetic_pages(repo_count: int, seed: int = 0) -> tuple[str, str]:
+    """Source page and HTML report for ``repo_count`` repos, without touching the filesystem."""
+    repos = synthetic_repos(repo_count, seed)
+    return source_page(repos), html_report(repos, "weekly", "2026-02-17", seed)
+
+
+def write_report_dir(report_dir: Path, repo_count: int, period: str, date: str, seed: int = 0) -> Path:
+    """Write a valid report directory for ``repo_count`` repos and return it."""
+    repos = synthetic_repos(repo_count, seed)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    (report_dir / "original_trending.html").write_text(source_page(repos), encoding="utf-8")
+    (report_dir / f"report_{date}.md").write_text(markdown_report(repos, period, date, seed), encoding="utf-8")
+    (report_dir / f"report_{date}.html").write_text(html_report(repos, period, date, seed), encoding="utf-8")
+    (report_dir / "report_manifest.json").write_text(
+        json.dumps(manifest(repos, period, date), ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return report_dir
+
+
+# Artifact key -> case name -> text of about ``size`` characters. Each one once made a check
+# superlinear, crashed it, or is a known worst case of a parser.
+STRESS_CASES: dict[str, dict[str, Callable[[int], str]]] = {
+    "source_file": {
+        "unclosed_h2_run": lambda size: "<h2" * (size // 3),
+        "h2_tags_sharing_one_end": lambda size: "<h2 " * (size // 4) + ">",
+        "unclosed_tag_run": lambda size: "<a" * (size // 2),
+        "unclosed_comment": lambda size: "<!--" + "x" * size,
+        "unclosed_script": lambda size: "<script" + " x" * (size // 2),
+        "unclosed_box_row": lambda size: '<article class="Box-row"' + ' a="b"' * (size // 6),
+        "h2_link_without_end": lambda size: "<h2><a " + "x" * size,
+        "deep_nesting": lambda size: "<div>" * (size // 5),
+    },
+    "html_file": {
+        "unclosed_tag_run": lambda size: "<a" * (size // 2),
+        "tag_name_then_stray_quote": lambda size: "<a" + "b" * size + ' ">',
+        "unclosed_comment": lambda size: "<body><!--" + "x" * size,
+        "unterminated_attribute": lambda size: '<div class="' + "x" * size,
+        "deep_nesting": lambda size: "<div>" * (size // 5),
+        "unclosed_p_lists": lambda size: "<p><ul>" * (size // 7),
+        "backtick_flood": lambda size: "<body>" + "`" * size + "</body>",
+        "backtick_lines": lambda size: "<body>" + "`\n" * (size // 2),
+        "body_end_flood": lambda size: "<body>" + "</body>\n" * (size // 8),
+    },
+    "md_file": {
+        "long_line": lambda size: "x" * size,
+        "huge_rank": lambda size: "### " + "9" * size + ". [a/b](https://github.com/a/b)",
+        "unfinished_heading": lambda size: "### 1. [" + "a" * size,
+        "heading_flood": lambda size: "### 1. [a/b](https://github.com/a/b)\n" * (size // 37),
+        "field_flood": lambda size: "### 1. [a/b](https://github.com/a/b)\n" + "* **是什么**: x\n" * (size // 14),
+        "backtick_flood": lambda size: "### 1. [a/b](https://github.com/a/b)\n" + "`" * size,
+    },
+    "manifest_file": {
+        "deep_nesting": lambda size: "[" * size,
+        "huge_number": lambda size: '{"source_item_count": ' + "9" * size + "}",
+        "long_string": lambda size: '{"date": "' + "x" * size + '"}',
+        "repo_flood": lambda size: json.dumps(
+            {"repos": [{"rank": rank, "repo": "a/b", "url": "https://github.com/a/b"} for rank in range(size // 60)]}
+        ),
+    },
+}
+
+
+def write_stress_report_dir(
+    report_dir: Path, artifact: str, case: str, size: int, period: str, date: str, repo_count: int = 10
+) -> Path:
+    """A valid ``repo_count``-repo report directory whose ``artifact`` is replaced by ``STRESS_CASES`` text."""
+    write_report_dir(report_dir, repo_count, period, date)
+    names = {
+        "source_file": "original_trending.html",
+        "md_file": f"report_{date}.md",
+        "html_file": f"report_{date}.html",
+        "manifest_file": "report_manifest.json",
+    }  # report_layout.artifact_names, which this module does not import.
+    (report_dir / names[artifact]).write_text(STRESS_CASES[artifact][case](size), encoding="utf-8")
+    return report_dir
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic, valid report directory.")
+    parser.add_argument("--repos", type=int, required=True, help="Number of trending repos.")
+    parser.add_argument("--output-dir", required=True, help="Directory to write the four artifacts into.")
+    parser.add_argument("--period", default="weekly", choices=sorted(PERIOD_TITLES))
+    parser.add_argument("--date", default="2026-02-17", help="Date in YYYY-MM-DD format (default: 2026-02-17).")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for names and field text (default: 0).")
+    args = parser.parse_args()
+    if args.repos < 1:
+        parser.error("--repos must be a positive integer.")
+    report_dir = write_report_dir(Path(args.output_dir).expanduser(), args.repos, args.period, args.date, args.seed)
+    print(report_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
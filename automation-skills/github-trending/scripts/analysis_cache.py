@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Per-repo analysis blocks harvested from validated reports, for reuse in Step 2.
+
+``harvest`` runs the existing-report gate on every ``<period>/<date>`` report
+directory under ~/.github_trending and, for each valid report, stores every
+``### N. [owner/repo](url)`` block of its Markdown report keyed by
+``(repo, period, date)``. A report whose artifacts have the same size and
+mtime as when it was last harvested is skipped without running the gate;
+blocks of reports that became invalid or were deleted are dropped.
+
+``fresh`` answers "which repos in this source list already have an analysis
+from the last ``--max-age-days`` days": it returns the newest cached block of
+each such repo and lists the rest, which still need a sub-agent.
+
+Usage:
+    python3 analysis_cache.py harvest
+    python3 analysis_cache.py fresh --period weekly --date 2026-02-17 [--source FILE] [--max-age-days 7]
+    python3 analysis_cache.py show owner/repo
+
+Commands other than ``harvest`` harvest first unless ``--no-harvest`` is given, and print JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+from artifact_io import READ_ERRORS, read_artifact_text
+from audit_reports import discover_report_dirs
+from check_existing_report import build_paths, check_existing_report
+from html_backends import resolve_backend
+from report_layout import ARTIFACT_KEYS, OUTPUT_ROOT_NAME, PERIODS
+from validate_report import DATE_RE, MARKDOWN_HEADING_RE, STREAM_CHUNK_SIZE, load_source_repos
+
+CACHE_FILE_NAME = "analysis_cache.sqlite3"
+SCHEMA_VERSION = 1
+DEFAULT_MAX_AGE_DAYS = 7
+HARVEST_BATCH_SIZE = 20
+
+SCHEMA = """
+CREATE TABLE reports (
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    valid INTEGER NOT NULL,
+    PRIMARY KEY (period, date)
+) WITHOUT ROWID;
+CREATE TABLE analyses (
+    repo TEXT NOT NULL,
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    block TEXT NOT NULL,
+    PRIMARY KEY (repo, period, date)
+) WITHOUT ROWID;
+CREATE INDEX analyses_by_date ON analyses (repo, date);
+"""
+
+
+def default_cache_path() -> Path:
+    return Path.home() / OUTPUT_ROOT_NAME / CACHE_FILE_NAME
+
+
+def open_cache(db_path: Path | None = None) -> sqlite3.Connection:
+    """Open (creating or rebuilding on a schema change) the analysis cache database."""
+    db_path = db_path or default_cache_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS analyses")
+            conn.execute("DROP TABLE IF EXISTS reports")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def split_analysis_blocks(md_text: str) -> list[tuple[int, str, str]]:
+    """``(rank, repo, block)`` for every repo heading; a block ends at the next heading, ``---`` or ``## `` line."""
+    blocks: list[tuple[int, str, str]] = []
+    current: tuple[int, str] | None = None
+    lines: list[str] = []
+
+    def finish() -> None:
+        if current is not None:
+            blocks.append((*current, "\n".join(lines).rstrip()))
+
+    for line in md_text.splitlines():
+        match = MARKDOWN_HEADING_RE.match(line.strip()) if "###" in line else None
+        if match:
+            finish()
+            current, lines = (int(match.group(1)), match.group(2)), [line]
+        elif current is not None and (line.strip() == "---" or line.startswith("## ")):
+            finish()
+            current = None
+        elif current is not None:
+            lines.append(line)
+    finish()
+    return blocks
+
+
+def _signature(paths: dict[str, Path]) -> str:
+    signature = []
+    for key in ARTIFACT_KEYS:
+        try:
+            stat = paths[key].stat()
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append([stat.st_size, stat.st_mtime_ns])
+    return json.dumps(signature)
+
+
+def _harvest_report(conn: sqlite3.Connection, period: str, date: str, signature: str, paths: dict[str, Path]) -> bool:
+    """Validate one changed report and replace its cached blocks; return whether it was valid and readable."""
+    exit_code, _ = check_existing_report(period=period, date=date)
+    blocks: list[tuple[int, str, str]] = []
+    valid = exit_code == 0
+    if valid:
+        try:
+            # Same decoding as the validator, so a report that passed it is always readable here.
+            blocks = split_analysis_blocks(read_artifact_text(paths["md_file"]))
+        except READ_ERRORS as exc:
+            print(f"Skipping {period}/{date}: {exc}", file=sys.stderr)
+            valid = False
+    conn.execute("DELETE FROM analyses WHERE period = ? AND date = ?", (period, date))
+    conn.executemany(
+        "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?)",
+        [(repo, period, date, rank, block) for rank, repo, block in blocks],
+    )
+    conn.execute("INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?)", (period, date, signature, valid))
+    return valid
+
+
+def harvest(conn: sqlite3.Connection, periods: set[str] | None = None) -> dict[str, int]:
+    """Bring the cache up to date with the validated reports on disk; return per-outcome counts.
+
+    Changes are committed every ``HARVEST_BATCH_SIZE`` validated reports, so a
+    long harvest neither holds the write lock throughout nor loses finished
+    reports when it is interrupted.
+    """
+    counts = {"harvested": 0, "unchanged": 0, "invalid": 0, "removed": 0}
+    known = {
+        (period, date): signature
+        for period, date, signature in conn.execute("SELECT period, date, signature FROM reports")
+        if periods is None or period in periods
+    }
+    changed: list[tuple[str, str, str, dict[str, Path]]] = []
+    for period, date in discover_report_dirs(Path.home() / OUTPUT_ROOT_NAME, periods):
+        paths = build_paths(period, date)
+        signature = _signature(paths)
+        if known.pop((period, date), None) == signature:
+            counts["unchanged"] += 1
+        else:
+            changed.append((period, date, signature, paths))
+    for start in range(0, len(changed), HARVEST_BATCH_SIZE):
+        with conn:
+            for period, date, signature, paths in changed[start : start + HARVEST_BATCH_SIZE]:
+                counts["harvested" if _harvest_report(conn, period, date, signature, paths) else "invalid"] += 1
+    with conn:
+        for key in known:
+            conn.execute("DELETE FROM analyses WHERE period = ? AND date = ?", key)
+            conn.execute("DELETE FROM reports WHERE period = ? AND date = ?", key)
+            counts["removed"] += 1
+    return counts
+
+
+def latest_analysis(
+    conn: sqlite3.Connection, repo: str, since: str | None = None, until: str | None = None
+) -> dict[str, object] | None:
+    """The newest cached block of ``repo`` dated between ``since`` and ``until`` inclusive."""
+    row = conn.execute(
+        """
+        SELECT period, date, rank, block FROM analyses
+        WHERE repo = ? AND date BETWEEN ? AND ?
+        ORDER BY date DESC, CASE period WHEN 'daily' THEN 0 WHEN 'weekly' THEN 1 ELSE 2 END
+        LIMIT 1
+        """,
+        (repo, since or "0000-00-00", until or "9999-99-99"),
+    ).fetchone()
+    if row is None:
+        return None
+    return {"period": row[0], "date": row[1], "rank": row[2], "analysis": row[3]}
+
+
+def fresh_analyses(
+    conn: sqlite3.Connection, repos: list[str], as_of: str, max_age_days: int = DEFAULT_MAX_AGE_DAYS
+) -> tuple[list[dict[str, object]], list[dict[str, object]]]:
+    """Split ``repos`` (in source order) into those with a cached analysis at most ``max_age_days`` old and the rest."""
+    since = (datetime.date.fromisoformat(as_of) - datetime.timedelta(days=max_age_days)).isoformat()
+    cached: list[dict[str, object]] = []
+    missing: list[dict[str, object]] = []
+    for rank, repo in enumerate(repos, start=1):
+        hit = latest_analysis(conn, repo, since, as_of)
+        if hit is None:
+            missing.append({"rank": rank, "repo": repo})
+        else:
+            cached.append(
+                {
+                    "rank": rank,
+                    "repo": repo,
+                    "cached_from": {"period": hit["period"], "date": hit["date"]},
+                    "analysis": hit["analysis"],
+                }
+            )
+    return cached, missing
+
+
+def _date_arg(value: str) -> str:
+    if not DATE_RE.fullmatch(value):
+        raise argparse.ArgumentTypeError(f"invalid date: {value} (expected YYYY-MM-DD)")
+    return value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reuse per-repo analyses from validated GitHub Trending reports.")
+    parser.add_argument("--db", default=None, help=f"Cache database (default: ~/{OUTPUT_ROOT_NAME}/{CACHE_FILE_NAME}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("harvest", help="Store the analysis blocks of new and changed valid reports.")
+    fresh = commands.add_parser("fresh", help="Cached analyses for a source list's repos, and the repos without one.")
+    fresh.add_argument("--period", choices=sorted(PERIODS), required=True)
+    fresh.add_argument("--date", type=_date_arg, required=True, help="Report date; analyses up to this date count.")
+    fresh.add_argument("--source", default=None, help="Trending page to read repos from (default: the report's own).")
+    fresh.add_argument(
+        "--max-age-days",
+        type=int,
+        default=DEFAULT_MAX_AGE_DAYS,
+        help=f"Oldest analysis to reuse, in days before --date (default: {DEFAULT_MAX_AGE_DAYS}).",
+    )
+    show = commands.add_parser("show", help="The newest cached analysis of a repo.")
+    show.add_argument("repo", help="owner/repo")
+    for command in (fresh, show):
+        command.add_argument("--no-harvest", action="store_true", help="Query the cache as it is, without harvesting.")
+    args = parser.parse_args()
+
+    if args.command == "fresh":
+        if args.max_age_days < 0:
+            parser.error("--max-age-days must be >= 0")
+        if args.source:
+            source_file = Path(args.source).expanduser()
+        else:
+            source_file = build_paths(args.period, args.date)["source_file"]
+        try:
+            # Same reading as the validator; only the report's own source has a sidecar to reuse.
+            repos, _ = load_source_repos(source_file, True, STREAM_CHUNK_SIZE, resolve_backend(), not args.source)
+        except (OSError, EOFError) as exc:
+            parser.error(f"cannot read source file: {exc}")
+
+    conn = open_cache(Path(args.db).expanduser() if args.db else None)
+    try:
+        if args.command == "harvest" or not args.no_harvest:
+            counts = harvest(conn)
+            if args.command == "harvest":
+                print(json.dumps(counts))
+                return 0
+        if args.command == "fresh":
+            cached, missing = fresh_analyses(conn, repos, args.date, args.max_age_days)
+            reply: dict[str, object] = {
+                "period": args.period,
+                "date": args.date,
+                "max_age_days": args.max_age_days,
+                "source_count": len(repos),
+                "cached": cached,
+                "missing": missing,
+            }
+        else:
+            reply = {"repo": args.repo, "latest": latest_analysis(conn, args.repo)}
+    finally:
+        conn.close()
+    print(json.dumps(reply, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Read report artifacts that may be stored gzip- or zstd-compressed.
+
+An artifact ``<name>`` may be stored as ``<name>``, ``<name>.gz`` or
+``<name>.zst``; the plain file wins when several exist. Compressed artifacts
+are decompressed as a stream, so the streaming validator keeps flat memory.
+Text is decoded exactly like ``Path.read_text``/``Path.open``.
+
+zstd needs Python 3.14 (``compression.zstd``) or the ``zstandard`` package;
+gzip is always available. Like the layout module, this is imported on the
+gate's path, so codecs are only imported when a compressed file is opened.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import BinaryIO, TextIO
+
+CODEC_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+# gzip raises EOFError on a truncated stream and BadGzipFile (an OSError) on garbage.
+READ_ERRORS = (OSError, EOFError)
+COMPRESSED_SUFFIXES = tuple(CODEC_SUFFIXES.values())
+
+
+def stored_variants(path: str) -> list[str]:
+    """Candidate file names of one artifact, in resolution order."""
+    return [path, *(path + suffix for suffix in COMPRESSED_SUFFIXES)]
+
+
+def resolve_artifact(path: Path) -> Path:
+    """The stored file of ``path``: itself if present, else its first existing compressed variant, else ``path``."""
+    if os.path.exists(path):
+        return path
+    for suffix in COMPRESSED_SUFFIXES:
+        candidate = path.with_name(path.name + suffix)
+        if os.path.exists(candidate):
+            return candidate
+    return path
+
+
+def codec_of(path: Path) -> str | None:
+    for codec, suffix in CODEC_SUFFIXES.items():
+        if path.name.endswith(suffix):
+            return codec
+    return None
+
+
+def _zstd():
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        return None
+
+
+def codec_available(codec: str | None) -> bool:
+    return codec != "zstd" or _zstd() is not None
+
+
+def _unavailable(path: Path) -> OSError:
+    return OSError(f"{path}: zstd support requires Python 3.14+ or the zstandard package")
+
+
+def open_artifact_binary(path: Path) -> BinaryIO:
+    """Open the decompressed byte stream of ``path``."""
+    codec = codec_of(path)
+    if codec is None:
+        return open(path, "rb")
+    if codec == "gzip":
+        import gzip
+
+        return gzip.open(path, "rb")
+    zstd = _zstd()
+    if zstd is None:
+        raise _unavailable(path)
+    if zstd.__name__ == "zstandard":
+        return zstd.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    return zstd.open(path, "rb")
+
+
+def open_artifact_text(path: Path, errors: str = "ignore") -> TextIO:
+    """``path.open(encoding="utf-8", errors=errors)`` over the decompressed content."""
+    if codec_of(path) is None:
+        return open(path, encoding="utf-8", errors=errors)
+    import io
+
+    return io.TextIOWrapper(open_artifact_binary(path), encoding="utf-8", errors=errors)
+
+
+class ArtifactReadError(OSError):
+    """An artifact could not be read: unreadable, or a truncated or corrupt compressed stream."""
+
+
+def read_error(path: Path, exc: BaseException) -> ArtifactReadError:
+    return exc if isinstance(exc, ArtifactReadError) else ArtifactReadError(f"Cannot read {path}: {exc}")
+
+
+def read_artifact_text(path: Path, errors: str = "ignore") -> str:
+    try:
+        with open_artifact_text(path, errors) as handle:
+            return handle.read()
+    except READ_ERRORS as exc:
+        raise read_error(path, exc) from exc
+
+
+def read_artifact_bytes(path: Path) -> bytes:
+    try:
+        with open_artifact_binary(path) as handle:
+            return handle.read()
+    except READ_ERRORS as exc:
+        raise read_error(path, exc) from exc
+
+
+def compress_file(source: Path, target: Path, codec: str) -> None:
+    """Write ``source`` compressed with ``codec`` to ``target`` (deterministic output for equal input)."""
+    import shutil
+
+    with open(source, "rb") as reader, open(target, "wb") as raw:
+        if codec == "gzip":
+            import gzip
+
+            with gzip.GzipFile(filename="", mode="wb", compresslevel=9, fileobj=raw, mtime=0) as writer:
+                shutil.copyfileobj(reader, writer)
+            return
+        zstd = _zstd()
+        if zstd is None:
+            raise _unavailable(target)
+        if zstd.__name__ == "zstandard":
+            zstd.ZstdCompressor(level=19).copy_stream(reader, raw)
+        else:
+            with zstd.ZstdFile(raw, "wb", level=19) as writer:
+                shutil.copyfileobj(reader, writer)
@@ -0,0 +1,68 @@
+"""Asyncio API for the validator and the existing-report gate.
+
+For orchestrators that run on an event loop. Each coroutine runs the sync
+function (``validate_report_dir`` or ``check_existing_report``) in an
+executor, so neither file I/O nor parsing blocks the loop, and returns exactly
+what the sync function returns: the same ``ValidationResult`` or the same
+``(exit_code, payload)`` with exit codes 0/10/20.
+
+``executor=None`` uses the loop's default thread pool. Parsing holds the GIL,
+so pass a ``concurrent.futures.ProcessPoolExecutor`` to spread the parsing of
+many reports over CPUs (a ``timer`` cannot cross the process boundary).
+Cancelling a coroutine stops waiting for it; a validation already running in
+the executor still completes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import Iterable
+
+from check_existing_report import check_existing_report
+from validate_report import ValidationResult, validate_report_dir
+
+DEFAULT_CONCURRENCY = 4
+
+
+async def validate_report_dir_async(
+    report_dir: Path,
+    period: str,
+    date: str,
+    executor: Executor | None = None,
+    **options: object,
+) -> ValidationResult:
+    """``validate_report_dir(report_dir, period, date, **options)`` in ``executor``."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(validate_report_dir, report_dir, period, date, **options))
+
+
+async def check_existing_report_async(
+    period: str,
+    date: str,
+    executor: Executor | None = None,
+    **options: object,
+) -> tuple[int, dict[str, object]]:
+    """``check_existing_report(period, date, **options)`` in ``executor``."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(check_existing_report, period=period, date=date, **options))
+
+
+async def check_existing_reports(
+    targets: Iterable[tuple[str, str]],
+    limit: int = DEFAULT_CONCURRENCY,
+    executor: Executor | None = None,
+    **options: object,
+) -> list[tuple[int, dict[str, object]]]:
+    """Gate results for ``(period, date)`` targets, in target order, with at most ``limit`` checks in flight."""
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    semaphore = asyncio.Semaphore(limit)
+
+    async def check(period: str, date: str) -> tuple[int, dict[str, object]]:
+        async with semaphore:
+            return await check_existing_report_async(period, date, executor, **options)
+
+    return await asyncio.gather(*(check(period, date) for period, date in targets))
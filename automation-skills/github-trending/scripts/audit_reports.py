@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Bulk audit of every report directory under ~/.github_trending.
+
+Runs the existing-report gate for each ``<period>/<date>`` directory across a
+worker pool and streams one JSON line per directory, followed by a summary line.
+
+Exit codes:
+- 0: every report directory is valid
+- 10: no invalid reports, but at least one directory is missing its HTML report
+- 20: at least one report is invalid, or its check failed
+
+A directory whose check raises (an unreadable directory, an artifact the
+validator cannot handle) is reported with status ``failed`` and the error; the
+audit carries on with the other directories.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+from check_existing_report import build_paths, check_existing_report
+from validate_report import DATE_RE, OUTPUT_ROOT_NAME, PERIODS, usable_cpus
+
+
+def discover_report_dirs(base_dir: Path, periods: set[str] | None = None) -> list[tuple[str, str]]:
+    """Return sorted ``(period, date)`` pairs for every report directory under ``base_dir``."""
+    targets: list[tuple[str, str]] = []
+    for period in sorted(periods or PERIODS):
+        period_dir = base_dir / period
+        try:
+            entries = list(os.scandir(period_dir))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            if entry.is_dir() and DATE_RE.fullmatch(entry.name):
+                targets.append((period, entry.name))
+    return sorted(targets)
+
+
+def _audit_target(target: tuple[str, str, bool]) -> tuple[int, dict[str, object]]:
+    period, date, use_cache = target
+    try:
+        return check_existing_report(period=period, date=date, use_cache=use_cache)
+    except Exception as exc:  # noqa: BLE001 - one broken directory must not end the audit
+        return 20, {
+            "period": period,
+            "date": date,
+            "report_dir": str(build_paths(period, date)["report_dir"]),
+            "status": "failed",
+            "action": "regenerate",
+            "errors": [f"Check failed: {type(exc).__name__}: {exc}"],
+        }
+
+
+def audit_reports(
+    targets: list[tuple[str, str]],
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> Iterator[tuple[int, dict[str, object]]]:
+    """Yield gate results for ``targets`` in order, validating across ``workers`` processes."""
+    workers = workers or usable_cpus()
+    jobs = [(period, date, use_cache) for period, date in targets]
+    if workers == 1 or len(jobs) <= 1:
+        yield from map(_audit_target, jobs)
+        return
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_audit_target, jobs, chunksize=chunksize)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate every report directory under ~/.github_trending.")
+    parser.add_argument(
+        "--period",
+        action="append",
+        choices=sorted(PERIODS),
+        help="Restrict the audit to this period (repeatable; default: all periods).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of usable CPUs).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Revalidate every directory instead of reusing per-directory cached results.",
+    )
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be a positive integer.")
+
+    started = time.perf_counter()
+    base_dir = Path.home() / OUTPUT_ROOT_NAME
+    targets = discover_report_dirs(base_dir, set(args.period) if args.period else None)
+
+    status_counts: Counter[str] = Counter()
+    worst_exit_code = 0
+    for exit_code, payload in audit_reports(targets, workers=args.workers, use_cache=not args.no_cache):
+        status_counts[str(payload["status"])] += 1
+        worst_exit_code = max(worst_exit_code, exit_code)
+        print(json.dumps(payload, ensure_ascii=False), flush=True)
+
+    summary = {
+        "base_dir": str(base_dir),
+        "total": len(targets),
+        "status_counts": dict(sorted(status_counts.items())),
+        "wall_time_seconds": round(time.perf_counter() - started, 3),
+    }
+    print(json.dumps({"summary": summary}, ensure_ascii=False))
+    return worst_exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,95 +4,401 @@ Exit codes:
 - 0: report exists and is valid (skip generation, safe to send)
 - 10: report missing (generation required)
 - 20: report exists but invalid (regeneration required)
+
+Startup is tiered so the common "missing" outcome stays cheap: the cache module
+loads only once the HTML report exists, and the validator only on a cache miss.
+
+``--date-range`` and repeated ``--period`` check many targets in one process:
+the period directories are listed once with ``os.scandir`` and a target is
+validated only when its listing holds all four artifacts (see
+``check_report_targets``).
 """
 
 from __future__ import annotations
 
-import argparse
-import json
+import os
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+from artifact_io import codec_available, codec_of, resolve_artifact, stored_variants
+from report_layout import ARTIFACT_KEYS, OUTPUT_ROOT_NAME, PERIODS, artifact_names
+
+if TYPE_CHECKING:
+    import argparse
+    from pathlib import Path
+    from typing import Callable, Iterable, Iterator
 
-from validate_report import PERIODS, validate_report_dir
+    from phase_timing import PhaseTimer
+    from validation_budget import ValidationBudget
 
-OUTPUT_ROOT_NAME = ".github_trending"
+PAYLOAD_PATH_KEYS = ("base_dir", "report_dir", "source_file", "md_file", "html_file", "manifest_file")
 
 
 def build_paths(period: str, date: str) -> dict[str, Path]:
+    """Report paths; an artifact stored compressed (``<name>.gz``/``<name>.zst``) resolves to that file."""
+    from pathlib import Path
+
     base_dir = Path.home() / OUTPUT_ROOT_NAME
     report_dir = base_dir / period / date
-    return {
-        "base_dir": base_dir,
-        "report_dir": report_dir,
-        "source_file": report_dir / "original_trending.html",
-        "md_file": report_dir / f"report_{date}.md",
-        "html_file": report_dir / f"report_{date}.html",
-        "manifest_file": report_dir / "report_manifest.json",
-    }
+    paths = {"base_dir": base_dir, "report_dir": report_dir}
+    for key, name in artifact_names(date).items():
+        paths[key] = resolve_artifact(report_dir / name)
+    return paths
 
 
 def check_existing_report(
     period: str,
     date: str,
     allow_small_source: bool = False,
+    use_cache: bool = True,
+    html_backend: str | None = None,
+    timer: PhaseTimer | None = None,
+    budget: ValidationBudget | None = None,
 ) -> tuple[int, dict[str, object]]:
+    """Gate result for one target; with a ``budget`` the validator runs guarded (``validation_budget.py``)."""
     paths = build_paths(period=period, date=date)
     html_exists = paths["html_file"].exists()
 
-    payload: dict[str, object] = {
-        "period": period,
-        "date": date,
-        "base_dir": str(paths["base_dir"]),
-        "report_dir": str(paths["report_dir"]),
-        "source_file": str(paths["source_file"]),
-        "md_file": str(paths["md_file"]),
-        "html_file": str(paths["html_file"]),
-        "manifest_file": str(paths["manifest_file"]),
-    }
+    payload: dict[str, object] = {"period": period, "date": date}
+    for key in PAYLOAD_PATH_KEYS:
+        payload[key] = str(paths[key])
 
     if not html_exists:
         payload["status"] = "missing"
         payload["action"] = "generate"
         return 10, payload
 
+    from phase_timing import phase_context
+
+    phase = phase_context(timer)
+    if use_cache:
+        from html_backends import resolve_backend
+        from validation_cache import compute_cache_key, load_cached_result, store_cached_result
+
+        html_backend = resolve_backend(html_backend)
+        with phase("cache_lookup"):
+            cached = load_cached_result(paths, html_backend)
+        if cached is not None:
+            return cached
+        with phase("cache_key"):
+            cache_key = compute_cache_key(paths, html_backend)
+
+    from validate_report import validate_report_dir
+
     result = validate_report_dir(
         report_dir=paths["report_dir"],
         period=period,
         date=date,
         allow_small_source=allow_small_source,
+        html_backend=html_backend,
+        timer=timer,
+        budget=budget,
     )
 
     if result.errors:
+        exit_code = 20
         payload["status"] = "existing_invalid"
         payload["action"] = "regenerate"
         payload["errors"] = result.errors
-        if result.warnings:
-            payload["warnings"] = result.warnings
-        return 20, payload
-
-    payload["status"] = "existing_valid"
-    payload["action"] = "reuse_and_send"
+        if result.repo_diffs:
+            payload["repo_diffs"] = result.repo_diffs
+    else:
+        exit_code = 0
+        payload["status"] = "existing_valid"
+        payload["action"] = "reuse_and_send"
     if result.warnings:
         payload["warnings"] = result.warnings
-    return 0, payload
+
+    # A guarded failure may be a budget overrun, which another budget would not repeat.
+    if use_cache and (budget is None or exit_code == 0):
+        with phase("cache_store"):
+            store_cached_result(paths, cache_key, exit_code, payload)
+    return exit_code, payload
+
+
+def scan_report_tree(base_dir: str, periods: Iterable[str], dates: Iterable[str]) -> dict[tuple[str, str], set[str]]:
+    """File names in every existing ``<period>/<date>`` target directory, from one ``os.scandir`` per directory.
+
+    Targets without a directory are absent. Like ``os.path.exists``, a broken
+    symlink does not count and an unreadable directory reads as absent.
+    """
+    wanted = set(dates)
+    listings: dict[tuple[str, str], set[str]] = {}
+    for period in periods:
+        try:
+            with os.scandir(os.path.join(base_dir, period)) as entries:
+                date_dirs = [entry for entry in entries if entry.name in wanted and entry.is_dir()]
+        except OSError:
+            continue
+        for entry in date_dirs:
+            try:
+                with os.scandir(entry.path) as files:
+                    names = {item.name for item in files if not item.is_symlink() or os.path.exists(item.path)}
+            except OSError:
+                continue
+            listings[(period, entry.name)] = names
+    return listings
+
+
+def _incomplete_errors(report_dir: Path, stored: dict[str, str | None], date: str) -> list[str]:
+    """The errors ``validate_report_dir`` reports for a directory that lacks some artifacts, without loading it."""
+    resolved = report_dir.resolve()
+    errors = []
+    for key, name in artifact_names(date).items():
+        if stored[key] is None:
+            errors.append(f"Missing required file: {resolved / name}.")
+        elif not codec_available(codec_of(resolved / stored[key])):
+            errors.append(
+                f"Cannot read {resolved / stored[key]}: zstd support requires Python 3.14+ or the zstandard package."
+            )
+    return errors
+
+
+def check_report_targets(
+    periods: Iterable[str],
+    dates: Iterable[str],
+    allow_small_source: bool = False,
+    use_cache: bool = True,
+    html_backend: str | None = None,
+    timer: PhaseTimer | None = None,
+    check: Callable[[str, str], tuple[int, dict[str, object]] | None] | None = None,
+    budget: ValidationBudget | None = None,
+) -> Iterator[tuple[int, dict[str, object]]]:
+    """Gate results for every ``(period, date)`` target, period by period, in the given order.
+
+    Each result equals ``check_existing_report(period, date, ...)``. The tree
+    is listed once (``scan_report_tree``): a target without its HTML report is
+    ``missing`` and one with only some artifacts is ``existing_invalid``, both
+    answered from the listing alone. Only targets with all four artifacts go
+    through ``check`` (when given and not ``None``) or ``check_existing_report``.
+    """
+    from pathlib import Path
+
+    periods, dates = list(dict.fromkeys(periods)), list(dict.fromkeys(dates))
+    base_dir = Path.home() / OUTPUT_ROOT_NAME
+    listings = scan_report_tree(str(base_dir), periods, dates)
+    for period in periods:
+        for date in dates:
+            names = listings.get((period, date), set())
+            stored = {
+                key: next((variant for variant in stored_variants(name) if variant in names), None)
+                for key, name in artifact_names(date).items()
+            }
+            if all(stored[key] is not None for key in ARTIFACT_KEYS):
+                reply = check(period, date) if check is not None else None
+                if reply is None:
+                    reply = check_existing_report(
+                        period, date, allow_small_source, use_cache, html_backend, timer, budget
+                    )
+                yield reply
+                continue
+
+            report_dir = base_dir / period / date
+            payload: dict[str, object] = {"period": period, "date": date, "base_dir": str(base_dir)}
+            payload["report_dir"] = str(report_dir)
+            for key, name in artifact_names(date).items():
+                payload[key] = str(report_dir / (stored[key] or name))
+            if stored["html_file"] is None:
+                payload["status"] = "missing"
+                payload["action"] = "generate"
+                yield 10, payload
+            else:
+                payload["status"] = "existing_invalid"
+                payload["action"] = "regenerate"
+                payload["errors"] = _incomplete_errors(report_dir, stored, date)
+                yield 20, payload
+
+
+def _date_range(spec: str) -> list[str]:
+    import datetime
+
+    start_text, sep, end_text = spec.partition("..")
+    if not sep:
+        raise ValueError(f"expected START..END, got {spec!r}")
+    start = datetime.date.fromisoformat(start_text)
+    end = datetime.date.fromisoformat(end_text)
+    if end < start:
+        raise ValueError(f"END {end_text} is before START {start_text}")
+    return [(start + datetime.timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)]
+
+
+def _check_many(
+    args: argparse.Namespace, dates: list[str], html_backend: str, budget: ValidationBudget | None
+) -> int:
+    """Range/multi-period mode of ``main``: JSON lines plus a summary line, or one aggregated object."""
+    import json
+    from pathlib import Path
+
+    from phase_timing import PhaseTimer, run_profiled
+
+    timer = PhaseTimer() if args.profile else None
+    check = None
+    if args.use_daemon and not (args.profile or args.profile_output or budget is not None):
+        import validator_client
+
+        def check(period: str, date: str) -> tuple[int, dict[str, object]] | None:
+            return validator_client.check_existing_report(
+                period=period, date=date, use_cache=not args.no_cache, html_backend=html_backend
+            )
+
+    results = check_report_targets(
+        args.period,
+        dates,
+        allow_small_source=args.allow_small_source,
+        use_cache=not args.no_cache,
+        html_backend=html_backend,
+        timer=timer,
+        check=check,
+        budget=budget,
+    )
+    if args.profile_output:
+        results = iter(run_profiled(lambda: list(results), args.profile_output))
+
+    stream = args.output != "aggregate"
+    payloads = []
+    status_counts: dict[str, int] = {}
+    actions: dict[str, list[str]] = {"generate": [], "regenerate": []}
+    worst_exit_code = 0
+    for exit_code, payload in results:
+        worst_exit_code = max(worst_exit_code, exit_code)
+        status = str(payload["status"])
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if payload["action"] in actions:
+            actions[str(payload["action"])].append(f"{payload['period']}/{payload['date']}")
+        if stream:
+            print(json.dumps(payload, ensure_ascii=False), flush=True)
+        else:
+            payloads.append(payload)
+    summary = {
+        "base_dir": str(Path.home() / OUTPUT_ROOT_NAME),
+        "total": sum(status_counts.values()),
+        "status_counts": status_counts,
+        **actions,
+    }
+    if timer is not None:
+        print(json.dumps({"profile": timer.as_dict()}), file=sys.stderr)
+    if stream:
+        print(json.dumps({"summary": summary}))
+    else:
+        print(json.dumps({"summary": summary, "targets": payloads}, ensure_ascii=False))
+    return worst_exit_code
 
 
 def main() -> int:
+    import argparse
+    import json
+
+    from html_backends import BACKENDS, HTML_BACKEND_ENV, resolve_backend
+    from validation_budget import add_budget_arguments, make_budget
+
     parser = argparse.ArgumentParser(description="Check whether a report already exists and is valid.")
-    parser.add_argument("--period", required=True, choices=sorted(PERIODS))
-    parser.add_argument("--date", required=True, help="Date in YYYY-MM-DD")
+    parser.add_argument(
+        "--period",
+        required=True,
+        action="append",
+        choices=sorted(PERIODS),
+        help="Report period; repeat to check several periods in one run.",
+    )
+    dates = parser.add_mutually_exclusive_group(required=True)
+    dates.add_argument("--date", help="Date in YYYY-MM-DD")
+    dates.add_argument(
+        "--date-range",
+        default=None,
+        metavar="START..END",
+        help="Check every date from START to END (YYYY-MM-DD, inclusive).",
+    )
+    parser.add_argument(
+        "--output",
+        choices=["jsonl", "aggregate"],
+        default=None,
+        help=(
+            "Report every target: one JSON line each plus a summary line (jsonl), or one JSON object (aggregate). "
+            "Default for several targets: jsonl."
+        ),
+    )
     parser.add_argument(
         "--allow-small-source",
         action="store_true",
         help="Deprecated no-op flag kept for backward compatibility.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always revalidate; neither read nor write the per-directory validation cache.",
+    )
+    parser.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Ask the resident validator (validator_daemon.py) first; validate in-process if it is not running.",
+    )
+    parser.add_argument(
+        "--html-backend",
+        choices=["auto", *BACKENDS],
+        default=None,
+        help=f"HTML tokenizer (default: ${HTML_BACKEND_ENV} or auto = stdlib; lxml and selectolax are opt-in).",
+    )
+    add_budget_arguments(parser, "always checks in-process; only valid results are cached")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase wall/CPU time and bytes as JSON to stderr (always checks in-process).",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Run under cProfile and write the pstats dump to this path (always checks in-process).",
+    )
     args = parser.parse_args()
+    try:
+        html_backend = resolve_backend(args.html_backend)
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.date_range is not None:
+        try:
+            dates = _date_range(args.date_range)
+        except ValueError as exc:
+            parser.error(f"--date-range: {exc}")
+    else:
+        dates = [args.date]
+    budget = None
+    if args.guarded:
+        try:
+            budget = make_budget(args.check_seconds, args.max_artifact_bytes)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if len(args.period) > 1 or args.date_range is not None or args.output is not None:
+        return _check_many(args, dates, html_backend, budget)
 
-    exit_code, payload = check_existing_report(
-        period=args.period,
-        date=args.date,
-        allow_small_source=args.allow_small_source,
-    )
+    from phase_timing import PhaseTimer, run_profiled
+
+    in_process_only = args.profile or bool(args.profile_output) or budget is not None
+    timer = PhaseTimer() if args.profile else None
+    reply = None
+    if args.use_daemon and not in_process_only:
+        import validator_client
+
+        reply = validator_client.check_existing_report(
+            period=args.period[0],
+            date=args.date,
+            use_cache=not args.no_cache,
+            html_backend=html_backend,
+        )
+    if reply is None:
+        reply = run_profiled(
+            lambda: check_existing_report(
+                period=args.period[0],
+                date=args.date,
+                allow_small_source=args.allow_small_source,
+                use_cache=not args.no_cache,
+                html_backend=html_backend,
+                timer=timer,
+                budget=budget,
+            ),
+            args.profile_output,
+        )
+    if timer is not None:
+        print(json.dumps({"profile": timer.as_dict()}), file=sys.stderr)
+    exit_code, payload = reply
     print(json.dumps(payload, ensure_ascii=False))
     return exit_code
 
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Compress finished, valid report directories under ~/.github_trending in place.
+
+For each ``<period>/<date>`` directory at least ``--min-age-days`` old whose
+report passes the existing-report gate, each selected artifact (by default
+only ``original_trending.html``, by far the largest) is replaced by
+``<name>.gz`` (or ``<name>.zst`` with ``--codec zstd``). The compressed file is
+decompressed and compared byte for byte before the original is removed, and
+the gate is run again afterwards so its cached result matches the new files.
+The validator and the gate read compressed artifacts transparently.
+
+Streams one JSON line per directory, followed by a summary line. Exit code is
+1 if any directory could not be compacted, else 0.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+from artifact_io import (
+    CODEC_SUFFIXES,
+    codec_available,
+    codec_of,
+    compress_file,
+    open_artifact_binary,
+    stored_variants,
+)
+from audit_reports import discover_report_dirs
+from check_existing_report import build_paths, check_existing_report
+from report_layout import ARTIFACT_KEYS, OUTPUT_ROOT_NAME, PERIODS
+
+DEFAULT_ARTIFACTS = ("source_file",)
+DEFAULT_MIN_AGE_DAYS = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _content_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open_artifact_binary(path) as handle:
+        while chunk := handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compact_artifact(path: Path, codec: str) -> Path:
+    """Replace plain ``path`` by its verified compressed copy and return the new file."""
+    suffix = CODEC_SUFFIXES[codec]
+    target = path.with_name(path.name + suffix)
+    # Keeps the codec suffix last, so reading it back decompresses.
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp{suffix}")
+    try:
+        compress_file(path, temp_path, codec)
+        if _content_sha256(temp_path) != _content_sha256(path):
+            raise OSError(f"compressed copy of {path} does not match the original")
+        os.replace(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+    # Stale variants are shadowed by the plain file now, but would win once it is gone.
+    for variant in stored_variants(str(path))[1:]:
+        if variant != str(target):
+            Path(variant).unlink(missing_ok=True)
+    path.unlink()
+    return target
+
+
+def _restore(compressed: Path) -> None:
+    plain = compressed.with_name(compressed.name[: -len(CODEC_SUFFIXES[codec_of(compressed)])])
+    with open_artifact_binary(compressed) as reader:
+        plain.write_bytes(reader.read())
+    compressed.unlink()
+
+
+def compact_report(
+    period: str, date: str, codec: str = "gzip", artifacts: tuple[str, ...] = DEFAULT_ARTIFACTS
+) -> dict[str, object]:
+    """Compact one report directory; the ``status`` is compacted, already_compact, missing, invalid or error."""
+    exit_code, _ = check_existing_report(period=period, date=date)
+    payload: dict[str, object] = {"period": period, "date": date}
+    if exit_code != 0:
+        payload["status"] = "missing" if exit_code == 10 else "invalid"
+        return payload
+
+    paths = build_paths(period, date)
+    pending = [paths[key] for key in artifacts if codec_of(paths[key]) is None]
+    payload["bytes_before"] = sum(paths[key].stat().st_size for key in ARTIFACT_KEYS)
+    if not pending:
+        payload["status"] = "already_compact"
+        payload["bytes_after"] = payload["bytes_before"]
+        return payload
+
+    compacted = []
+    try:
+        for path in pending:
+            compacted.append(compact_artifact(path, codec))
+    except (OSError, EOFError) as exc:
+        payload["status"] = "error"
+        payload["error"] = str(exc)
+    else:
+        # Refreshes the gate cache for the new file names; never expected to fail after the byte comparison.
+        exit_code, gate_payload = check_existing_report(period=period, date=date)
+        if exit_code == 0:
+            payload["status"] = "compacted"
+        else:
+            payload["status"] = "error"
+            payload["error"] = f"report no longer valid after compaction: {gate_payload.get('errors')}"
+    if payload["status"] == "error":
+        for compressed in compacted:
+            _restore(compressed)
+    paths = build_paths(period, date)
+    payload["bytes_after"] = sum(paths[key].stat().st_size for key in ARTIFACT_KEYS)
+    return payload
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compress finished, valid report directories in place.")
+    parser.add_argument(
+        "--period",
+        action="append",
+        choices=sorted(PERIODS),
+        help="Restrict compaction to this period (repeatable; default: all periods).",
+    )
+    parser.add_argument("--codec", choices=sorted(CODEC_SUFFIXES), default="gzip", help="Compression (default: gzip).")
+    parser.add_argument(
+        "--artifact",
+        action="append",
+        choices=ARTIFACT_KEYS,
+        help="Artifact to compress (repeatable; default: source_file). "
+        "Step 3 sends HTML_FILE as is, so only compress html_file in reports that were already sent.",
+    )
+    parser.add_argument(
+        "--min-age-days",
+        type=int,
+        default=DEFAULT_MIN_AGE_DAYS,
+        help=f"Skip reports dated within this many days of today (default: {DEFAULT_MIN_AGE_DAYS}).",
+    )
+    args = parser.parse_args()
+    if args.min_age_days < 0:
+        parser.error("--min-age-days must be >= 0")
+    if not codec_available(args.codec):
+        parser.error("--codec zstd requires Python 3.14+ or the zstandard package")
+
+    started = time.perf_counter()
+    base_dir = Path.home() / OUTPUT_ROOT_NAME
+    cutoff = (datetime.date.today() - datetime.timedelta(days=args.min_age_days)).isoformat()
+    artifacts = tuple(dict.fromkeys(args.artifact or DEFAULT_ARTIFACTS))
+
+    status_counts: Counter[str] = Counter()
+    totals = {"bytes_before": 0, "bytes_after": 0}
+    targets = discover_report_dirs(base_dir, set(args.period) if args.period else None)
+    for period, date in targets:
+        if date > cutoff:
+            payload: dict[str, object] = {"period": period, "date": date, "status": "recent"}
+        else:
+            payload = compact_report(period, date, args.codec, artifacts)
+        status_counts[str(payload["status"])] += 1
+        for key in totals:
+            totals[key] += int(payload.get(key, 0))
+        print(json.dumps(payload, ensure_ascii=False), flush=True)
+
+    summary = {
+        "base_dir": str(base_dir),
+        "total": len(targets),
+        "status_counts": dict(sorted(status_counts.items())),
+        **totals,
+        "wall_time_seconds": round(time.perf_counter() - started, 3),
+    }
+    print(json.dumps({"summary": summary}, ensure_ascii=False))
+    return 1 if status_counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,350 @@
+"""Pluggable HTML tokenizers for the validator's extraction handlers.
+
+``TrendingSourceParser`` and ``HtmlReportParser`` hold all extraction logic in
+``handle_starttag``/``handle_endtag``/``handle_data``. The ``stdlib`` backend
+feeds them through ``html.parser`` as before; the optional backends drive the
+same methods from a C tokenizer:
+
+- ``lxml``: libxml2 SAX-style target parser, fed incrementally.
+- ``selectolax``: lexbor HTML5 parser; the finished tree is walked in document order.
+
+Both optional backends build a repaired tree: they close ``<p>`` before a list
+opens and synthesize ``<body>``, and report no source positions. The ``<p><ul>``
+and body-backtick checks therefore cannot come from their events; callers use
+``RawStructureScanner`` on the raw text for them instead. Repair also moves or
+closes elements on malformed markup (a missing ``</div>`` merges two cards
+under ``html.parser`` but not under lxml), so on such input their cards and
+verdicts can differ from ``stdlib``.
+
+Selection: an explicit name, else ``$GITHUB_TRENDING_HTML_BACKEND``, else ``auto``,
+which is ``stdlib``: the verdict must not depend on which packages are installed.
+The optional backends are opt-in.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Protocol
+
+HTML_BACKEND_ENV = "GITHUB_TRENDING_HTML_BACKEND"
+BACKENDS = ("stdlib", "lxml", "selectolax")
+AUTO_BACKEND = "stdlib"
+# Backends that call the handlers while input is still being fed (lexbor parses on close).
+INCREMENTAL_BACKENDS = ("stdlib", "lxml")
+
+_availability: dict[str, bool] = {"stdlib": True}
+
+
+class TagHandler(Protocol):
+    def feed(self, data: str) -> None: ...
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None: ...
+
+    def handle_endtag(self, tag: str) -> None: ...
+
+    def handle_data(self, data: str) -> None: ...
+
+
+def backend_available(name: str) -> bool:
+    if name not in _availability:
+        try:
+            if name == "lxml":
+                import lxml.etree  # noqa: F401
+            elif name == "selectolax":
+                import selectolax.lexbor  # noqa: F401
+            else:
+                raise ImportError(name)
+            _availability[name] = True
+        except ImportError:
+            _availability[name] = False
+    return _availability[name]
+
+
+def available_backends() -> list[str]:
+    return [name for name in BACKENDS if backend_available(name)]
+
+
+def resolve_backend(name: str | None = None) -> str:
+    """Map a requested backend (or the environment default) to an installed one."""
+    requested = name or os.environ.get(HTML_BACKEND_ENV) or "auto"
+    if requested == "auto":
+        return AUTO_BACKEND
+    if requested not in BACKENDS:
+        raise ValueError(f"Unknown HTML backend: {requested}. Expected one of {['auto', *BACKENDS]}.")
+    if not backend_available(requested):
+        raise ValueError(f"HTML backend '{requested}' is not installed.")
+    return requested
+
+
+class _StdlibFeeder:
+    def __init__(self, handler: TagHandler) -> None:
+        self._handler = handler
+
+    def feed(self, chunk: str) -> None:
+        self._handler.feed(chunk)
+
+    def close(self) -> None:
+        # The validator never called HTMLParser.close(); keep trailing-data handling identical.
+        pass
+
+
+class _LxmlTarget:
+    def __init__(self, handler: TagHandler) -> None:
+        self._handle_starttag = handler.handle_starttag
+        # Bound methods as target callbacks: lxml calls them directly, no extra frame.
+        self.end = handler.handle_endtag
+        self.data = handler.handle_data
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        self._handle_starttag(tag, list(attrib.items()))
+
+    def close(self) -> None:
+        return None
+
+
+class _LxmlFeeder:
+    def __init__(self, handler: TagHandler) -> None:
+        from lxml import etree
+
+        self._errors = (etree.XMLSyntaxError, etree.ParserError)
+        self._parser = etree.HTMLParser(target=_LxmlTarget(handler))
+
+    def feed(self, chunk: str) -> None:
+        self._parser.feed(chunk)
+
+    def close(self) -> None:
+        try:
+            self._parser.close()
+        except self._errors:
+            # Empty or unrecoverable input: the stdlib parser yields no events either.
+            pass
+
+
+class _SelectolaxFeeder:
+    def __init__(self, handler: TagHandler) -> None:
+        self._handler = handler
+        self._parts: list[str] = []
+
+    def feed(self, chunk: str) -> None:
+        self._parts.append(chunk)
+
+    def close(self) -> None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        text = "".join(self._parts)
+        self._parts = []
+        if not text.strip():
+            return
+        handler = self._handler
+        root = LexborHTMLParser(text).root
+        if root is None:
+            return
+        # Iterative pre-order walk; a plain tag name on the stack marks where its end tag is due.
+        stack: list = [root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                handler.handle_endtag(node)
+                continue
+            tag = node.tag
+            if tag == "-text":
+                handler.handle_data(node.text(deep=False))
+                continue
+            if tag.startswith("-") or tag == "!doctype":
+                continue
+            handler.handle_starttag(tag, list(node.attributes.items()))
+            stack.append(tag)
+            stack.extend(reversed(list(node.iter(include_text=True))))
+
+
+def make_feeder(handler: TagHandler, backend: str) -> _StdlibFeeder | _LxmlFeeder | _SelectolaxFeeder:
+    """Return an object with ``feed(chunk)``/``close()`` that drives ``handler`` via ``backend``."""
+    if backend == "lxml":
+        return _LxmlFeeder(handler)
+    if backend == "selectolax":
+        return _SelectolaxFeeder(handler)
+    return _StdlibFeeder(handler)
+
+
+def text_position(base: tuple[int, int], text: str, index: int, begin: int = 0) -> tuple[int, int]:
+    """``(line, column)`` of ``text[index]`` when ``text[begin]`` is at ``base``, counted like ``HTMLParser.getpos()``.
+
+    Scans only ``text[begin:index]``: step ``begin`` along to locate many indexes in one text in linear time.
+    """
+    line, column = base
+    newlines = text.count("\n", begin, index)
+    if newlines:
+        return line + newlines, index - text.rfind("\n", begin, index) - 1
+    return line, column + index - begin
+
+
+class BodyScope:
+    """Position of the first backtick inside ``<body>``.
+
+    The body runs from the end of the first ``<body>`` start tag to the start of
+    the last ``</body>`` end tag; a document without both is checked as a whole.
+    """
+
+    def __init__(self) -> None:
+        self.first_backtick: tuple[int, int] | None = None
+        self.first_backtick_after_open: tuple[int, int] | None = None
+        self.open_end: tuple[int, int] | None = None
+        self.close_start: tuple[int, int] | None = None
+
+    def body_opened(self, end: tuple[int, int]) -> None:
+        if self.open_end is None:
+            self.open_end = end
+
+    def body_closed(self, start: tuple[int, int]) -> None:
+        if self.open_end is not None:
+            self.close_start = start
+
+    @property
+    def backtick_pos(self) -> tuple[int, int] | None:
+        if self.open_end is None or self.close_start is None:
+            return self.first_backtick
+        found = self.first_backtick_after_open
+        return found if found is not None and found < self.close_start else None
+
+
+class RawStructureScanner:
+    """Raw-text counterpart of the structure checks in ``HtmlReportParser``.
+
+    lxml and lexbor repair ``<p><ul>`` and synthesize a missing ``<body>`` before
+    emitting events, so for those backends the nesting and body-scope checks read
+    the raw text. Tags are recognized outside comments and script/style content,
+    as ``html.parser`` does; every ``<p>`` increments and every ``</p>``
+    decrements the paragraph depth. Accepts input in chunks; only an unfinished
+    tag or comment is carried over.
+    """
+
+    # Together these match <(/?)([a-zA-Z][^\s/>]*)(?:[^>"']|"[^"]*"|'[^']*')*> -- see _match_tag.
+    _TAG_NAME_RE = re.compile(r"<(/?)([a-zA-Z][^\s/>]*)")
+    _TAG_REST_RE = re.compile(r"""(?:[^>"']|"[^"]*"|'[^']*')*>""")
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._searched = 0  # Leading characters of the buffer already searched for the end of its tag or comment.
+        self._base = (1, 0)
+        self._raw_end: re.Pattern[str] | None = None
+        self._p_depth = 0
+        self.list_in_p_pos: tuple[int, int] | None = None
+        self.body_scope = BodyScope()
+
+    def feed(self, chunk: str) -> None:
+        text = self._buffer + chunk
+        base = self._base
+        scope = self.body_scope
+        if "`" in chunk:
+            offset = len(self._buffer)
+            if scope.first_backtick is None:
+                scope.first_backtick = text_position(base, text, text.index("`", offset))
+            # The carried-over buffer was already searched when the body opened in an earlier chunk.
+            if scope.open_end is not None and scope.first_backtick_after_open is None:
+                scope.first_backtick_after_open = text_position(base, text, text.index("`", offset))
+
+        # An unfinished tag or comment is carried over at the start of the buffer; only the new text can end it.
+        searched, self._searched = self._searched, 0
+        body_close = None  # Only the last </body> counts; locating each one would rescan the text.
+        pos = 0
+        while True:
+            if self._raw_end is not None:
+                end = self._raw_end.search(text, pos)
+                if end is None:
+                    pos = max(pos, len(text) - len(self._raw_end.pattern))
+                    break
+                pos = end.end()
+                self._raw_end = None
+                continue
+
+            lt = text.find("<", pos)
+            if lt < 0:
+                pos = len(text)
+                break
+            resume = searched if lt == 0 else 0
+            if text.startswith("<!--", lt):
+                end = text.find("-->", max(lt + 4, resume - 2))
+                if end < 0:
+                    pos = lt
+                    self._searched = len(text) - lt
+                    break
+                pos = end + 3
+                continue
+            if text.find(">", max(lt, resume)) < 0:
+                pos = lt
+                self._searched = len(text) - lt
+                break
+            match = self._match_tag(text, lt)
+            if match is None:
+                pos = lt + 1
+                continue
+
+            closing, name, pos = match
+            name = name.lower()
+            if closing:
+                if name == "p" and self._p_depth > 0:
+                    self._p_depth -= 1
+                elif name == "body" and scope.open_end is not None:
+                    body_close = lt
+            elif name == "p":
+                if text[pos - 2] != "/":
+                    self._p_depth += 1
+            elif name in ("ul", "ol"):
+                if self._p_depth > 0 and self.list_in_p_pos is None:
+                    self.list_in_p_pos = text_position(base, text, lt)
+            elif name == "body" and scope.open_end is None:
+                scope.body_opened(text_position(base, text, pos))
+                backtick = text.find("`", pos)
+                if backtick >= 0:
+                    scope.first_backtick_after_open = text_position(base, text, backtick)
+            elif name in ("script", "style"):
+                self._raw_end = re.compile(f"</{name}", re.IGNORECASE)
+        if body_close is not None:
+            scope.body_closed(text_position(base, text, body_close))
+        self._buffer = text[pos:]
+        self._base = text_position(base, text, pos)
+
+    @classmethod
+    def _match_tag(cls, text: str, lt: int) -> tuple[str, str, int] | None:
+        """``(closing, name, end)`` of the tag the combined regex matches at ``lt``, or ``None``.
+
+        The regex backtracks into the name when the attributes fail, once per
+        shorter name and each time rescanning the rest: quadratic or worse on
+        an unclosed ``<a<a<a...``. The rest scan is deterministic, and where a
+        name split at ``k`` leaves it at the name's end depends only on the quote
+        (if any) open there. So the rest is matched at most three times, and the
+        longest name whose quote state lets it reach ``>`` wins, as with the regex.
+        """
+        head = cls._TAG_NAME_RE.match(text, lt)
+        if head is None:
+            return None
+        closing, name = head.groups()
+        start, end = head.start(2), head.end()
+        rest = cls._TAG_REST_RE.match(text, end)
+        if rest is not None:
+            return closing, name, rest.end()
+        if '"' not in name and "'" not in name:
+            return None
+
+        # states[k - start]: the quote open at ``end`` when the rest scan starts at k ("" for none).
+        states = [""] * (end - start + 1)
+        next_quote = {'"': end, "'": end}
+        for k in range(end - 1, start, -1):
+            char = text[k]
+            if char in next_quote:
+                closing_quote = next_quote[char]
+                states[k - start] = char if closing_quote == end else states[closing_quote + 1 - start]
+                next_quote[char] = k
+            else:
+                states[k - start] = states[k + 1 - start]
+        outcomes: dict[str, int | None] = {"": None}
+        for k in range(end - 1, start, -1):
+            state = states[k - start]
+            if state not in outcomes:
+                closing_quote = text.find(state, end)
+                rest = cls._TAG_REST_RE.match(text, closing_quote + 1) if closing_quote >= 0 else None
+                outcomes[state] = rest.end() if rest is not None else None
+            if outcomes[state] is not None:
+                return closing, text[start:k], outcomes[state]
+        return None
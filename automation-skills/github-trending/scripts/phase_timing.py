@@ -0,0 +1,103 @@
+"""Per-phase wall time, CPU time and bytes processed, for ``--profile``.
+
+Validation code wraps each phase in ``phase(name, *paths)``. With a
+``PhaseTimer`` that records into ``timer.phases`` (the sizes of ``paths`` are
+the phase's bytes); without one, ``untimed`` is a shared no-op context, so the
+default path allocates nothing and never calls a clock.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Callable, ContextManager
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    bytes: int = 0
+
+
+class _Untimed:
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_UNTIMED = _Untimed()
+
+
+def untimed(name: str, *paths: Path) -> ContextManager[None]:
+    return _UNTIMED
+
+
+class _TimedPhase:
+    def __init__(self, stats: PhaseStats, paths: tuple[Path, ...]) -> None:
+        self._stats = stats
+        self._paths = paths
+
+    def __enter__(self) -> None:
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stats.wall_seconds += time.perf_counter() - self._wall
+        self._stats.cpu_seconds += time.process_time() - self._cpu
+        for path in self._paths:
+            try:
+                self._stats.bytes += os.stat(path).st_size
+            except OSError:
+                pass
+
+
+class PhaseTimer:
+    """Accumulates ``PhaseStats`` per phase name; a repeated name adds to the same entry."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, PhaseStats] = {}
+
+    def phase(self, name: str, *paths: Path) -> ContextManager[None]:
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        return _TimedPhase(stats, paths)
+
+    def as_dict(self) -> dict[str, object]:
+        return {
+            "phases": {
+                name: {
+                    "wall_ms": round(stats.wall_seconds * 1000, 3),
+                    "cpu_ms": round(stats.cpu_seconds * 1000, 3),
+                    "bytes": stats.bytes,
+                }
+                for name, stats in self.phases.items()
+            },
+            "total_wall_ms": round(sum(stats.wall_seconds for stats in self.phases.values()) * 1000, 3),
+            "total_cpu_ms": round(sum(stats.cpu_seconds for stats in self.phases.values()) * 1000, 3),
+        }
+
+
+def phase_context(timer: PhaseTimer | None) -> Callable[..., ContextManager[None]]:
+    return timer.phase if timer is not None else untimed
+
+
+def run_profiled(func: Callable[[], object], profile_output: str | None) -> object:
+    """Call ``func``; with ``profile_output``, under cProfile, writing a pstats dump there."""
+    if not profile_output:
+        return func()
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func)
+    finally:
+        profiler.dump_stats(profile_output)
@@ -0,0 +1,152 @@
+"""Minimal edit script between two repo lists.
+
+``diff_repos(expected, actual)`` returns the edits that turn ``expected`` (the
+source page order) into ``actual`` (a report's order): ``delete`` for a repo
+missing from ``actual``, ``insert`` for an extra one, and ``move`` for a repo
+in both lists that is out of place. Everything else is a longest common
+subsequence, so the number of inserts plus deletes (a move counts as one of
+each) is minimal. Ranks are 1-based, like the report headings.
+
+The common subsequence comes from Myers' O(ND) algorithm after trimming the
+common prefix and suffix, which is near-linear for similar lists. Past
+``MYERS_MAX_EDITS`` edits it switches to Hunt-Szymanski (longest increasing
+subsequence of the matching positions), which is equally exact and runs in
+O((N + R) log N) for R matching pairs: about N log N for repo lists, which
+rarely repeat a repo.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass
+
+MYERS_MAX_EDITS = 64
+
+
+@dataclass(frozen=True)
+class RepoEdit:
+    op: str  # "delete", "insert" or "move"
+    repo: str
+    expected_rank: int | None  # None for "insert"
+    actual_rank: int | None  # None for "delete"
+
+    def as_dict(self) -> dict[str, object]:
+        return asdict(self)
+
+    def describe(self) -> str:
+        if self.op == "move":
+            return f"{self.repo} #{self.expected_rank}->#{self.actual_rank}"
+        return f"{self.repo} #{self.expected_rank if self.op == 'delete' else self.actual_rank}"
+
+
+def _myers_matches(a: list[str], b: list[str], max_edits: int) -> list[tuple[int, int]] | None:
+    """Index pairs of a longest common subsequence, or ``None`` if it takes more than ``max_edits`` edits."""
+    n, m = len(a), len(b)
+    frontier = {1: 0}  # diagonal k = x - y -> furthest x reached
+    trace: list[dict[int, int]] = []
+    for edits in range(min(max_edits, n + m) + 1):
+        trace.append(frontier.copy())
+        for k in range(-edits, edits + 1, 2):
+            if k == -edits or (k != edits and frontier[k - 1] < frontier[k + 1]):
+                x = frontier[k + 1]
+            else:
+                x = frontier[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            frontier[k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, n, m)
+    return None
+
+
+def _myers_backtrack(trace: list[dict[int, int]], x: int, y: int) -> list[tuple[int, int]]:
+    matches = []
+    for edits in range(len(trace) - 1, 0, -1):
+        frontier, k = trace[edits], x - y
+        prev_k = k + 1 if k == -edits or (k != edits and frontier[k - 1] < frontier[k + 1]) else k - 1
+        prev_x = frontier[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x, y = x - 1, y - 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    while x > 0 and y > 0:
+        x, y = x - 1, y - 1
+        matches.append((x, y))
+    matches.reverse()
+    return matches
+
+
+def _lis_matches(a: list[str], b: list[str]) -> list[tuple[int, int]]:
+    """Index pairs of a longest common subsequence, via Hunt-Szymanski."""
+    positions: dict[str, list[int]] = defaultdict(list)
+    for j, item in enumerate(b):
+        positions[item].append(j)
+    tails: list[int] = []  # tails[length - 1]: smallest b index ending a common subsequence of that length
+    ends: list[tuple[int, int, tuple | None]] = []  # the (i, j, previous) chain behind each tail
+    for i, item in enumerate(a):
+        # Descending j, so one a item never extends a chain that already uses it.
+        for j in reversed(positions.get(item, ())):
+            length = bisect_left(tails, j)
+            node = (i, j, ends[length - 1] if length else None)
+            if length == len(tails):
+                tails.append(j)
+                ends.append(node)
+            else:
+                tails[length] = j
+                ends[length] = node
+    matches = []
+    node = ends[-1] if ends else None
+    while node is not None:
+        matches.append((node[0], node[1]))
+        node = node[2]
+    matches.reverse()
+    return matches
+
+
+def common_subsequence(expected: list[str], actual: list[str]) -> list[tuple[int, int]]:
+    """``(expected_index, actual_index)`` pairs of a longest common subsequence, in order."""
+    prefix = 0
+    limit = min(len(expected), len(actual))
+    while prefix < limit and expected[prefix] == actual[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and expected[-1 - suffix] == actual[-1 - suffix]:
+        suffix += 1
+    a = expected[prefix : len(expected) - suffix]
+    b = actual[prefix : len(actual) - suffix]
+
+    middle = _myers_matches(a, b, MYERS_MAX_EDITS) if a and b else []
+    if middle is None:
+        middle = _lis_matches(a, b)
+    matches = [(index, index) for index in range(prefix)]
+    matches += [(i + prefix, j + prefix) for i, j in middle]
+    shift = len(actual) - len(expected)
+    matches += [(index, index + shift) for index in range(len(expected) - suffix, len(expected))]
+    return matches
+
+
+def diff_repos(expected: list[str], actual: list[str]) -> list[RepoEdit]:
+    """Edit script from ``expected`` to ``actual``: deletes and moves in expected order, then inserts."""
+    matches = common_subsequence(expected, actual)
+    matched_expected = {i for i, _ in matches}
+    matched_actual = {j for _, j in matches}
+    inserted: dict[str, deque[int]] = defaultdict(deque)
+    for j, repo in enumerate(actual):
+        if j not in matched_actual:
+            inserted[repo].append(j)
+
+    edits = []
+    for i, repo in enumerate(expected):
+        if i in matched_expected:
+            continue
+        if inserted.get(repo):
+            edits.append(RepoEdit("move", repo, i + 1, inserted[repo].popleft() + 1))
+        else:
+            edits.append(RepoEdit("delete", repo, i + 1, None))
+    insertions = sorted((j, repo) for repo, indexes in inserted.items() for j in indexes)
+    edits += [RepoEdit("insert", repo, None, j + 1) for j, repo in insertions]
+    return edits
@@ -0,0 +1,18 @@
+"""Report directory layout shared by the gate, the validator and their clients.
+
+Kept free of imports so the gate can answer the "missing" outcome without
+loading pathlib, argparse or the validator.
+"""
+
+PERIODS = {"daily", "weekly", "monthly"}
+OUTPUT_ROOT_NAME = ".github_trending"
+ARTIFACT_KEYS = ("source_file", "md_file", "html_file", "manifest_file")
+
+
+def artifact_names(date: str) -> dict[str, str]:
+    return {
+        "source_file": "original_trending.html",
+        "md_file": f"report_{date}.md",
+        "html_file": f"report_{date}.html",
+        "manifest_file": "report_manifest.json",
+    }
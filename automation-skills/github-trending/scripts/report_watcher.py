@@ -0,0 +1,163 @@
+"""Watch a report directory and call back once its artifacts stop changing.
+
+``InotifyWatcher`` uses Linux inotify through libc (ctypes, no extra package);
+``PollingWatcher`` compares ``os.stat`` size/mtime of the watched files and is
+used wherever inotify is unavailable, e.g. macOS or a report directory that
+does not exist yet. Both only report events for the watched file names, so
+temp files and the validator's own state files are ignored.
+
+``watch`` runs the callback once at start, then after every burst of writes:
+it waits until no event arrived for ``debounce`` seconds and the files' stat
+signature differs from the one last validated.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import struct
+import time
+from pathlib import Path
+from typing import Callable
+
+DEFAULT_DEBOUNCE = 0.2
+DEFAULT_POLL_INTERVAL = 0.25
+
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+# Events that are not about one named file: report them as a change of everything.
+_DIRECTORY_EVENTS = _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_Q_OVERFLOW | _IN_IGNORED
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def stat_signature(paths: list[Path]) -> tuple[tuple[int, int] | None, ...]:
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            signature.append(None)
+        else:
+            signature.append((stat.st_size, stat.st_mtime_ns))
+    return tuple(signature)
+
+
+class PollingWatcher:
+    kind = "polling"
+
+    def __init__(self, paths: list[Path], interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        self._paths = paths
+        self._interval = interval
+        self._seen = stat_signature(paths)
+
+    def wait(self, timeout: float | None) -> bool:
+        """Block until a watched file changes (``True``) or ``timeout`` seconds pass (``False``)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = stat_signature(self._paths)
+            if current != self._seen:
+                self._seen = current
+                return True
+            if deadline is None:
+                time.sleep(self._interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self._interval, remaining))
+
+    def close(self) -> None:
+        return None
+
+
+class InotifyWatcher:
+    kind = "inotify"
+
+    def __init__(self, directory: Path, names: set[str]) -> None:
+        """Raise ``OSError`` when inotify is unavailable or ``directory`` cannot be watched."""
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._names = {name.encode() for name in names}
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"cannot watch {directory}")
+
+    def wait(self, timeout: float | None) -> bool:
+        """Block until a watched file changes (``True``) or ``timeout`` seconds pass (``False``)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                return False
+            if self._relevant(os.read(self._fd, 64 * 1024)):
+                return True
+
+    def _relevant(self, data: bytes) -> bool:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, mask, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + name_len].rstrip(b"\0")
+            offset += name_len
+            if mask & _DIRECTORY_EVENTS or name in self._names:
+                return True
+        return False
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def make_watcher(
+    directory: Path, paths: list[Path], poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> InotifyWatcher | PollingWatcher:
+    try:
+        return InotifyWatcher(directory, {path.name for path in paths})
+    except OSError:
+        return PollingWatcher(paths, poll_interval)
+
+
+def watch(
+    watcher: InotifyWatcher | PollingWatcher,
+    paths: list[Path],
+    on_change: Callable[[], None],
+    debounce: float = DEFAULT_DEBOUNCE,
+    max_runs: int | None = None,
+) -> None:
+    """Call ``on_change`` now and after every settled change of ``paths``; return after ``max_runs`` calls."""
+    # Taken before each call, so a write that lands during the callback triggers another run.
+    validated = stat_signature(paths)
+    on_change()
+    runs = 1
+    while max_runs is None or runs < max_runs:
+        watcher.wait(None)
+        # Debounce: a burst of writes is one change once it has been quiet for ``debounce`` seconds.
+        while watcher.wait(debounce):
+            pass
+        current = stat_signature(paths)
+        if current == validated:
+            continue
+        validated = current
+        on_change()
+        runs += 1
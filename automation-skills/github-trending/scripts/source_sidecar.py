@@ -0,0 +1,68 @@
+"""Extracted repo list of the trending page, cached next to it.
+
+Extracting the repo list is the most expensive parse of a validation. The
+validator stores its result in ``original_trending.repos.json`` together with
+the SHA-256 of the stored source file and the extractor version (validator
+sources plus HTML backend); a later run whose hash and version both match
+reads the list from there instead of tokenizing the page.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from validation_cache import file_sha256, validator_fingerprint, write_json_atomically
+
+SIDECAR_NAME = "original_trending.repos.json"
+SIDECAR_FORMAT_VERSION = 1
+
+
+def sidecar_file(source_file: Path) -> Path:
+    return source_file.parent / SIDECAR_NAME
+
+
+@lru_cache(maxsize=None)
+def extractor_version(backend: str) -> str:
+    # Backends can disagree on malformed markup, so the backend is part of the version.
+    return f"{validator_fingerprint()}/{backend}"
+
+
+def source_digest(source_file: Path) -> str:
+    """Hash the source before parsing it, so a concurrent rewrite is never stored as the parsed content."""
+    return file_sha256(source_file)
+
+
+def load_sidecar(source_file: Path, backend: str, digest: str) -> tuple[list[str], bool] | None:
+    """``(repos, has_content)`` if the sidecar was written for this content and extractor, else ``None``."""
+    try:
+        data = json.loads(sidecar_file(source_file).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if (data.get("format"), data.get("extractor"), data.get("source_sha256")) != (
+        SIDECAR_FORMAT_VERSION,
+        extractor_version(backend),
+        digest,
+    ):
+        return None
+    repos, has_content = data.get("repos"), data.get("has_content")
+    if not isinstance(repos, list) or not all(isinstance(repo, str) for repo in repos):
+        return None
+    if not isinstance(has_content, bool):
+        return None
+    return repos, has_content
+
+
+def store_sidecar(source_file: Path, backend: str, digest: str, repos: list[str], has_content: bool) -> None:
+    """Atomically write the sidecar; a read-only report directory is silently skipped."""
+    data = {
+        "format": SIDECAR_FORMAT_VERSION,
+        "extractor": extractor_version(backend),
+        "source_sha256": digest,
+        "has_content": has_content,
+        "repos": repos,
+    }
+    write_json_atomically(sidecar_file(source_file), data, separators=(",", ":"))
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""SQLite index of every report_manifest.json under ~/.github_trending.
+
+``ingest`` walks ``<period>/<date>/report_manifest.json`` and stores one row
+per ranked repo in ``entries(period, date, rank, repo)``. A manifest whose size
+and mtime match the indexed copy is skipped without being read; a rewritten
+one is re-read, and its rows are replaced only if its content changed. Rows of
+deleted report directories are removed. Queries read only the index.
+
+Usage:
+    python3 trending_index.py ingest
+    python3 trending_index.py days owner/repo --period daily --since 2026-01-01 --until 2026-03-31
+    python3 trending_index.py new --period daily --since 2026-02-10
+    python3 trending_index.py history owner/repo [--period weekly]
+
+Query commands ingest first unless ``--no-ingest`` is given, and print JSON.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+from artifact_io import READ_ERRORS, read_artifact_bytes, resolve_artifact
+from report_layout import OUTPUT_ROOT_NAME, PERIODS
+from validate_report import DATE_RE, MANIFEST_PARSE_ERRORS
+
+INDEX_FILE_NAME = "trending_index.sqlite3"
+SCHEMA_VERSION = 1
+MANIFEST_NAME = "report_manifest.json"
+
+SCHEMA = """
+CREATE TABLE manifests (
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    PRIMARY KEY (period, date)
+) WITHOUT ROWID;
+CREATE TABLE entries (
+    period TEXT NOT NULL,
+    date TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    repo TEXT NOT NULL,
+    PRIMARY KEY (period, date, rank, repo)
+) WITHOUT ROWID;
+CREATE INDEX entries_by_repo ON entries (repo, period, date);
+"""
+
+
+def default_index_path() -> Path:
+    return Path.home() / OUTPUT_ROOT_NAME / INDEX_FILE_NAME
+
+
+def open_index(db_path: Path | None = None) -> sqlite3.Connection:
+    """Open (creating or rebuilding on a schema change) the index database."""
+    db_path = db_path or default_index_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS entries")
+            conn.execute("DROP TABLE IF EXISTS manifests")
+            conn.executescript(SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+def manifest_rows(manifest: object) -> list[tuple[int, str]]:
+    """``(rank, repo)`` pairs of a manifest, skipping malformed items as the validator would flag them."""
+    repos = manifest.get("repos") if isinstance(manifest, dict) else None
+    if not isinstance(repos, list):
+        return []
+    rows = set()
+    for item in repos:
+        if isinstance(item, dict) and isinstance(item.get("rank"), int) and isinstance(item.get("repo"), str):
+            rows.add((item["rank"], item["repo"]))
+    return sorted(rows)
+
+
+def _manifest_paths(base_dir: Path, periods: set[str] | None) -> dict[tuple[str, str], Path]:
+    found: dict[tuple[str, str], Path] = {}
+    for period in sorted(periods or PERIODS):
+        try:
+            entries = list(os.scandir(base_dir / period))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            if entry.is_dir() and DATE_RE.fullmatch(entry.name):
+                found[(period, entry.name)] = resolve_artifact(Path(entry.path) / MANIFEST_NAME)
+    return found
+
+
+def ingest(conn: sqlite3.Connection, base_dir: Path | None = None, periods: set[str] | None = None) -> dict[str, int]:
+    """Bring the index up to date with the manifests under ``base_dir``; return per-outcome counts."""
+    base_dir = base_dir or Path.home() / OUTPUT_ROOT_NAME
+    counts = {"indexed": 0, "unchanged": 0, "removed": 0, "unreadable": 0}
+    known = {
+        (period, date): (size, mtime_ns, sha256)
+        for period, date, size, mtime_ns, sha256 in conn.execute(
+            "SELECT period, date, size, mtime_ns, sha256 FROM manifests"
+        )
+        if periods is None or period in periods
+    }
+    with conn:
+        for key, path in _manifest_paths(base_dir, periods).items():
+            stored = known.pop(key, None)
+            try:
+                stat = path.stat()
+                if stored is not None and stored[:2] == (stat.st_size, stat.st_mtime_ns):
+                    counts["unchanged"] += 1
+                    continue
+                data = read_artifact_bytes(path)
+            except READ_ERRORS:
+                # No readable manifest (yet): forget any rows indexed for this directory.
+                if stored is not None:
+                    _forget(conn, key)
+                    counts["removed"] += 1
+                continue
+            sha256 = hashlib.sha256(data).hexdigest()
+            conn.execute(
+                "INSERT OR REPLACE INTO manifests VALUES (?, ?, ?, ?, ?)",
+                (*key, stat.st_size, stat.st_mtime_ns, sha256),
+            )
+            if stored is not None and stored[2] == sha256:
+                counts["unchanged"] += 1
+                continue
+            try:
+                rows = manifest_rows(json.loads(data))
+            except MANIFEST_PARSE_ERRORS:
+                rows = []
+                counts["unreadable"] += 1
+            else:
+                counts["indexed"] += 1
+            conn.execute("DELETE FROM entries WHERE period = ? AND date = ?", key)
+            conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?)", [(*key, rank, repo) for rank, repo in rows])
+        for key in known:
+            _forget(conn, key)
+            counts["removed"] += 1
+    return counts
+
+
+def _forget(conn: sqlite3.Connection, key: tuple[str, str]) -> None:
+    conn.execute("DELETE FROM entries WHERE period = ? AND date = ?", key)
+    conn.execute("DELETE FROM manifests WHERE period = ? AND date = ?", key)
+
+
+def repo_history(conn: sqlite3.Connection, repo: str, period: str | None = None) -> list[dict[str, object]]:
+    """Every ``(period, date, rank)`` at which ``repo`` appeared, oldest first."""
+    sql = "SELECT period, date, rank FROM entries WHERE repo = ?"
+    params: list[object] = [repo]
+    if period:
+        sql += " AND period = ?"
+        params.append(period)
+    rows = conn.execute(sql + " ORDER BY date, period", params)
+    return [{"period": row[0], "date": row[1], "rank": row[2]} for row in rows]
+
+
+def trending_days(
+    conn: sqlite3.Connection, repo: str, period: str = "daily", since: str | None = None, until: str | None = None
+) -> int:
+    """Number of ``period`` reports (dates) between ``since`` and ``until`` inclusive that list ``repo``."""
+    (count,) = conn.execute(
+        "SELECT COUNT(DISTINCT date) FROM entries WHERE repo = ? AND period = ? AND date BETWEEN ? AND ?",
+        (repo, period, since or "0000-00-00", until or "9999-99-99"),
+    ).fetchone()
+    return count
+
+
+def new_repos(
+    conn: sqlite3.Connection, period: str, since: str, until: str | None = None
+) -> list[dict[str, object]]:
+    """Repos whose first ``period`` appearance falls between ``since`` and ``until``, by first date then rank."""
+    rows = conn.execute(
+        """
+        SELECT repo, MIN(date) AS first_date, MIN(rank) AS best_rank, COUNT(DISTINCT date) AS days
+        FROM entries AS current
+        WHERE period = ? AND date BETWEEN ? AND ?
+          AND NOT EXISTS (
+            SELECT 1 FROM entries AS earlier
+            WHERE earlier.repo = current.repo AND earlier.period = current.period AND earlier.date < ?
+          )
+        GROUP BY repo
+        ORDER BY first_date, best_rank, repo
+        """,
+        (period, since, until or "9999-99-99", since),
+    )
+    return [{"repo": row[0], "first_date": row[1], "best_rank": row[2], "days": row[3]} for row in rows]
+
+
+def _date_arg(value: str) -> str:
+    if not DATE_RE.fullmatch(value):
+        raise argparse.ArgumentTypeError(f"invalid date: {value} (expected YYYY-MM-DD)")
+    return value
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Index report manifests in SQLite and query trending history.")
+    parser.add_argument("--db", default=None, help=f"Index database (default: ~/{OUTPUT_ROOT_NAME}/{INDEX_FILE_NAME}).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("ingest", help="Index new and changed manifests; drop deleted ones.")
+    days = commands.add_parser("days", help="Count the reports of a period that list a repo.")
+    days.add_argument("repo", help="owner/repo")
+    days.add_argument("--period", choices=sorted(PERIODS), default="daily")
+    days.add_argument("--since", type=_date_arg, default=None, help="First date, inclusive (YYYY-MM-DD).")
+    days.add_argument("--until", type=_date_arg, default=None, help="Last date, inclusive (YYYY-MM-DD).")
+    new = commands.add_parser("new", help="Repos that first appeared in a period's reports on or after a date.")
+    new.add_argument("--period", choices=sorted(PERIODS), default="daily")
+    new.add_argument("--since", type=_date_arg, required=True, help="First date, inclusive (YYYY-MM-DD).")
+    new.add_argument("--until", type=_date_arg, default=None, help="Last date, inclusive (YYYY-MM-DD).")
+    history = commands.add_parser("history", help="Every report that listed a repo, with its rank.")
+    history.add_argument("repo", help="owner/repo")
+    history.add_argument("--period", choices=sorted(PERIODS), default=None)
+    for command in (days, new, history):
+        command.add_argument("--no-ingest", action="store_true", help="Query the index as it is, without ingesting.")
+    args = parser.parse_args()
+
+    conn = open_index(Path(args.db).expanduser() if args.db else None)
+    try:
+        if args.command == "ingest" or not args.no_ingest:
+            counts = ingest(conn)
+            if args.command == "ingest":
+                print(json.dumps(counts))
+                return 0
+        if args.command == "days":
+            reply: dict[str, object] = {
+                "repo": args.repo,
+                "period": args.period,
+                "since": args.since,
+                "until": args.until,
+                "days": trending_days(conn, args.repo, args.period, args.since, args.until),
+            }
+        elif args.command == "new":
+            reply = {
+                "period": args.period,
+                "since": args.since,
+                "until": args.until,
+                "repos": new_repos(conn, args.period, args.since, args.until),
+            }
+        else:
+            reply = {"repo": args.repo, "history": repo_history(conn, args.repo, args.period)}
+    finally:
+        conn.close()
+    print(json.dumps(reply, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,29 +3,111 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import io
 import json
+import mmap
+import os
 import re
 import sys
 from dataclasses import dataclass, field
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Callable, ContextManager, Iterable, Iterator
+
+from artifact_io import (
+    READ_ERRORS,
+    ArtifactReadError,
+    codec_available,
+    codec_of,
+    open_artifact_text,
+    read_artifact_text,
+    read_error,
+    resolve_artifact,
+    stored_variants,
+)
+from html_backends import (
+    BACKENDS,
+    HTML_BACKEND_ENV,
+    INCREMENTAL_BACKENDS,
+    BodyScope,
+    RawStructureScanner,
+    make_feeder,
+    resolve_backend,
+    text_position,
+)
+from phase_timing import PhaseStats, PhaseTimer, phase_context, run_profiled
+from repo_diff import RepoEdit, diff_repos
+from report_layout import ARTIFACT_KEYS, OUTPUT_ROOT_NAME, PERIODS, artifact_names
+from validation_budget import CheckFailed, CheckRunner, ValidationBudget, add_budget_arguments, make_budget
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    from validation_state import MemoryState
 
-PERIODS = {"daily", "weekly", "monthly"}
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 REPO_RE = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
 GITHUB_URL_RE = re.compile(r"^https://github\.com/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)/?$")
-OUTPUT_ROOT_NAME = ".github_trending"
 
 REQUIRED_MD_FIELDS = ["是什么", "作用", "效果", "项目分析", "建议"]
 REQUIRED_HTML_LABELS = {"是什么", "作用", "效果", "项目分析"}
 REQUIRED_HTML_CLASSES = {"overview-section", "repo-card", "tag", "suggestion-box"}
+MARKDOWN_SECTION_HEADINGS = ["## 📊 概述与趋势分析", "## 🚀 热门项目详细分析"]
+# Derived once at import instead of for every scanned report.
+MD_FIELD_INDEX = {name: idx for idx, name in enumerate(REQUIRED_MD_FIELDS)}
+MD_FIELD_ORDER = " -> ".join(REQUIRED_MD_FIELDS)
+SORTED_HTML_CLASSES = sorted(REQUIRED_HTML_CLASSES)
+
+H2_FALLBACK_RE = re.compile(
+    r"<h2[^>]*>\s*<a[^>]*href=\"/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)\"",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+# H2_FALLBACK_RE split at the end of the <h2 ...> tag; see iter_h2_fallback_matches.
+H2_START_RE = re.compile(r"<h2", flags=re.IGNORECASE)
+H2_LINK_RE = re.compile(
+    r"\s*<a[^>]*href=\"/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)\"",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+CARD_RANK_RE = re.compile(r"^(\d+)\.")
+# json.loads raises JSONDecodeError, UnicodeDecodeError for bytes that are not UTF-8, ValueError for an
+# integer over the int digit limit and RecursionError for nesting too deep; all are a manifest error.
+MANIFEST_PARSE_ERRORS = (ValueError, RecursionError)
+MARKDOWN_HEADING_RE = re.compile(
+    r"^###\s+(\d+)\.\s+\[([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)\]\((https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+/?)\)$"
+)
+STREAM_CHUNK_SIZE = 64 * 1024
+BOX_ROW_MARKER = "Box-row"
+VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+)
+# --incremental: the artifacts each node depends on. A stored node is reused while they are unchanged.
+CHECK_GRAPH = {
+    "source": ("source_file",),
+    "markdown": ("md_file",),
+    "html": ("html_file",),
+    "manifest": ("manifest_file",),
+    "cross_file": ("source_file", "md_file", "html_file", "manifest_file"),
+}
+# --fail-fast stages, cheapest first; each one reads and parses only its own artifact.
+FAIL_FAST_CHECKS = {
+    "manifest": "manifest JSON, fields and reported_item_count",
+    "markdown": "Markdown report structure and repo order vs manifest",
+    "html": "HTML report structure, cards and repo order vs manifest",
+    "source": "trending page extraction and source vs report comparison",
+}
 
 
 @dataclass
 class ValidationResult:
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    # Filled only when validate_report_dir runs with a PhaseTimer.
+    phases: dict[str, PhaseStats] = field(default_factory=dict)
+    # FAIL_FAST_CHECKS stages not run because an earlier one failed (fail_fast=True only).
+    skipped: list[str] = field(default_factory=list)
+    # Edit script from the source repo order to each mismatching artifact ("markdown", "html", "manifest").
+    repo_diffs: dict[str, list[dict[str, object]]] = field(default_factory=dict)
 
     def error(self, message: str) -> None:
         self.errors.append(message)
@@ -51,19 +133,36 @@ class HtmlCard:
 
 
 class TrendingSourceParser(HTMLParser):
-    """Extract repo links from GitHub Trending source page."""
+    """Extract repo links from GitHub Trending source page.
+
+    ``list_closed`` turns true when the element that contains the first
+    ``Box-row`` article ends, i.e. the trending list is over; see
+    ``parse_source_chunks`` for how callers use it to stop early. A stray end
+    tag between rows looks the same, so ``row_after_close`` records a
+    ``Box-row`` article that starts after it: the list was not over.
+    """
 
     def __init__(self) -> None:
         super().__init__()
         self._article_depth = 0
         self._seen_in_article = False
         self.repos: list[str] = []
+        self.list_closed = False
+        self.row_after_close = False
+        self._list_stack: list[str] | None = None
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         attrs_map = dict(attrs)
         class_attr = attrs_map.get("class") or ""
 
-        if tag == "article" and "Box-row" in class_attr:
+        if tag == "article" and BOX_ROW_MARKER in class_attr and self._list_stack is None:
+            self._list_stack = []
+        if self._list_stack is not None and tag not in VOID_ELEMENTS:
+            self._list_stack.append(tag)
+
+        if tag == "article" and BOX_ROW_MARKER in class_attr:
+            if self.list_closed:
+                self.row_after_close = True
             if self._article_depth == 0:
                 self._seen_in_article = False
             self._article_depth += 1
@@ -80,13 +179,77 @@ class TrendingSourceParser(HTMLParser):
                 self._seen_in_article = True
 
     def handle_endtag(self, tag: str) -> None:
+        stack = self._list_stack
+        if stack is not None and not self.list_closed and tag not in VOID_ELEMENTS:
+            if tag in stack:
+                while stack.pop() != tag:
+                    pass
+            elif self._article_depth == 0:
+                # An element opened before the first Box-row article ends: the list container.
+                self.list_closed = True
+
         if tag == "article" and self._article_depth > 0:
             self._article_depth -= 1
             if self._article_depth == 0:
                 self._seen_in_article = False
 
 
+def parse_source_chunks(
+    chunks: Iterable[str],
+    backend: str,
+    shortcuts: bool = True,
+    rest_has_marker: Callable[[str], bool] | None = None,
+) -> list[str] | None:
+    """Run ``TrendingSourceParser`` over ``chunks`` and return the raw repo list.
+
+    With ``shortcuts`` (for ``INCREMENTAL_BACKENDS``) the page is only tokenized
+    until the list container closes; the rest is merely searched for another
+    ``Box-row``.
+    ``rest_has_marker(tail)``, if given, replaces that search: it is called once
+    the list has closed, with the unsearched end of the last chunk, and must
+    answer for everything ``chunks`` has not yielded yet (see ``MappedSourcePage``).
+    Returns ``None`` when a shortcut cannot vouch for an identical result; the
+    caller then parses again without them.
+    """
+    parser = TrendingSourceParser()
+    feeder = make_feeder(parser, backend)
+    tail = ""
+    for chunk in chunks:
+        if shortcuts and parser.list_closed:
+            window = tail + chunk
+            if BOX_ROW_MARKER in window:
+                return None
+            tail = window[1 - len(BOX_ROW_MARKER) :]
+            continue
+        feeder.feed(chunk)
+        if shortcuts and parser.list_closed:
+            if parser.row_after_close:
+                # The rest of that row may lie in chunks that would no longer be fed.
+                return None
+            # An unfinished tag at the end of this chunk has not reached the handlers yet.
+            lt = chunk.rfind("<")
+            tail = chunk[min(lt, len(chunk) - len(BOX_ROW_MARKER)) :] if lt >= 0 else chunk[1 - len(BOX_ROW_MARKER) :]
+            if rest_has_marker is not None:
+                if rest_has_marker(tail):
+                    return None
+                break
+    feeder.close()
+    return parser.repos
+
+
+def iter_text_slices(text: str, size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    for start in range(0, len(text), size):
+        yield text[start : start + size]
+
+
 class HtmlReportParser(HTMLParser):
+    """Collects cards and runs the structure checks in a single tokenizer pass.
+
+    Check positions are ``(line, column)`` as reported by ``getpos()``. Raw
+    backticks are located in ``feed`` and resolved against the ``<body>`` scope
+    once the parser has tokenized past them.
+    """
+
     def __init__(self) -> None:
         super().__init__()
         self.cards: list[HtmlCard] = []
@@ -96,7 +259,10 @@ class HtmlReportParser(HTMLParser):
         self._card_depth = 0
         self._current_card: HtmlCard | None = None
         self._p_depth = 0
-        self.invalid_list_inside_p = False
+        self.list_in_p_pos: tuple[int, int] | None = None
+        self.body_scope = BodyScope()
+        self._fed_pos = (1, 0)
+        self._pending_backticks: list[tuple[int, int]] = []
 
         self._inside_repo_title = False
         self._repo_title_depth = 0
@@ -108,6 +274,45 @@ class HtmlReportParser(HTMLParser):
         self._inside_h2 = False
         self._h2_parts: list[str] = []
 
+    @property
+    def invalid_list_inside_p(self) -> bool:
+        return self.list_in_p_pos is not None
+
+    @property
+    def body_backtick_pos(self) -> tuple[int, int] | None:
+        return self.body_scope.backtick_pos
+
+    def feed(self, data: str) -> None:
+        start = self._fed_pos
+        self._fed_pos = text_position(start, data, len(data))
+        if "`" in data:
+            scope = self.body_scope
+            index = data.find("`")
+            if scope.first_backtick is None:
+                scope.first_backtick = text_position(start, data, index)
+            if scope.first_backtick_after_open is None:
+                pos, located = start, 0
+                while index >= 0:
+                    pos, located = text_position(pos, data, index, located), index
+                    self._pending_backticks.append(pos)
+                    index = data.find("`", index + 1)
+        super().feed(data)
+        if self._pending_backticks:
+            self._resolve_backticks()
+
+    def _resolve_backticks(self) -> None:
+        scope = self.body_scope
+        if scope.open_end is not None:
+            if scope.first_backtick_after_open is None:
+                scope.first_backtick_after_open = next(
+                    (pos for pos in self._pending_backticks if pos >= scope.open_end), None
+                )
+            self._pending_backticks = []
+        else:
+            # <body> cannot start before the unparsed remainder, so earlier backticks never count as body text.
+            parsed_to = self.getpos()
+            self._pending_backticks = [pos for pos in self._pending_backticks if pos >= parsed_to]
+
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
         attrs_map = dict(attrs)
         class_attr = attrs_map.get("class") or ""
@@ -120,8 +325,11 @@ class HtmlReportParser(HTMLParser):
             self._h2_parts = []
         if tag == "p":
             self._p_depth += 1
-        if tag in {"ul", "ol"} and self._p_depth > 0:
-            self.invalid_list_inside_p = True
+        if tag in {"ul", "ol"} and self._p_depth > 0 and self.list_in_p_pos is None:
+            self.list_in_p_pos = self.getpos()
+        if tag == "body" and self.body_scope.open_end is None:
+            tag_text = self.get_starttag_text() or ""
+            self.body_scope.body_opened(text_position(self.getpos(), tag_text, len(tag_text)))
 
         if tag == "div":
             if "repo-card" in classes:
@@ -168,6 +376,8 @@ class HtmlReportParser(HTMLParser):
             self._h2_parts = []
         if tag == "p" and self._p_depth > 0:
             self._p_depth -= 1
+        if tag == "body":
+            self.body_scope.body_closed(self.getpos())
 
         if tag == "span" and self._inside_label and self._current_card:
             label = normalize_label("".join(self._label_parts))
@@ -179,9 +389,9 @@ class HtmlReportParser(HTMLParser):
         if tag == "div" and self._card_depth > 0:
             if self._inside_repo_title and self._card_depth == self._repo_title_depth and self._current_card:
                 title = "".join(self._repo_title_parts).strip()
-                match = re.match(r"^(\d+)\.", title)
+                match = CARD_RANK_RE.match(title)
                 if match:
-                    self._current_card.rank = int(match.group(1))
+                    self._current_card.rank = parse_rank(match.group(1))
                 self._inside_repo_title = False
                 self._repo_title_parts = []
 
@@ -191,6 +401,14 @@ class HtmlReportParser(HTMLParser):
                 self._current_card = None
 
 
+def parse_rank(digits: str) -> int:
+    """``int(digits)``, or 0 (never a valid rank) for a number past the int digit limit."""
+    try:
+        return int(digits)
+    except ValueError:
+        return 0
+
+
 def normalize_label(label: str) -> str:
     return label.strip().strip(":：").strip()
 
@@ -224,11 +442,13 @@ def dedupe_in_order(values: Iterable[str]) -> list[str]:
     return result
 
 
-def describe_repo_diff(expected: list[str], actual: list[str]) -> str:
-    expected_set = set(expected)
-    actual_set = set(actual)
-    missing = [repo for repo in expected if repo not in actual_set]
-    extra = [repo for repo in actual if repo not in expected_set]
+def describe_repo_diff(expected: list[str], actual: list[str], edits: list[RepoEdit] | None = None) -> str:
+    """First mismatch plus the minimal edit script (``repo_diff.diff_repos``) from ``expected`` to ``actual``."""
+    if edits is None:
+        edits = diff_repos(expected, actual)
+    missing = [edit.repo for edit in edits if edit.op == "delete"]
+    extra = [edit.repo for edit in edits if edit.op == "insert"]
+    moved = [edit.describe() for edit in edits if edit.op == "move"]
 
     first_mismatch = None
     for idx, (exp, got) in enumerate(zip(expected, actual), start=1):
@@ -249,22 +469,23 @@ def describe_repo_diff(expected: list[str], actual: list[str]) -> str:
         parts.append(f"missing={missing}")
     if extra:
         parts.append(f"extra={extra}")
+    if moved:
+        parts.append(f"moved={moved}")
     return "; ".join(parts) if parts else "unknown difference"
 
 
-def extract_source_repos(source_html: str) -> list[str]:
-    parser = TrendingSourceParser()
-    parser.feed(source_html)
-    repos = dedupe_in_order(parser.repos)
+def extract_source_repos(source_html: str, backend: str | None = None) -> list[str]:
+    backend = resolve_backend(backend)
+    box_row_repos = None
+    if backend in INCREMENTAL_BACKENDS:
+        box_row_repos = parse_source_chunks(iter_text_slices(source_html), backend)
+    if box_row_repos is None:
+        box_row_repos = parse_source_chunks([source_html], backend, shortcuts=False)
+    repos = dedupe_in_order(box_row_repos)
     if repos:
         return repos
 
-    fallback_h2 = re.findall(
-        r"<h2[^>]*>\s*<a[^>]*href=\"/([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)\"",
-        source_html,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
-    repos = dedupe_in_order(fallback_h2)
+    repos = dedupe_in_order(repo for _, _, repo in iter_h2_fallback_matches(source_html))
     if repos:
         return repos
 
@@ -273,63 +494,422 @@ def extract_source_repos(source_html: str) -> list[str]:
     return []
 
 
-def parse_markdown_entries(md_text: str, result: ValidationResult) -> list[MarkdownEntry]:
-    heading_pattern = re.compile(
-        r"^###\s+(\d+)\.\s+\[([A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+)\]\((https://github\.com/[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+/?)\)$"
-    )
+def iter_text_chunks(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Yield file text in fixed-size chunks, decoded exactly like ``read_text``; compressed files are streamed."""
+    try:
+        with open_artifact_text(path) as handle:
+            while True:
+                chunk = handle.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    except READ_ERRORS as exc:
+        raise read_error(path, exc) from exc
+
+
+def iter_text_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Split streamed text on the same boundaries as ``str.splitlines``."""
+    pending = ""
+    for chunk in chunks:
+        pending += chunk
+        lines = pending.splitlines(keepends=True)
+        pending = ""
+        if lines and (lines[-1].endswith("\r") or lines[-1].splitlines()[0] == lines[-1]):
+            pending = lines.pop()
+        for line in lines:
+            yield line.splitlines()[0]
+    if pending:
+        yield pending
+
+
+def iter_h2_fallback_matches(text: str) -> Iterator[tuple[int, int, str]]:
+    """``(start, end, repo)`` of each ``H2_FALLBACK_RE.finditer(text)`` match, in linear time.
+
+    The regex retries at every ``<h2`` and rescans up to the next ``>`` each
+    time, which is quadratic on ``<h2<h2<h2...``. Every ``<h2`` before one
+    ``>`` ends its tag there, so the link after it decides for all of them.
+    """
+    pos = 0
+    while True:
+        start = H2_START_RE.search(text, pos)
+        if start is None:
+            return
+        gt = text.find(">", start.end())
+        if gt < 0:
+            return
+        link = H2_LINK_RE.match(text, gt + 1)
+        if link is None:
+            pos = gt + 1
+            continue
+        yield start.start(), link.end(), link.group(1)
+        pos = link.end()
+
+
+def iter_h2_fallback_repos(chunks: Iterable[str]) -> Iterator[str]:
+    """Streaming equivalent of ``H2_FALLBACK_RE.findall`` over the concatenated chunks.
+
+    A match attempt starting before the second-to-last ``>`` of the buffer is final:
+    the ``<h2 ...>`` tag and the ``<a ...>`` tag each end at the next ``>``, so more
+    input cannot change its outcome. Everything before that point is dropped.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        last_gt = buffer.rfind(">")
+        settled = buffer.rfind(">", 0, last_gt) if last_gt > 0 else -1
+        if settled < 0:
+            continue
+        consumed = 0
+        for start, end, repo in iter_h2_fallback_matches(buffer):
+            if start >= settled:
+                break
+            consumed = end
+            yield repo
+        buffer = buffer[max(consumed, settled) :]
+    yield from (repo for _, _, repo in iter_h2_fallback_matches(buffer))
+
+
+def extract_source_repos_streaming(
+    source_file: Path,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    backend: str | None = None,
+) -> tuple[list[str], bool]:
+    """Chunked variant of ``extract_source_repos`` that also reports whether the page has content."""
+    backend = resolve_backend(backend)
+    has_content = False
+
+    def content_tracked_chunks() -> Iterator[str]:
+        nonlocal has_content
+        for chunk in iter_text_chunks(source_file, chunk_size):
+            has_content = has_content or bool(chunk.strip())
+            yield chunk
+
+    box_row_repos = parse_source_chunks(content_tracked_chunks(), backend, backend in INCREMENTAL_BACKENDS)
+    if box_row_repos is None:
+        box_row_repos = parse_source_chunks(content_tracked_chunks(), backend, shortcuts=False)
+    repos = dedupe_in_order(box_row_repos)
+    if repos:
+        return repos, has_content
+
+    # Fallback needs a second pass, but only for pages without Box-row articles.
+    repos = dedupe_in_order(iter_h2_fallback_repos(iter_text_chunks(source_file, chunk_size)))
+    return repos, has_content
+
+
+def _dropped_bytes_pattern(text: str) -> re.Pattern[bytes]:
+    # errors="ignore" only ever drops non-ASCII bytes, so they may sit between the characters.
+    return re.compile(b"[\x80-\xff]*".join(re.escape(char.encode()) for char in text))
+
+
+class MappedSourcePage:
+    """A plain source file, memory-mapped and decoded only where the tokenizer needs it.
+
+    ``chunks`` decodes exactly like ``read_text`` (UTF-8, errors ignored,
+    universal newlines) and only cuts right before a ``<`` byte, so the decoded
+    chunks never split a character. The undecoded rest of the page is searched
+    as bytes, with patterns that also allow for bytes the decoder would drop:
+    they may see a match the decoded text does not have, never the reverse.
+    """
+
+    _BOX_ROW_RE = _dropped_bytes_pattern(BOX_ROW_MARKER)
+    _H2_START_RE = re.compile(rb"<[\x80-\xff]*[hH][\x80-\xff]*2")
+    # Anything but whitespace (as ``str.strip`` sees it) or a byte that may be dropped.
+    _CONTENT_RE = re.compile(rb"[^\t\n\x0b\x0c\r\x1c-\x20\x80-\xff]")
+
+    def __init__(self, handle: io.BufferedReader) -> None:
+        size = os.fstat(handle.fileno()).st_size
+        self.buffer: mmap.mmap | bytes = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._decoded_end = 0
+
+    def close(self) -> None:
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")("ignore"), translate=True)
+        size = len(self.buffer)
+        start = 0
+        with memoryview(self.buffer) as view:
+            while start < size:
+                end = self.buffer.find(b"<", start + chunk_size)
+                end = size if end < 0 else end
+                with view[start:end] as piece:
+                    text = decoder.decode(piece, final=end == size)
+                self._decoded_end = start = end
+                if text:
+                    yield text
+
+    def rest_has_box_row(self, tail: str) -> bool:
+        """``parse_source_chunks``'s search for ``Box-row`` in ``tail`` plus every byte not yet decoded."""
+        # The rest starts with "<", so the marker cannot span tail and rest.
+        return BOX_ROW_MARKER in tail or self._BOX_ROW_RE.search(self.buffer, self._decoded_end) is not None
+
+    def has_content(self) -> bool:
+        if self._CONTENT_RE.search(self.buffer):
+            return True
+        return bool("".join(self.chunks()).strip())
+
+    def may_have_h2_fallback(self) -> bool:
+        return self._H2_START_RE.search(self.buffer) is not None
+
+    def parse(self, backend: str, chunk_size: int, shortcuts: bool) -> list[str] | None:
+        chunks = self.chunks(chunk_size)
+        try:
+            return parse_source_chunks(chunks, backend, shortcuts, self.rest_has_box_row if shortcuts else None)
+        finally:
+            # Releases the buffer views before the map is closed.
+            chunks.close()
+
+
+def extract_source_repos_mapped(
+    source_file: Path,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    backend: str | None = None,
+) -> tuple[list[str], bool]:
+    """``extract_source_repos_streaming`` over a memory-mapped, uncompressed source file.
+
+    Never builds the page as one string: the tokenizer gets decoded chunks, the
+    rest of the page after the trending list and the H2 fallback precheck run
+    over the mapped bytes, and only a page with an ``<h2`` is decoded a second time.
+    """
+    backend = resolve_backend(backend)
+    with open(source_file, "rb") as handle:
+        page = MappedSourcePage(handle)
+        try:
+            box_row_repos = page.parse(backend, chunk_size, backend in INCREMENTAL_BACKENDS)
+            if box_row_repos is None:
+                box_row_repos = page.parse(backend, chunk_size, shortcuts=False)
+            repos = dedupe_in_order(box_row_repos)
+            if not repos and page.may_have_h2_fallback():
+                chunks = page.chunks(chunk_size)
+                try:
+                    repos = dedupe_in_order(iter_h2_fallback_repos(chunks))
+                finally:
+                    chunks.close()
+            return repos, page.has_content()
+        finally:
+            page.close()
+
+
+def load_source_repos(
+    source_file: Path,
+    streaming: bool,
+    chunk_size: int,
+    backend: str,
+    sidecar: bool = True,
+) -> tuple[list[str], bool]:
+    """Source repos and whether the page has content, from the ``source_sidecar.py`` file when it matches.
+
+    On a miss the page is parsed (memory-mapped if stored uncompressed, else
+    streamed with ``streaming=True``) and, with ``sidecar=True``, the sidecar
+    is rewritten for the next run. A failed read raises ``ArtifactReadError``.
+    """
+    try:
+        if sidecar:
+            from source_sidecar import load_sidecar, source_digest, store_sidecar
+
+            digest = source_digest(source_file)
+            cached = load_sidecar(source_file, backend, digest)
+            if cached is not None:
+                return cached
+        if codec_of(source_file) is None:
+            repos, has_content = extract_source_repos_mapped(source_file, chunk_size, backend)
+        elif streaming:
+            repos, has_content = extract_source_repos_streaming(source_file, chunk_size, backend)
+        else:
+            source_text = read_artifact_text(source_file)
+            repos, has_content = extract_source_repos(source_text, backend), bool(source_text.strip())
+    except READ_ERRORS as exc:
+        raise read_error(source_file, exc) from exc
+    if sidecar:
+        store_sidecar(source_file, backend, digest, repos, has_content)
+    return repos, has_content
+
+
+class MarkdownScanner:
+    """Single-pass, line-driven Markdown report scanner.
+
+    Each line is looked at once; no per-repo block text is built. It reproduces the
+    regex checks it replaced exactly, including their multi-line behaviour:
+
+    - tags: ``re.search(r"`[^`]+`", <first 4 lines of the block>)``, i.e. two
+      consecutive backticks with at least one character (newlines count) between;
+    - fields: ``re.search(rf"^\\*\\s+\\*\\*{field}\\*\\*:\\s+.+", <block>, re.MULTILINE)``,
+      where ``\\s+`` may span lines: a bare ``*`` line can continue on the next
+      non-blank line, and an empty value matches if any later line of the block is
+      non-empty. Field order is compared by the line the match starts on.
+    """
+
+    TAG_REGION_LINES = 4
+
+    def __init__(self, result: ValidationResult) -> None:
+        self.result = result
+        self.entries: list[MarkdownEntry] = []
+        self.sections_found: set[str] = set()
+        self._field_index = MD_FIELD_INDEX
+        self._start_block()
+
+    def _start_block(self) -> None:
+        self._block_line = 0
+        self._tag_found = False
+        self._tag_gap: int | None = None
+        self._field_lines: list[int | None] = [None] * len(REQUIRED_MD_FIELDS)
+        self._star_line: int | None = None
+        self._awaiting_value: list[tuple[int, int]] = []
+
+    def _record_field(self, field_idx: int, line_no: int) -> None:
+        current = self._field_lines[field_idx]
+        if current is None or line_no < current:
+            self._field_lines[field_idx] = line_no
+
+    def _match_field(self, text: str, start_line: int) -> None:
+        """Match ``**field**:\\s+.+`` at the start of ``text`` for a candidate starting on ``start_line``."""
+        if not text.startswith("**"):
+            return
+        end = text.find("**:", 2)
+        if end < 0:
+            return
+        field_idx = self._field_index.get(text[2:end])
+        if field_idx is None:
+            return
+        value = text[end + 3 :]
+        if len(value) >= 2:
+            if value[0].isspace():
+                self._record_field(field_idx, start_line)
+        elif not value or value.isspace():
+            # ``\s+.+`` must continue over the line break into a later non-empty line.
+            self._awaiting_value.append((field_idx, start_line))
+
+    def _scan_tags(self, line: str, line_no: int) -> None:
+        if self._tag_gap is not None and line_no > 0:
+            self._tag_gap += 1
+        pos = line.find("`")
+        while pos >= 0:
+            if self._tag_gap is not None and self._tag_gap + pos >= 1:
+                self._tag_found = True
+                return
+            self._tag_gap = -pos - 1
+            pos = line.find("`", pos + 1)
+        if self._tag_gap is not None:
+            self._tag_gap += len(line)
+
+    def _finish_block(self) -> None:
+        entry = self.entries[-1]
+        rank, repo = entry.rank, entry.repo
+        if not self._tag_found:
+            self.result.error(f"Markdown repo #{rank} ({repo}) is missing tags line.")
+
+        for field, line_no in zip(REQUIRED_MD_FIELDS, self._field_lines):
+            if line_no is None:
+                self.result.error(f"Markdown repo #{rank} ({repo}) is missing required field: {field}.")
+
+        if all(line_no is not None for line_no in self._field_lines):
+            if self._field_lines != sorted(self._field_lines):
+                self.result.error(
+                    f"Markdown repo #{rank} ({repo}) fields are out of order. Expected: {MD_FIELD_ORDER}."
+                )
 
-    lines = md_text.splitlines()
-    headings: list[tuple[int, int, str, str]] = []
-    for idx, line in enumerate(lines):
-        match = heading_pattern.match(line.strip())
-        if match:
-            headings.append((idx, int(match.group(1)), match.group(2), match.group(3)))
+    def feed_line(self, line: str) -> None:
+        if "#" in line:
+            for heading in MARKDOWN_SECTION_HEADINGS:
+                if heading in line:
+                    self.sections_found.add(heading)
+            match = MARKDOWN_HEADING_RE.match(line.strip()) if "###" in line else None
+            if match:
+                if self.entries:
+                    self._finish_block()
+                self.entries.append(
+                    MarkdownEntry(rank=parse_rank(match.group(1)), repo=match.group(2), url=match.group(3).rstrip("/"))
+                )
+                self._start_block()
+        if not self.entries:
+            return
 
-    if not headings:
-        result.error("Markdown report has no valid repo headings: '### N. [owner/repo](https://github.com/owner/repo)'.")
-        return []
+        line_no = self._block_line
+        self._block_line = line_no + 1
+        if line_no < self.TAG_REGION_LINES and not self._tag_found:
+            self._scan_tags(line, line_no)
+        if not line:
+            return
+
+        if self._awaiting_value:
+            for field_idx, start_line in self._awaiting_value:
+                self._record_field(field_idx, start_line)
+            self._awaiting_value = []
+
+        if self._star_line is not None:
+            stripped = line.lstrip()
+            if stripped:
+                self._match_field(stripped, self._star_line)
+                self._star_line = None
+
+        if line[0] == "*":
+            rest = line[1:]
+            content = rest.lstrip()
+            if not content:
+                self._star_line = line_no
+            elif len(content) < len(rest):
+                self._match_field(content, line_no)
+
+    def close(self) -> list[MarkdownEntry]:
+        if not self.entries:
+            self.result.error(
+                "Markdown report has no valid repo headings: '### N. [owner/repo](https://github.com/owner/repo)'."
+            )
+            return []
+
+        self._finish_block()
+        expected_ranks = list(range(1, len(self.entries) + 1))
+        actual_ranks = [entry.rank for entry in self.entries]
+        if actual_ranks != expected_ranks:
+            self.result.error(f"Markdown ranking must be sequential 1..N, got: {actual_ranks}.")
+        return self.entries
 
-    entries: list[MarkdownEntry] = []
-    for i, (line_idx, rank, repo, url) in enumerate(headings):
-        end = headings[i + 1][0] if i + 1 < len(headings) else len(lines)
-        block = "\n".join(lines[line_idx:end])
-
-        # Require at least one backtick tag line near heading.
-        tag_region = "\n".join(lines[line_idx : min(end, line_idx + 4)])
-        if not re.search(r"`[^`]+`", tag_region):
-            result.error(f"Markdown repo #{rank} ({repo}) is missing tags line.")
-
-        positions = []
-        for field in REQUIRED_MD_FIELDS:
-            field_match = re.search(rf"^\*\s+\*\*{re.escape(field)}\*\*:\s+.+", block, flags=re.MULTILINE)
-            if not field_match:
-                result.error(f"Markdown repo #{rank} ({repo}) is missing required field: {field}.")
-                continue
-            positions.append((field, field_match.start()))
-
-        if len(positions) == len(REQUIRED_MD_FIELDS):
-            ordered = [name for name, _ in sorted(positions, key=lambda x: x[1])]
-            if ordered != REQUIRED_MD_FIELDS:
-                result.error(
-                    f"Markdown repo #{rank} ({repo}) fields are out of order. Expected: {' -> '.join(REQUIRED_MD_FIELDS)}."
-                )
 
-        entries.append(MarkdownEntry(rank=rank, repo=repo, url=url.rstrip("/")))
+def parse_markdown_lines(lines: Iterable[str], result: ValidationResult) -> tuple[list[MarkdownEntry], set[str]]:
+    """Scan Markdown lines once; also returns the ``MARKDOWN_SECTION_HEADINGS`` seen."""
+    scanner = MarkdownScanner(result)
+    for line in lines:
+        scanner.feed_line(line)
+    return scanner.close(), scanner.sections_found
 
-    expected_ranks = list(range(1, len(entries) + 1))
-    actual_ranks = [entry.rank for entry in entries]
-    if actual_ranks != expected_ranks:
-        result.error(f"Markdown ranking must be sequential 1..N, got: {actual_ranks}.")
 
+def parse_markdown_entries(md_text: str, result: ValidationResult) -> list[MarkdownEntry]:
+    entries, _ = parse_markdown_lines(md_text.splitlines(), result)
     return entries
 
 
-def parse_html_cards(html_text: str) -> HtmlReportParser:
+def parse_html_cards(html_text: str, backend: str | None = None) -> HtmlReportParser:
+    return _parse_html_chunks([html_text], resolve_backend(backend))
+
+
+def _parse_html_chunks(chunks: Iterable[str], backend: str) -> HtmlReportParser:
     parser = HtmlReportParser()
-    parser.feed(html_text)
+    if backend == "stdlib":
+        for chunk in chunks:
+            parser.feed(chunk)
+        return parser
+
+    feeder = make_feeder(parser, backend)
+    # Tree-building tokenizers repair <p><ul> and <body> and carry no positions; check the raw text instead.
+    scanner = RawStructureScanner()
+    for chunk in chunks:
+        feeder.feed(chunk)
+        scanner.feed(chunk)
+    feeder.close()
+    parser.list_in_p_pos = scanner.list_in_p_pos
+    parser.body_scope = scanner.body_scope
     return parser
 
 
+def parse_html_file_streaming(
+    html_file: Path,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    backend: str | None = None,
+) -> HtmlReportParser:
+    return _parse_html_chunks(iter_text_chunks(html_file, chunk_size), resolve_backend(backend))
+
+
 def validate_manifest(manifest: dict, period: str, date: str, result: ValidationResult) -> list[dict]:
     required_fields = ["date", "period", "source_item_count", "reported_item_count", "repos"]
     for field in required_fields:
@@ -390,79 +970,45 @@ def validate_manifest(manifest: dict, period: str, date: str, result: Validation
     return normalized_repos
 
 
-def validate_report_dir(
-    report_dir: Path,
-    period: str,
-    date: str,
-    allow_small_source: bool = False,
-) -> ValidationResult:
-    result = ValidationResult()
-
-    if period not in PERIODS:
-        result.error(f"Invalid period: {period}. Expected one of {sorted(PERIODS)}.")
-    if not DATE_RE.fullmatch(date):
-        result.error(f"Invalid date: {date}. Expected YYYY-MM-DD.")
-
-    expected_report_dir = (Path.home() / OUTPUT_ROOT_NAME / period / date).resolve()
-    actual_report_dir = report_dir.expanduser().resolve()
-    if actual_report_dir != expected_report_dir:
-        result.error(
-            "Report directory must be exactly under current user home: "
-            f"expected '{expected_report_dir}', got '{actual_report_dir}'."
-        )
-
-    source_file = actual_report_dir / "original_trending.html"
-    md_file = actual_report_dir / f"report_{date}.md"
-    html_file = actual_report_dir / f"report_{date}.html"
-    manifest_file = actual_report_dir / "report_manifest.json"
-
-    required_files = [source_file, md_file, html_file, manifest_file]
-    for file_path in required_files:
-        if not file_path.exists():
-            result.error(f"Missing required file: {file_path}.")
-
-    if result.errors:
-        return result
+def check_report_structure(
+    markdown_result: ValidationResult,
+    markdown_sections: set[str],
+    html_parser: HtmlReportParser,
+    result: ValidationResult,
+) -> None:
+    """Per-file checks of the Markdown and HTML reports (sections, classes, structure, cards)."""
+    check_markdown_structure(markdown_result, markdown_sections, result)
+    check_html_structure(html_parser, result)
 
-    source_text = source_file.read_text(encoding="utf-8", errors="ignore")
-    if not source_text.strip():
-        result.error("original_trending.html is empty.")
-    md_text = md_file.read_text(encoding="utf-8", errors="ignore")
-    html_text = html_file.read_text(encoding="utf-8", errors="ignore")
 
-    try:
-        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        result.error(f"Manifest JSON parse error: {exc}.")
-        return result
+def check_markdown_structure(
+    markdown_result: ValidationResult,
+    markdown_sections: set[str],
+    result: ValidationResult,
+) -> None:
+    result.errors.extend(markdown_result.errors)
+    for heading in MARKDOWN_SECTION_HEADINGS:
+        if heading not in markdown_sections:
+            result.error(f"Markdown missing section heading: {heading}")
 
-    source_repos = extract_source_repos(source_text)
-    if not source_repos:
-        result.error("Cannot extract repo list from original_trending.html.")
-
-    markdown_entries = parse_markdown_entries(md_text, result)
-
-    if "## 📊 概述与趋势分析" not in md_text:
-        result.error("Markdown missing section heading: ## 📊 概述与趋势分析")
-    if "## 🚀 热门项目详细分析" not in md_text:
-        result.error("Markdown missing section heading: ## 🚀 热门项目详细分析")
 
-    html_parser = parse_html_cards(html_text)
-
-    for required_class in sorted(REQUIRED_HTML_CLASSES):
+def check_html_structure(html_parser: HtmlReportParser, result: ValidationResult) -> None:
+    for required_class in SORTED_HTML_CLASSES:
         if required_class not in html_parser.classes_seen:
             result.error(f"HTML missing required class usage: .{required_class}")
 
     if not html_parser.section_heading_found:
         result.error("HTML missing section heading: 🚀 热门项目详细分析")
 
-    if html_parser.invalid_list_inside_p:
-        result.error("HTML contains invalid nested structure: <p><ul>/<ol>.")
+    if html_parser.list_in_p_pos is not None:
+        line, column = html_parser.list_in_p_pos
+        result.error(f"HTML contains invalid nested structure: <p><ul>/<ol> at line {line}, column {column + 1}.")
 
-    body_match = re.search(r"<body[^>]*>(.*)</body>", html_text, flags=re.IGNORECASE | re.DOTALL)
-    body_text = body_match.group(1) if body_match else html_text
-    if "`" in body_text:
-        result.error("HTML body contains Markdown backticks (`), which is disallowed.")
+    if html_parser.body_backtick_pos is not None:
+        line, column = html_parser.body_backtick_pos
+        result.error(
+            f"HTML body contains Markdown backticks (`), which is disallowed (first at line {line}, column {column + 1})."
+        )
 
     html_cards = html_parser.cards
     html_ranks = [card.rank for card in html_cards]
@@ -483,8 +1029,45 @@ def validate_report_dir(
         if not card.has_suggestion:
             result.error(f"HTML repo-card #{idx} is missing .suggestion-box.")
 
-    manifest_repos = validate_manifest(manifest, period, date, result)
 
+def check_manifest_reported_count(manifest: dict, manifest_repos: list[dict], result: ValidationResult) -> None:
+    reported = manifest.get("reported_item_count") if isinstance(manifest, dict) else None
+    if isinstance(reported, int) and reported != len(manifest_repos):
+        result.error(
+            "Manifest reported_item_count mismatch with repos length: "
+            f"reported={reported}, repos={len(manifest_repos)}."
+        )
+
+
+def check_markdown_against_manifest(
+    markdown_entries: list[MarkdownEntry], manifest_repos: list[dict], result: ValidationResult
+) -> None:
+    if markdown_entries and manifest_repos:
+        md_repos = [entry.repo for entry in markdown_entries]
+        mf_repos = [item["repo"] for item in manifest_repos if isinstance(item.get("repo"), str)]
+        if md_repos != mf_repos:
+            result.error("Markdown repo order/content does not match manifest repos.")
+
+
+def check_html_against_manifest(
+    html_cards: list[HtmlCard], manifest_repos: list[dict], result: ValidationResult
+) -> None:
+    if html_cards and manifest_repos:
+        html_repos = [repo_from_url(card.repo_url or "") for card in html_cards]
+        mf_repos = [item["repo"] for item in manifest_repos if isinstance(item.get("repo"), str)]
+        if html_repos != mf_repos:
+            result.error("HTML repo order/content does not match manifest repos.")
+
+
+def compare_artifacts(
+    source_repos: list[str],
+    markdown_entries: list[MarkdownEntry],
+    html_cards: list[HtmlCard],
+    manifest: dict,
+    manifest_repos: list[dict],
+    result: ValidationResult,
+) -> None:
+    """Cross-file checks: counts and repo order across source, Markdown, HTML and manifest."""
     counts = {
         "source": len(source_repos),
         "markdown": len(markdown_entries),
@@ -503,77 +1086,531 @@ def validate_report_dir(
     if len({counts["source"], counts["markdown"], counts["html"], counts["manifest_repos"]}) > 1:
         result.error(f"Cross-file count mismatch: {counts}.")
 
-    if isinstance(counts["manifest_reported"], int):
-        if counts["manifest_reported"] != counts["manifest_repos"]:
-            result.error(
-                "Manifest reported_item_count mismatch with repos length: "
-                f"reported={counts['manifest_reported']}, repos={counts['manifest_repos']}."
-            )
-
-    if markdown_entries and manifest_repos:
-        md_repos = [entry.repo for entry in markdown_entries]
-        mf_repos = [item["repo"] for item in manifest_repos if isinstance(item.get("repo"), str)]
-        if md_repos != mf_repos:
-            result.error("Markdown repo order/content does not match manifest repos.")
-
-    if html_cards and manifest_repos:
-        html_repos = [repo_from_url(card.repo_url or "") for card in html_cards]
-        mf_repos = [item["repo"] for item in manifest_repos if isinstance(item.get("repo"), str)]
-        if html_repos != mf_repos:
-            result.error("HTML repo order/content does not match manifest repos.")
+    check_manifest_reported_count(manifest, manifest_repos, result)
+    check_markdown_against_manifest(markdown_entries, manifest_repos, result)
+    check_html_against_manifest(html_cards, manifest_repos, result)
 
     # Critical omission check: source repo identities must match each output in order.
+    def check_order(artifact: str, label: str, repos: list[str]) -> None:
+        if repos != source_repos:
+            edits = diff_repos(source_repos, repos)
+            result.repo_diffs[artifact] = [edit.as_dict() for edit in edits]
+            result.error(f"Source vs {label} repo mismatch: " + describe_repo_diff(source_repos, repos, edits))
+
     if source_repos and markdown_entries:
-        md_repos = [entry.repo for entry in markdown_entries]
-        if md_repos != source_repos:
-            result.error(
-                "Source vs Markdown repo mismatch: "
-                + describe_repo_diff(expected=source_repos, actual=md_repos)
-            )
+        check_order("markdown", "Markdown", [entry.repo for entry in markdown_entries])
 
     if source_repos and html_cards:
         html_repos = [repo_from_url(card.repo_url or "") for card in html_cards]
-        normalized_html_repos = [repo for repo in html_repos if repo]
-        if normalized_html_repos != source_repos:
-            result.error(
-                "Source vs HTML repo mismatch: "
-                + describe_repo_diff(expected=source_repos, actual=normalized_html_repos)
-            )
+        check_order("html", "HTML", [repo for repo in html_repos if repo])
 
     if source_repos and manifest_repos:
         mf_repos = [item["repo"] for item in manifest_repos if isinstance(item.get("repo"), str)]
-        if mf_repos != source_repos:
-            result.error(
-                "Source vs Manifest repo mismatch: "
-                + describe_repo_diff(expected=source_repos, actual=mf_repos)
+        check_order("manifest", "Manifest", mf_repos)
+
+
+def validate_report_dir(
+    report_dir: Path,
+    period: str,
+    date: str,
+    allow_small_source: bool = False,
+    streaming: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    html_backend: str | None = None,
+    timer: PhaseTimer | None = None,
+    fail_fast: bool = False,
+    incremental: bool = False,
+    parallel: bool = False,
+    state: MemoryState | None = None,
+    source_sidecar: bool = True,
+    budget: ValidationBudget | None = None,
+) -> ValidationResult:
+    """Validate one report directory.
+
+    With ``streaming=True`` the source page, Markdown and HTML report are fed to
+    their parsers in ``chunk_size`` pieces instead of being read whole, so peak
+    memory does not grow with file size. Both modes report identical errors.
+
+    ``html_backend`` picks the HTML tokenizer (see ``html_backends.py``); every
+    backend reports identical errors.
+
+    With a ``timer``, wall time, CPU time and input bytes of each phase are
+    recorded in ``timer.phases``, which is also ``result.phases``.
+
+    With ``fail_fast=True`` the checks run in ``FAIL_FAST_CHECKS`` order and
+    stop after the first stage that reports an error; later stages are listed
+    in ``result.skipped``. Every error reported is one the exhaustive run
+    reports too, and a report passes in both modes or in neither.
+
+    With ``incremental=True`` the parsed intermediates and per-node errors are
+    kept in ``.validation_state.json`` (``validation_state.py``); the next run
+    re-parses only changed artifacts and re-runs only the ``CHECK_GRAPH`` nodes
+    that depend on them. The errors are identical to a full run. Passing a
+    ``validation_state.MemoryState`` as ``state`` keeps the nodes in memory
+    instead (used by ``--watch``).
+
+    With ``parallel=True`` the source page and HTML report are parsed in a
+    process pool while the manifest and Markdown report are parsed here; the
+    results are joined for the cross-file checks. The errors are identical to
+    a serial run.
+
+    The extracted source repo list is read from, or written to, the sidecar
+    ``original_trending.repos.json`` (``source_sidecar.py``), so an unchanged
+    source page is not parsed again; ``source_sidecar=False`` bypasses it.
+
+    With a ``budget`` (guarded mode, ``validation_budget.py``) each
+    ``CHECK_GRAPH`` node runs in a worker process under a time budget, after
+    its artifact passed a size budget. A check that overruns or raises becomes
+    an error instead of a hang or a crash. The other errors are those of a
+    full run.
+    """
+    if fail_fast and (incremental or parallel):
+        raise ValueError("fail_fast cannot be combined with incremental or parallel.")
+    if budget is not None and (fail_fast or incremental or parallel):
+        raise ValueError("budget cannot be combined with fail_fast, incremental or parallel.")
+    result = ValidationResult()
+    backend = resolve_backend(html_backend)
+    phase = phase_context(timer)
+    if timer is not None:
+        result.phases = timer.phases
+
+    if period not in PERIODS:
+        result.error(f"Invalid period: {period}. Expected one of {sorted(PERIODS)}.")
+    if not DATE_RE.fullmatch(date):
+        result.error(f"Invalid date: {date}. Expected YYYY-MM-DD.")
+
+    expected_report_dir = (Path.home() / OUTPUT_ROOT_NAME / period / date).resolve()
+    actual_report_dir = report_dir.expanduser().resolve()
+    if actual_report_dir != expected_report_dir:
+        result.error(
+            "Report directory must be exactly under current user home: "
+            f"expected '{expected_report_dir}', got '{actual_report_dir}'."
+        )
+
+    # Each artifact may be stored gzip/zstd-compressed (artifact_io.py).
+    source_file = resolve_artifact(actual_report_dir / "original_trending.html")
+    md_file = resolve_artifact(actual_report_dir / f"report_{date}.md")
+    html_file = resolve_artifact(actual_report_dir / f"report_{date}.html")
+    manifest_file = resolve_artifact(actual_report_dir / "report_manifest.json")
+
+    required_files = [source_file, md_file, html_file, manifest_file]
+    for file_path in required_files:
+        if not file_path.exists():
+            result.error(f"Missing required file: {file_path}.")
+        elif not codec_available(codec_of(file_path)):
+            result.error(f"Cannot read {file_path}: zstd support requires Python 3.14+ or the zstandard package.")
+
+    if result.errors:
+        return result
+
+    # A truncated or corrupt compressed artifact fails the report instead of the run.
+    try:
+        if fail_fast:
+            files = (source_file, md_file, html_file, manifest_file)
+            _validate_fail_fast(files, period, date, streaming, chunk_size, backend, phase, result, source_sidecar)
+            return result
+        if budget is not None:
+            paths = dict(zip(ARTIFACT_KEYS, (source_file, md_file, html_file, manifest_file)))
+            _validate_guarded(
+                paths, period, date, streaming, chunk_size, backend, phase, result, source_sidecar, budget
+            )
+            return result
+        if incremental or parallel:
+            paths = dict(zip(ARTIFACT_KEYS, (source_file, md_file, html_file, manifest_file)))
+            _validate_nodes(
+                actual_report_dir,
+                paths,
+                period,
+                date,
+                streaming,
+                chunk_size,
+                backend,
+                phase,
+                result,
+                incremental,
+                parallel,
+                state,
+                source_sidecar,
             )
+            return result
 
+        with phase("source_extraction", source_file):
+            source_repos, source_has_content = load_source_repos(
+                source_file, streaming, chunk_size, backend, source_sidecar
+            )
+        if streaming:
+            # Reading is part of each streaming parse phase.
+            markdown_result = ValidationResult()
+            with phase("markdown_parse", md_file):
+                markdown_entries, markdown_sections = parse_markdown_lines(
+                    iter_text_lines(iter_text_chunks(md_file, chunk_size)), markdown_result
+                )
+            with phase("html_parse", html_file):
+                html_parser = parse_html_file_streaming(html_file, chunk_size, backend)
+        else:
+            with phase("read", md_file, html_file):
+                md_text = read_artifact_text(md_file)
+                html_text = read_artifact_text(html_file)
+
+        if not source_has_content:
+            result.error("original_trending.html is empty.")
+
+        with phase("manifest_checks", manifest_file):
+            try:
+                manifest = json.loads(read_artifact_text(manifest_file, errors="strict"))
+            except MANIFEST_PARSE_ERRORS as exc:
+                result.error(f"Manifest JSON parse error: {exc}.")
+                return result
+
+        if not streaming:
+            markdown_result = ValidationResult()
+            with phase("markdown_parse", md_file):
+                markdown_entries, markdown_sections = parse_markdown_lines(md_text.splitlines(), markdown_result)
+            with phase("html_parse", html_file):
+                html_parser = parse_html_cards(html_text, backend)
+
+        if not source_repos:
+            result.error("Cannot extract repo list from original_trending.html.")
+
+        with phase("report_checks"):
+            check_report_structure(markdown_result, markdown_sections, html_parser, result)
+
+        with phase("manifest_checks"):
+            manifest_repos = validate_manifest(manifest, period, date, result)
+
+        with phase("cross_file"):
+            compare_artifacts(source_repos, markdown_entries, html_parser.cards, manifest, manifest_repos, result)
+    except ArtifactReadError as exc:
+        result.error(f"{exc}.")
     return result
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Validate GitHub Trending report output directory.")
-    parser.add_argument(
-        "--report-dir",
-        required=True,
-        help="Path to report directory (must be: ~/.github_trending/<period>/<date>)",
-    )
-    parser.add_argument("--period", required=True, choices=sorted(PERIODS))
-    parser.add_argument("--date", required=True, help="Date in YYYY-MM-DD format")
-    parser.add_argument(
-        "--allow-small-source",
-        action="store_true",
-        help="Deprecated no-op flag kept for backward compatibility.",
-    )
-    args = parser.parse_args()
+def _validate_fail_fast(
+    files: tuple[Path, Path, Path, Path],
+    period: str,
+    date: str,
+    streaming: bool,
+    chunk_size: int,
+    backend: str,
+    phase: Callable[..., ContextManager[None]],
+    result: ValidationResult,
+    source_sidecar: bool,
+) -> None:
+    source_file, md_file, html_file, manifest_file = files
+    stages = list(FAIL_FAST_CHECKS)
+
+    def failed(stage: str) -> bool:
+        if result.errors:
+            result.skipped = stages[stages.index(stage) + 1 :]
+        return bool(result.errors)
+
+    with phase("manifest_checks", manifest_file):
+        try:
+            manifest = json.loads(read_artifact_text(manifest_file, errors="strict"))
+        except MANIFEST_PARSE_ERRORS as exc:
+            result.error(f"Manifest JSON parse error: {exc}.")
+        else:
+            manifest_repos = validate_manifest(manifest, period, date, result)
+            check_manifest_reported_count(manifest, manifest_repos, result)
+    if failed("manifest"):
+        return
+
+    markdown_result = ValidationResult()
+    with phase("markdown_parse", md_file):
+        if streaming:
+            md_lines: Iterable[str] = iter_text_lines(iter_text_chunks(md_file, chunk_size))
+        else:
+            md_lines = read_artifact_text(md_file).splitlines()
+        markdown_entries, markdown_sections = parse_markdown_lines(md_lines, markdown_result)
+    with phase("report_checks"):
+        check_markdown_structure(markdown_result, markdown_sections, result)
+        check_markdown_against_manifest(markdown_entries, manifest_repos, result)
+    if failed("markdown"):
+        return
+
+    with phase("html_parse", html_file):
+        if streaming:
+            html_parser = parse_html_file_streaming(html_file, chunk_size, backend)
+        else:
+            html_parser = parse_html_cards(read_artifact_text(html_file), backend)
+    with phase("report_checks"):
+        check_html_structure(html_parser, result)
+        check_html_against_manifest(html_parser.cards, manifest_repos, result)
+    if failed("html"):
+        return
+
+    with phase("source_extraction", source_file):
+        source_repos, source_has_content = load_source_repos(
+            source_file, streaming, chunk_size, backend, source_sidecar
+        )
+    if not source_has_content:
+        result.error("original_trending.html is empty.")
+    if not source_repos:
+        result.error("Cannot extract repo list from original_trending.html.")
+    with phase("cross_file"):
+        # The manifest-only and report-vs-manifest comparisons already passed above, so they add nothing here.
+        compare_artifacts(source_repos, markdown_entries, html_parser.cards, manifest, manifest_repos, result)
+
+
+def _source_node(
+    source_file: Path, streaming: bool, chunk_size: int, backend: str, sidecar: bool
+) -> dict[str, object]:
+    repos, has_content = load_source_repos(source_file, streaming, chunk_size, backend, sidecar)
+    return {"repos": repos, "has_content": has_content}
 
-    result = validate_report_dir(
-        report_dir=Path(args.report_dir),
-        period=args.period,
-        date=args.date,
-        allow_small_source=args.allow_small_source,
+
+def _manifest_node(manifest_file: Path, period: str, date: str) -> dict[str, object]:
+    try:
+        manifest = json.loads(read_artifact_text(manifest_file, errors="strict"))
+    except MANIFEST_PARSE_ERRORS as exc:
+        return {"json_error": f"Manifest JSON parse error: {exc}."}
+    checks = ValidationResult()
+    repos = validate_manifest(manifest, period, date, checks)
+    # compare_artifacts reads only these two fields of the manifest itself.
+    counts = {key: manifest.get(key) for key in ("source_item_count", "reported_item_count")}
+    return {"json_error": None, "counts": counts, "repos": repos, "errors": checks.errors}
+
+
+def _markdown_node(md_file: Path, streaming: bool, chunk_size: int) -> dict[str, object]:
+    if streaming:
+        md_lines: Iterable[str] = iter_text_lines(iter_text_chunks(md_file, chunk_size))
+    else:
+        md_lines = read_artifact_text(md_file).splitlines()
+    markdown_result = ValidationResult()
+    entries, sections = parse_markdown_lines(md_lines, markdown_result)
+    checks = ValidationResult()
+    check_markdown_structure(markdown_result, sections, checks)
+    return {"entries": [[entry.rank, entry.repo, entry.url] for entry in entries], "errors": checks.errors}
+
+
+def _html_node(html_file: Path, streaming: bool, chunk_size: int, backend: str) -> dict[str, object]:
+    if streaming:
+        html_parser = parse_html_file_streaming(html_file, chunk_size, backend)
+    else:
+        html_parser = parse_html_cards(read_artifact_text(html_file), backend)
+    checks = ValidationResult()
+    check_html_structure(html_parser, checks)
+    cards = [
+        [card.rank, card.repo_url, sorted(card.labels), card.tag_count, card.has_suggestion]
+        for card in html_parser.cards
+    ]
+    return {"cards": cards, "errors": checks.errors}
+
+
+def _cross_file_node(source: dict, markdown: dict, html: dict, manifest: dict) -> dict[str, object]:
+    checks = ValidationResult()
+    compare_artifacts(
+        source["repos"],
+        [MarkdownEntry(rank, repo, url) for rank, repo, url in markdown["entries"]],
+        [HtmlCard(rank, url, set(labels), tags, suggestion) for rank, url, labels, tags, suggestion in html["cards"]],
+        manifest["counts"],
+        manifest["repos"],
+        checks,
     )
+    return {"errors": checks.errors, "repo_diffs": checks.repo_diffs}
+
+
+def _node_tasks(
+    paths: dict[str, Path],
+    period: str,
+    date: str,
+    streaming: bool,
+    chunk_size: int,
+    backend: str,
+    source_sidecar: bool,
+) -> dict[str, tuple[str, Callable[..., dict[str, object]], tuple]]:
+    """``(phase name, node function, arguments)`` of each per-artifact ``CHECK_GRAPH`` node."""
+    source_file, md_file, html_file, manifest_file = (paths[key] for key in ARTIFACT_KEYS)
+    return {
+        "source": ("source_extraction", _source_node, (source_file, streaming, chunk_size, backend, source_sidecar)),
+        "manifest": ("manifest_checks", _manifest_node, (manifest_file, period, date)),
+        "markdown": ("markdown_parse", _markdown_node, (md_file, streaming, chunk_size)),
+        "html": ("html_parse", _html_node, (html_file, streaming, chunk_size, backend)),
+    }
+
+
+def _validate_guarded(
+    paths: dict[str, Path],
+    period: str,
+    date: str,
+    streaming: bool,
+    chunk_size: int,
+    backend: str,
+    phase: Callable[..., ContextManager[None]],
+    result: ValidationResult,
+    source_sidecar: bool,
+    budget: ValidationBudget,
+) -> None:
+    """Validate via the ``CHECK_GRAPH`` nodes, each within ``budget``; errors come in full-run order."""
+    tasks = _node_tasks(paths, period, date, streaming, chunk_size, backend, source_sidecar)
+
+    def node(name: str) -> dict[str, object] | None:
+        """The node's data, or ``None`` (with the error recorded) if it broke a budget or raised."""
+        phase_name, func, args = tasks[name]
+        oversized = budget.size_errors({key: paths[key] for key in CHECK_GRAPH[name]})
+        if oversized:
+            result.errors.extend(oversized)
+            return None
+        try:
+            with phase(phase_name, args[0]):
+                return runner.run(name, func, *args)
+        except CheckFailed as exc:
+            # An unreadable artifact reads the same as in an unguarded run.
+            result.error(f"{exc.__cause__}." if isinstance(exc.__cause__, ArtifactReadError) else str(exc))
+            return None
+
+    with CheckRunner(budget) as runner:
+        source = node("source")
+        if source is not None and not source["has_content"]:
+            result.error("original_trending.html is empty.")
+        manifest = node("manifest")
+        if manifest is not None and manifest["json_error"] is not None:
+            result.error(manifest["json_error"])
+            return
+        if source is not None and manifest is not None and not source["repos"]:
+            result.error("Cannot extract repo list from original_trending.html.")
+        markdown, html = node("markdown"), node("html")
+        nodes = {"source": source, "markdown": markdown, "html": html, "manifest": manifest}
+        unfinished = [name for name, data in nodes.items() if data is None]
+        cross_file = None
+        if not unfinished:
+            with phase("cross_file"):
+                try:
+                    cross_file = runner.run("cross_file", _cross_file_node, source, markdown, html, manifest)
+                except CheckFailed as exc:
+                    result.error(str(exc))
+    for data in (markdown, html, manifest, cross_file):
+        if data is not None:
+            result.errors.extend(data["errors"])
+    if cross_file is not None:
+        result.repo_diffs = cross_file["repo_diffs"]
+    if unfinished:
+        result.error(f"Cross-file checks skipped; unfinished checks: {', '.join(unfinished)}.")
+
+
+def _validate_nodes(
+    report_dir: Path,
+    paths: dict[str, Path],
+    period: str,
+    date: str,
+    streaming: bool,
+    chunk_size: int,
+    backend: str,
+    phase: Callable[..., ContextManager[None]],
+    result: ValidationResult,
+    incremental: bool,
+    parallel: bool,
+    state: MemoryState | None,
+    source_sidecar: bool,
+) -> None:
+    """Validate via the ``CHECK_GRAPH`` nodes, reusing stored ones and/or parsing concurrently."""
+    tasks = _node_tasks(paths, period, date, streaming, chunk_size, backend, source_sidecar)
+    stored: dict[str, dict] = {}
+    digests: dict[str, str] = {}
+    if incremental:
+        from validation_cache import file_sha256
+        from validation_state import load_state, reusable, store_state
+
+        if state is not None:
+            load_state, store_state = state.load, state.store
+        with phase("incremental_state"):
+            stored = load_state(report_dir, period, date, backend)
+            # Hash before parsing, so a concurrent rewrite is never stored as the parsed content.
+            digests = {key: file_sha256(path) for key, path in paths.items()}
+
+    nodes: dict[str, dict] = {}
+    changed = False
+
+    def inputs(name: str) -> dict[str, str]:
+        return {key: digests[key] for key in CHECK_GRAPH[name]} if incremental else {}
+
+    def reuse(name: str) -> bool:
+        if incremental and reusable(stored.get(name), inputs(name)):
+            nodes[name] = stored[name]
+            return True
+        return False
+
+    def computed(name: str, data: dict[str, object]) -> dict[str, object]:
+        nonlocal changed
+        nodes[name] = {"inputs": inputs(name), "data": data}
+        changed = True
+        return data
+
+    def node(name: str) -> dict[str, object]:
+        if name in nodes or reuse(name):
+            return nodes[name]["data"]
+        if name in pending:
+            with phase("parallel_wait"):
+                return computed(name, pending.pop(name).result())
+        phase_name, func, args = tasks[name]
+        with phase(phase_name, args[0]):
+            return computed(name, func(*args))
+
+    pending: dict[str, Future[dict[str, object]]] = {}
+    pool = None
+    if parallel:
+        # The HTML parsers are CPU-bound; the manifest and Markdown run here meanwhile.
+        offload = [name for name in ("source", "html") if not reuse(name)]
+        if offload:
+            pool = _parse_pool(len(offload))
+        if pool is not None:
+            pending = {name: pool.submit(tasks[name][1], *tasks[name][2]) for name in offload}
+    try:
+        if pending:
+            node("manifest")
+            node("markdown")
+        # Errors are appended in the order the exhaustive run reports them.
+        source = node("source")
+        if not source["has_content"]:
+            result.error("original_trending.html is empty.")
+        manifest = node("manifest")
+        if manifest["json_error"] is None:
+            if not source["repos"]:
+                result.error("Cannot extract repo list from original_trending.html.")
+            markdown, html = node("markdown"), node("html")
+            if not reuse("cross_file"):
+                with phase("cross_file"):
+                    computed("cross_file", _cross_file_node(source, markdown, html, manifest))
+            for name in ("markdown", "html", "manifest", "cross_file"):
+                result.errors.extend(nodes[name]["data"]["errors"])
+            result.repo_diffs = nodes["cross_file"]["data"]["repo_diffs"]
+        else:
+            result.error(manifest["json_error"])
+            # Nodes not needed this run stay stored while their inputs are unchanged.
+            for name in ("markdown", "html"):
+                if name not in nodes:
+                    reuse(name)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    if incremental and (changed or nodes.keys() != stored.keys()):
+        with phase("incremental_state"):
+            store_state(report_dir, period, date, backend, nodes)
+
+
+def usable_cpus() -> int:
+    """CPUs this process may run on (its affinity mask where the platform has one)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _parse_pool(workers: int) -> ProcessPoolExecutor | None:
+    """A process pool for ``parallel=True``, or ``None`` (parse serially) on one CPU or without processes."""
+    if usable_cpus() < 2:
+        return None
+    # Imported here: multiprocessing would add to every validator start-up.
+    from concurrent.futures import ProcessPoolExecutor
 
+    try:
+        return ProcessPoolExecutor(max_workers=workers)
+    except (OSError, NotImplementedError):
+        return None
+
+
+def print_result(result: ValidationResult) -> int:
     if result.errors:
         print("VALIDATION FAILED")
         for idx, error in enumerate(result.errors, start=1):
@@ -582,6 +1619,10 @@ def main() -> int:
             print("WARNINGS")
             for idx, warning in enumerate(result.warnings, start=1):
                 print(f"{idx}. {warning}")
+        if result.skipped:
+            print("SKIPPED (fail-fast)")
+            for idx, stage in enumerate(result.skipped, start=1):
+                print(f"{idx}. {stage}: {FAIL_FAST_CHECKS[stage]}")
         return 1
 
     print("VALIDATION PASSED")
@@ -592,5 +1633,220 @@ def main() -> int:
     return 0
 
 
+def watch_report_dir(
+    report_dir: Path,
+    period: str,
+    date: str,
+    streaming: bool,
+    chunk_size: int,
+    html_backend: str,
+    parallel: bool,
+    debounce: float | None,
+) -> int:
+    """``--watch``: print a fresh result whenever the artifacts settle after a change, until Ctrl-C."""
+    import time
+
+    from report_watcher import DEFAULT_DEBOUNCE, make_watcher, watch
+    from validation_state import MemoryState
+
+    state = MemoryState()
+    directory = report_dir.expanduser().resolve()
+    names = artifact_names(date).values()
+    paths = [Path(variant) for name in names for variant in stored_variants(str(directory / name))]
+    watcher = make_watcher(directory, paths)
+    print(f"Watching {directory} ({watcher.kind}); press Ctrl-C to stop.", flush=True)
+
+    def revalidate() -> None:
+        started = time.perf_counter()
+        result = validate_report_dir(
+            report_dir=report_dir,
+            period=period,
+            date=date,
+            streaming=streaming,
+            chunk_size=chunk_size,
+            html_backend=html_backend,
+            incremental=True,
+            parallel=parallel,
+            state=state,
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"== {time.strftime('%H:%M:%S')} validated in {elapsed_ms:.1f} ms ==")
+        print_result(result)
+        sys.stdout.flush()
+
+    try:
+        watch(watcher, paths, revalidate, DEFAULT_DEBOUNCE if debounce is None else debounce)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate GitHub Trending report output directory.")
+    parser.add_argument(
+        "--report-dir",
+        required=True,
+        help="Path to report directory (must be: ~/.github_trending/<period>/<date>)",
+    )
+    parser.add_argument("--period", required=True, choices=sorted(PERIODS))
+    parser.add_argument("--date", required=True, help="Date in YYYY-MM-DD format")
+    parser.add_argument(
+        "--allow-small-source",
+        action="store_true",
+        help="Deprecated no-op flag kept for backward compatibility.",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Feed files to the parsers in fixed-size chunks to keep memory flat for large pages.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=STREAM_CHUNK_SIZE,
+        help=f"Chunk size in characters for --streaming (default: {STREAM_CHUNK_SIZE}).",
+    )
+    parser.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Ask the resident validator (validator_daemon.py) first; validate in-process if it is not running.",
+    )
+    parser.add_argument(
+        "--html-backend",
+        choices=["auto", *BACKENDS],
+        default=None,
+        help=f"HTML tokenizer (default: ${HTML_BACKEND_ENV} or auto = stdlib; lxml and selectolax are opt-in).",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Run checks cheapest first (manifest, Markdown, HTML, source page) and stop at the first failing stage.",
+    )
+    mode.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse parsed results of unchanged files from the last --incremental run (.validation_state.json).",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running: revalidate (incrementally, in memory) each time the artifacts settle after a change.",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=None,
+        help="Seconds without writes before --watch revalidates (default: 0.2).",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse the source page and HTML report in worker processes while the rest is parsed (in-process only).",
+    )
+    parser.add_argument(
+        "--no-source-sidecar",
+        action="store_true",
+        help="Always parse the source page; neither read nor write original_trending.repos.json (in-process only).",
+    )
+    add_budget_arguments(parser, "in-process only")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase wall/CPU time and bytes as JSON to stderr (always validates in-process).",
+    )
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Run under cProfile and write the pstats dump to this path (always validates in-process).",
+    )
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be a positive integer.")
+    try:
+        html_backend = resolve_backend(args.html_backend)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if args.fail_fast and args.parallel:
+        parser.error("argument --parallel: not allowed with argument --fail-fast")
+    budget = None
+    if args.guarded:
+        for flag, value in (
+            ("--fail-fast", args.fail_fast),
+            ("--incremental", args.incremental),
+            ("--parallel", args.parallel),
+            ("--watch", args.watch),
+        ):
+            if value:
+                parser.error(f"argument --guarded: not allowed with argument {flag}")
+        try:
+            budget = make_budget(args.check_seconds, args.max_artifact_bytes)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if args.watch:
+        for flag, value in (("--fail-fast", args.fail_fast), ("--profile", args.profile or args.profile_output)):
+            if value:
+                parser.error(f"argument --watch: not allowed with argument {flag}")
+        if args.debounce is not None and args.debounce < 0:
+            parser.error("--debounce must not be negative.")
+        return watch_report_dir(
+            Path(args.report_dir),
+            args.period,
+            args.date,
+            args.streaming,
+            args.chunk_size,
+            html_backend,
+            args.parallel,
+            args.debounce,
+        )
+
+    in_process_only = (
+        args.profile or bool(args.profile_output) or args.parallel or args.no_source_sidecar or args.guarded
+    )
+    if args.use_daemon and not in_process_only:
+        import validator_client
+
+        reply = validator_client.validate_report_dir(
+            Path(args.report_dir),
+            period=args.period,
+            date=args.date,
+            streaming=args.streaming,
+            html_backend=html_backend,
+            fail_fast=args.fail_fast,
+            incremental=args.incremental,
+            allow_small_source=args.allow_small_source,
+            chunk_size=args.chunk_size,
+        )
+        if reply is not None:
+            errors, warnings, skipped = reply
+            return print_result(ValidationResult(errors=errors, warnings=warnings, skipped=skipped))
+
+    timer = PhaseTimer() if args.profile else None
+    result = run_profiled(
+        lambda: validate_report_dir(
+            report_dir=Path(args.report_dir),
+            period=args.period,
+            date=args.date,
+            allow_small_source=args.allow_small_source,
+            streaming=args.streaming,
+            chunk_size=args.chunk_size,
+            html_backend=html_backend,
+            timer=timer,
+            fail_fast=args.fail_fast,
+            incremental=args.incremental,
+            parallel=args.parallel,
+            source_sidecar=not args.no_source_sidecar,
+            budget=budget,
+        ),
+        args.profile_output,
+    )
+    if timer is not None:
+        print(json.dumps({"profile": timer.as_dict()}), file=sys.stderr)
+    return print_result(result)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,193 @@
+"""Time and size budgets for guarded validation (``--guarded``).
+
+Malformed or adversarial model output must not hang the validator, or the
+cron job around it. In guarded mode ``validate_report_dir`` runs each
+``CHECK_GRAPH`` node in a worker process and waits at most
+``ValidationBudget.check_seconds`` for it. An overrun kills the worker and
+becomes a validation error. A signal would not do: lxml and lexbor parse in
+C, where Python signal handlers do not run until the parse returns.
+
+Before a check starts, its artifact is measured against ``max_bytes``. A
+compressed artifact counts by its decompressed size, read only up to the
+limit, so an oversized file or a decompression bomb is refused, not parsed.
+
+Any other exception in a check (``RecursionError``, ``MemoryError``, ...) is
+reported as an error as well. Without worker processes (no ``fork``/``spawn``,
+or inside a daemonic process) checks run in-process, and an overrun is only
+reported once the check returns.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from artifact_io import codec_of, open_artifact_binary
+
+if TYPE_CHECKING:
+    import argparse
+    from multiprocessing.pool import Pool
+    from pathlib import Path
+    from typing import Callable, Mapping
+
+DEFAULT_CHECK_SECONDS = 10.0
+MIB = 1024 * 1024
+DEFAULT_MAX_BYTES = {
+    "source_file": 16 * MIB,
+    "md_file": 4 * MIB,
+    "html_file": 8 * MIB,
+    "manifest_file": 1 * MIB,
+}
+READ_BLOCK = MIB
+
+
+class CheckFailed(Exception):
+    """A guarded check that overran its budget or raised; ``str(exc)`` is the validation error."""
+
+
+@dataclass
+class ValidationBudget:
+    """Wall-clock seconds per check and content bytes per artifact key (``report_layout.ARTIFACT_KEYS``)."""
+
+    check_seconds: float = DEFAULT_CHECK_SECONDS
+    max_bytes: dict[str, int] = field(default_factory=lambda: dict(DEFAULT_MAX_BYTES))
+
+    def size_errors(self, paths: Mapping[str, Path]) -> list[str]:
+        errors = []
+        for key, path in paths.items():
+            limit = self.max_bytes.get(key)
+            if limit is None:
+                continue
+            try:
+                size = artifact_size(path, limit)
+            except Exception as exc:
+                errors.append(f"Cannot read {path}: {exc}.")
+                continue
+            if size <= limit:
+                continue
+            if codec_of(path) is None:
+                errors.append(f"{path.name} is {size} bytes, over its size budget of {limit} bytes.")
+            else:
+                errors.append(f"{path.name} decompresses to more than its size budget of {limit} bytes.")
+        return errors
+
+
+def make_budget(check_seconds: float | None = None, max_artifact_bytes: int | None = None) -> ValidationBudget:
+    """The default budget, with ``--check-seconds``/``--max-artifact-bytes`` applied when given."""
+    if check_seconds is not None and check_seconds <= 0:
+        raise ValueError("--check-seconds must be positive.")
+    if max_artifact_bytes is not None and max_artifact_bytes < 0:
+        raise ValueError("--max-artifact-bytes must not be negative.")
+    max_bytes = dict(DEFAULT_MAX_BYTES)
+    if max_artifact_bytes is not None:
+        max_bytes = dict.fromkeys(max_bytes, max_artifact_bytes)
+    return ValidationBudget(DEFAULT_CHECK_SECONDS if check_seconds is None else check_seconds, max_bytes)
+
+
+def add_budget_arguments(parser: argparse.ArgumentParser, scope: str) -> None:
+    parser.add_argument(
+        "--guarded",
+        action="store_true",
+        help=(
+            "Run each check in a worker process under time and size budgets; a check that overruns or crashes "
+            f"is reported as a validation error ({scope})."
+        ),
+    )
+    parser.add_argument(
+        "--check-seconds",
+        type=float,
+        default=None,
+        help=f"Time budget per check with --guarded (default: {DEFAULT_CHECK_SECONDS:g}).",
+    )
+    parser.add_argument(
+        "--max-artifact-bytes",
+        type=int,
+        default=None,
+        help="Size budget for every artifact with --guarded (default: 16 MiB source page, 8 MiB HTML, "
+        "4 MiB Markdown, 1 MiB manifest; compressed artifacts count decompressed).",
+    )
+
+
+def artifact_size(path: Path, limit: int) -> int:
+    """Content bytes of ``path``; a compressed artifact is decompressed only until it passes ``limit``."""
+    if codec_of(path) is None:
+        return path.stat().st_size
+    size = 0
+    with open_artifact_binary(path) as handle:
+        while size <= limit:
+            block = handle.read(READ_BLOCK)
+            if not block:
+                break
+            size += len(block)
+    return size
+
+
+class CheckRunner:
+    """Runs checks one at a time in a single worker process, replaced after an overrun.
+
+    ``func`` and its arguments must pickle (module-level functions, plain data).
+    """
+
+    def __init__(self, budget: ValidationBudget) -> None:
+        self.budget = budget
+        self._pool: Pool | None = None
+        self._in_process = False
+
+    def __enter__(self) -> CheckRunner:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *exc_info: object) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # E.g. KeyboardInterrupt: do not wait for a runaway check.
+            self._kill()
+
+    def _worker(self) -> Pool | None:
+        if self._pool is None and not self._in_process:
+            # Imported here: multiprocessing would add to every validator start-up.
+            import multiprocessing
+
+            self._timeout_error = multiprocessing.TimeoutError
+            try:
+                self._pool = multiprocessing.get_context().Pool(1)
+            except (OSError, NotImplementedError, AssertionError):
+                # AssertionError: daemonic processes may not have children.
+                self._in_process = True
+        return self._pool
+
+    def run(self, check: str, func: Callable[..., dict[str, object]], *args: object) -> dict[str, object]:
+        seconds = self.budget.check_seconds
+        overrun = f"{check} check exceeded its time budget of {seconds:g} s."
+        pool = self._worker()
+        if pool is None:
+            started = time.perf_counter()
+            try:
+                data = func(*args)
+            except Exception as exc:
+                raise CheckFailed(f"{check} check failed: {type(exc).__name__}: {exc}") from exc
+            if time.perf_counter() - started > seconds:
+                raise CheckFailed(overrun)
+            return data
+
+        pending = pool.apply_async(func, args)
+        try:
+            return pending.get(seconds)
+        except self._timeout_error:
+            self._kill()
+            raise CheckFailed(overrun) from None
+        except Exception as exc:
+            raise CheckFailed(f"{check} check failed: {type(exc).__name__}: {exc}") from exc
+
+    def _kill(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
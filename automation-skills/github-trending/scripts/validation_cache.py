@@ -0,0 +1,171 @@
+"""Content-addressed cache of gate results, stored inside each report directory.
+
+A cached result is reused only when every artifact still has the same size,
+mtime and SHA-256 as when it was validated, with the same HTML backend, and
+the validator source is unchanged. Size/mtime are compared first so a changed file is detected without
+hashing; matching files are always re-hashed, so a same-size rewrite within one
+mtime tick cannot produce a stale hit.
+
+This module is imported by the gate before any validator code, so it must only
+depend on the standard library.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from report_layout import ARTIFACT_KEYS
+
+CACHE_FILE_NAME = ".validation_cache.json"
+CACHE_FORMAT_VERSION = 1
+VALIDATOR_SOURCES = (
+    "validate_report.py",
+    "report_layout.py",
+    "html_backends.py",
+    "artifact_io.py",
+    "source_sidecar.py",
+    "repo_diff.py",
+    "validation_budget.py",
+)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stat_fingerprint(path: Path) -> dict[str, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_fingerprint(path: Path) -> dict[str, object] | None:
+    fingerprint: dict[str, object] | None = stat_fingerprint(path)
+    if fingerprint is None:
+        return None
+    fingerprint["sha256"] = file_sha256(path)
+    return fingerprint
+
+
+def validator_fingerprint() -> str:
+    """Hash of the validator sources, so rule changes invalidate every cached result."""
+    digest = hashlib.sha256(f"v{CACHE_FORMAT_VERSION}".encode())
+    scripts_dir = Path(__file__).resolve().parent
+    for name in VALIDATOR_SOURCES:
+        digest.update(name.encode())
+        digest.update((scripts_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def cache_file(paths: dict[str, Path]) -> Path:
+    return paths["report_dir"] / CACHE_FILE_NAME
+
+
+def compute_cache_key(paths: dict[str, Path], backend: str) -> dict[str, object]:
+    """Fingerprint the artifacts; call before validating so a concurrent rewrite is never cached as valid.
+
+    ``backend`` is the resolved HTML backend: backends can disagree on malformed
+    markup, so a result is only reused for the backend that produced it.
+    """
+    return {
+        "format": CACHE_FORMAT_VERSION,
+        "validator": validator_fingerprint(),
+        "html_backend": backend,
+        "report_dir": str(paths["report_dir"]),
+        "artifacts": {key: file_fingerprint(paths[key]) for key in ARTIFACT_KEYS},
+    }
+
+
+def _read_cache(path: Path) -> dict | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _artifacts_unchanged(paths: dict[str, Path], cached_artifacts: object) -> bool:
+    if not isinstance(cached_artifacts, dict):
+        return False
+    # Cheap stat pass first: any size/mtime change is a miss without reading content.
+    for key in ARTIFACT_KEYS:
+        cached = cached_artifacts.get(key)
+        current = stat_fingerprint(paths[key])
+        if current is None or cached is None:
+            if current is not None or cached is not None:
+                return False
+            continue
+        if not isinstance(cached, dict) or any(cached.get(name) != value for name, value in current.items()):
+            return False
+    for key in ARTIFACT_KEYS:
+        cached = cached_artifacts.get(key)
+        if cached is not None and file_sha256(paths[key]) != cached.get("sha256"):
+            return False
+    return True
+
+
+def load_cached_result(paths: dict[str, Path], backend: str) -> tuple[int, dict[str, object]] | None:
+    """Return the stored ``(exit_code, payload)`` if nothing changed since ``backend`` wrote it."""
+    data = _read_cache(cache_file(paths))
+    if data is None:
+        return None
+    key = data.get("key")
+    if not isinstance(key, dict):
+        return None
+    if key.get("format") != CACHE_FORMAT_VERSION or key.get("report_dir") != str(paths["report_dir"]):
+        return None
+    if key.get("html_backend") != backend or key.get("validator") != validator_fingerprint():
+        return None
+    if not _artifacts_unchanged(paths, key.get("artifacts")):
+        return None
+
+    exit_code = data.get("exit_code")
+    payload = data.get("payload")
+    if not isinstance(exit_code, int) or not isinstance(payload, dict):
+        return None
+    return exit_code, payload
+
+
+def store_cached_result(
+    paths: dict[str, Path],
+    key: dict[str, object],
+    exit_code: int,
+    payload: dict[str, object],
+) -> None:
+    """Atomically write the cache entry; a read-only report directory is silently skipped."""
+    data = {"key": key, "exit_code": exit_code, "payload": payload}
+    write_json_atomically(cache_file(paths), data, ensure_ascii=False)
+
+
+def write_json_atomically(target: Path, data: object, **dump_options: object) -> None:
+    """Replace ``target`` with ``data`` as JSON via a temp file of its own; an unwritable directory is skipped.
+
+    The temp file name is unique per call, so threads of one process (the
+    validator daemon) and concurrent processes never write into each other's.
+    """
+    try:
+        handle, temp_name = tempfile.mkstemp(dir=target.parent, prefix=f"{target.name}.", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with open(handle, "w", encoding="utf-8") as temp_file:
+            json.dump(data, temp_file, **dump_options)
+        os.replace(temp_name, target)
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
+
+
+def invalidate(paths: dict[str, Path]) -> None:
+    cache_file(paths).unlink(missing_ok=True)
@@ -0,0 +1,85 @@
+"""Parsed intermediates of the last validation, stored inside each report directory.
+
+``validate_report_dir(..., incremental=True)`` splits validation into nodes (one
+per artifact plus the cross-file comparison, see ``CHECK_GRAPH`` in
+``validate_report.py``). Each node is stored with the SHA-256 of every artifact
+it depends on and is reused only while all of them still match, so a
+revalidation re-parses just the files whose content changed; rewriting a file
+with identical bytes keeps its node.
+
+The whole state is discarded when the validator sources, period, date, report
+directory or HTML backend differ from the run that wrote it: on malformed
+markup the backends can disagree.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from validation_cache import validator_fingerprint, write_json_atomically
+
+STATE_FILE_NAME = ".validation_state.json"
+STATE_FORMAT_VERSION = 1
+
+
+def state_file(report_dir: Path) -> Path:
+    return report_dir / STATE_FILE_NAME
+
+
+def _header(report_dir: Path, period: str, date: str, backend: str) -> dict[str, object]:
+    return {
+        "format": STATE_FORMAT_VERSION,
+        "validator": validator_fingerprint(),
+        "report_dir": str(report_dir),
+        "period": period,
+        "date": date,
+        "html_backend": backend,
+    }
+
+
+def load_state(report_dir: Path, period: str, date: str, backend: str) -> dict[str, dict]:
+    """Stored nodes by name; empty when missing, unreadable or written for other inputs."""
+    try:
+        data = json.loads(state_file(report_dir).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("header") != _header(report_dir, period, date, backend):
+        return {}
+    nodes = data.get("nodes")
+    if not isinstance(nodes, dict):
+        return {}
+    return {name: node for name, node in nodes.items() if isinstance(node, dict)}
+
+
+def reusable(node: dict | None, inputs: dict[str, object]) -> bool:
+    return node is not None and node.get("inputs") == inputs and "data" in node
+
+
+def store_state(report_dir: Path, period: str, date: str, backend: str, nodes: dict[str, dict]) -> None:
+    """Atomically write the nodes; a read-only report directory is silently skipped."""
+    data = {"header": _header(report_dir, period, date, backend), "nodes": nodes}
+    write_json_atomically(state_file(report_dir), data, ensure_ascii=False)
+
+
+class MemoryState:
+    """Nodes kept in the process instead of the state file, for a long-running watcher.
+
+    Has the same ``load``/``store`` signatures as ``load_state``/``store_state``;
+    it holds one report directory at a time and never touches the disk.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[str, str, str, str] | None = None
+        self._nodes: dict[str, dict] = {}
+
+    def load(self, report_dir: Path, period: str, date: str, backend: str) -> dict[str, dict]:
+        return dict(self._nodes) if self._key == (str(report_dir), period, date, backend) else {}
+
+    def store(self, report_dir: Path, period: str, date: str, backend: str, nodes: dict[str, dict]) -> None:
+        self._key = (str(report_dir), period, date, backend)
+        self._nodes = dict(nodes)
+
+
+def invalidate(report_dir: Path) -> None:
+    state_file(report_dir).unlink(missing_ok=True)
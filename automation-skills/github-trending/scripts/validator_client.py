@@ -0,0 +1,101 @@
+"""Client side of the resident validator (see validator_daemon.py).
+
+Requests are single JSON lines over a Unix domain socket. Every failure to reach
+the daemon returns ``None`` so callers can fall back to in-process validation.
+Standard library only, and deliberately free of validator imports.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+
+from report_layout import OUTPUT_ROOT_NAME
+
+SOCKET_NAME = ".validator.sock"
+CLIENT_TIMEOUT_SECONDS = 30.0
+
+
+def default_socket_path() -> Path:
+    return Path.home() / OUTPUT_ROOT_NAME / SOCKET_NAME
+
+
+def request(
+    message: dict[str, object],
+    socket_path: Path | None = None,
+    timeout: float = CLIENT_TIMEOUT_SECONDS,
+) -> dict[str, object] | None:
+    """Send one request and return the decoded reply, or ``None`` if the daemon cannot serve it."""
+    path = socket_path or default_socket_path()
+    message = {**message, "home": str(Path.home()), "pid": os.getpid()}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout)
+            conn.connect(str(path))
+            conn.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+            conn.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := conn.recv(65536):
+                chunks.append(chunk)
+        reply = json.loads(b"".join(chunks).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(reply, dict) or "error" in reply:
+        return None
+    return reply
+
+
+def check_existing_report(
+    period: str,
+    date: str,
+    use_cache: bool = True,
+    html_backend: str | None = None,
+) -> tuple[int, dict[str, object]] | None:
+    reply = request(
+        {
+            "op": "check_existing_report",
+            "period": period,
+            "date": date,
+            "use_cache": use_cache,
+            "html_backend": html_backend,
+        }
+    )
+    if reply is None or not isinstance(reply.get("exit_code"), int) or not isinstance(reply.get("payload"), dict):
+        return None
+    return reply["exit_code"], reply["payload"]
+
+
+def validate_report_dir(
+    report_dir: Path,
+    period: str,
+    date: str,
+    streaming: bool = False,
+    html_backend: str | None = None,
+    fail_fast: bool = False,
+    incremental: bool = False,
+    allow_small_source: bool = False,
+    chunk_size: int | None = None,
+) -> tuple[list[str], list[str], list[str]] | None:
+    """Return ``(errors, warnings, skipped)`` from the daemon; the report dir is sent fully resolved.
+
+    ``chunk_size=None`` leaves the daemon's default chunk size.
+    """
+    reply = request(
+        {
+            "op": "validate_report_dir",
+            "report_dir": str(report_dir.expanduser().resolve()),
+            "period": period,
+            "date": date,
+            "streaming": streaming,
+            "html_backend": html_backend,
+            "fail_fast": fail_fast,
+            "incremental": incremental,
+            "allow_small_source": allow_small_source,
+            "chunk_size": chunk_size,
+        }
+    )
+    if reply is None or not all(isinstance(reply.get(key), list) for key in ("errors", "warnings", "skipped")):
+        return None
+    return reply["errors"], reply["warnings"], reply["skipped"]
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Resident validator: loads the validation code once and serves requests over a Unix socket.
+
+Protocol: the client sends one JSON object terminated by a newline and reads one
+JSON object back. Supported ops:
+- ``check_existing_report``: ``{"exit_code": int, "payload": {...}}`` (same as the gate script)
+- ``validate_report_dir``: ``{"errors": [...], "warnings": [...], "skipped": [...]}``
+- ``ping``: ``{"pid": int, "served": int}``
+- ``shutdown``: stops the daemon
+
+A request from a client whose HOME differs from the daemon's, or a request made
+after the validator sources changed on disk, gets ``{"error": ...}`` so the
+client falls back to in-process validation. In the latter case the daemon exits.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from pathlib import Path
+
+from check_existing_report import check_existing_report
+from validate_report import STREAM_CHUNK_SIZE, validate_report_dir
+from validator_client import default_socket_path, request
+
+SOURCE_FILES = (
+    "validate_report.py",
+    "check_existing_report.py",
+    "validation_cache.py",
+    "report_layout.py",
+    "html_backends.py",
+    "phase_timing.py",
+    "validation_state.py",
+    "artifact_io.py",
+    "source_sidecar.py",
+    "repo_diff.py",
+    "validation_budget.py",
+)
+
+
+def _source_stamp() -> list[tuple[str, int, int]]:
+    scripts_dir = Path(__file__).resolve().parent
+    stamp = []
+    for name in SOURCE_FILES:
+        stat = (scripts_dir / name).stat()
+        stamp.append((name, stat.st_size, stat.st_mtime_ns))
+    return stamp
+
+
+class ValidatorServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path) -> None:
+        self.socket_path = socket_path
+        self.home = str(Path.home())
+        self.source_stamp = _source_stamp()
+        self.served = 0
+        self._lock = threading.Lock()
+        super().__init__(str(socket_path), ValidatorRequestHandler)
+
+    def dispatch(self, message: dict) -> dict[str, object]:
+        op = message.get("op")
+        if op == "ping":
+            return {"pid": os.getpid(), "served": self.served}
+        if op == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"stopping": True}
+        if message.get("home") != self.home:
+            return {"error": f"daemon serves HOME={self.home}"}
+        if _source_stamp() != self.source_stamp:
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"error": "validator sources changed; daemon is stopping"}
+
+        with self._lock:
+            self.served += 1
+        if op == "check_existing_report":
+            exit_code, payload = check_existing_report(
+                period=str(message.get("period")),
+                date=str(message.get("date")),
+                use_cache=bool(message.get("use_cache", True)),
+                html_backend=message.get("html_backend"),
+            )
+            return {"exit_code": exit_code, "payload": payload}
+        if op == "validate_report_dir":
+            result = validate_report_dir(
+                report_dir=Path(str(message.get("report_dir"))),
+                period=str(message.get("period")),
+                date=str(message.get("date")),
+                allow_small_source=bool(message.get("allow_small_source", False)),
+                streaming=bool(message.get("streaming", False)),
+                chunk_size=int(message.get("chunk_size") or STREAM_CHUNK_SIZE),
+                html_backend=message.get("html_backend"),
+                fail_fast=bool(message.get("fail_fast", False)),
+                incremental=bool(message.get("incremental", False)),
+            )
+            return {"errors": result.errors, "warnings": result.warnings, "skipped": result.skipped}
+        return {"error": f"unknown op: {op}"}
+
+
+class ValidatorRequestHandler(socketserver.StreamRequestHandler):
+    server: ValidatorServer
+
+    def handle(self) -> None:
+        try:
+            message = json.loads(self.rfile.readline().decode("utf-8"))
+            if not isinstance(message, dict):
+                raise ValueError("request must be a JSON object")
+            reply = self.server.dispatch(message)
+        except Exception as exc:  # noqa: BLE001 - a bad request must not kill the daemon
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        self.wfile.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    """Remove a stale socket file; refuse to start if another daemon is answering on it."""
+    if not socket_path.exists():
+        return
+    if request({"op": "ping"}, socket_path=socket_path, timeout=1.0) is not None:
+        raise SystemExit(f"validator daemon already running on {socket_path}")
+    socket_path.unlink()
+
+
+def serve(socket_path: Path) -> None:
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    _claim_socket_path(socket_path)
+    old_umask = os.umask(0o077)
+    try:
+        server = ValidatorServer(socket_path)
+    finally:
+        os.umask(old_umask)
+    try:
+        print(json.dumps({"status": "listening", "socket": str(socket_path), "pid": os.getpid()}), flush=True)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Serve report validation over a Unix domain socket.")
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Socket path (default: ~/.github_trending/.validator.sock).",
+    )
+    parser.add_argument("--status", action="store_true", help="Print daemon status and exit.")
+    parser.add_argument("--stop", action="store_true", help="Ask a running daemon to stop and exit.")
+    args = parser.parse_args()
+    socket_path = Path(args.socket).expanduser() if args.socket else default_socket_path()
+
+    if args.status or args.stop:
+        reply = request({"op": "shutdown" if args.stop else "ping"}, socket_path=socket_path, timeout=2.0)
+        print(json.dumps(reply if reply is not None else {"status": "not_running", "socket": str(socket_path)}))
+        return 0 if reply is not None else 1
+
+    try:
+        serve(socket_path)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from test_validate_report import ROOT, home_env
+
+import analysis_cache
+import corpus
+from artifact_io import compress_file
+
+CACHE_SCRIPT = ROOT / "scripts" / "analysis_cache.py"
+
+
+class AnalysisCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_home)
+        home = mock.patch.dict(os.environ, {"HOME": self.temp_home})
+        home.start()
+        self.addCleanup(home.stop)
+        self.base_dir = Path(self.temp_home) / ".github_trending"
+        # Same seed: every report lists a prefix of the same synthetic repos.
+        self.repos = [f"{owner}/{repo}" for owner, repo in corpus.synthetic_repos(10)]
+        corpus.write_report_dir(self.base_dir / "daily" / "2026-02-01", 8, "daily", "2026-02-01")
+        corpus.write_report_dir(self.base_dir / "daily" / "2026-02-15", 5, "daily", "2026-02-15")
+        invalid = corpus.write_report_dir(self.base_dir / "daily" / "2026-02-16", 10, "daily", "2026-02-16")
+        (invalid / "report_manifest.json").write_text("{", encoding="utf-8")
+        self.source_file = Path(self.temp_home) / "source.html"
+        self.source_file.write_text(corpus.source_page(corpus.synthetic_repos(10)), encoding="utf-8")
+        self.conn = analysis_cache.open_cache()
+        self.addCleanup(self.conn.close)
+
+    def test_split_analysis_blocks(self):
+        md_text = (self.base_dir / "daily" / "2026-02-15" / "report_2026-02-15.md").read_text(encoding="utf-8")
+        blocks = analysis_cache.split_analysis_blocks(md_text)
+        self.assertEqual([(rank, repo) for rank, repo, _ in blocks], list(enumerate(self.repos[:5], start=1)))
+        for rank, repo, block in blocks:
+            self.assertTrue(block.startswith(f"### {rank}. [{repo}]"))
+            self.assertIn(block, md_text)
+            self.assertIn("* **建议**:", block)
+            self.assertNotIn("\n### ", block)
+
+    def test_fresh_analyses_use_newest_valid_report_within_max_age(self):
+        self.assertEqual(
+            analysis_cache.harvest(self.conn),
+            {"harvested": 2, "unchanged": 0, "invalid": 1, "removed": 0},
+        )
+        cached, missing = analysis_cache.fresh_analyses(self.conn, self.repos, "2026-02-17", max_age_days=7)
+        self.assertEqual([item["repo"] for item in cached], self.repos[:5])
+        self.assertTrue(all(item["cached_from"] == {"period": "daily", "date": "2026-02-15"} for item in cached))
+        self.assertEqual(missing, [{"rank": rank, "repo": self.repos[rank - 1]} for rank in range(6, 11)])
+
+        cached, _ = analysis_cache.fresh_analyses(self.conn, self.repos, "2026-02-17", max_age_days=30)
+        self.assertEqual([item["cached_from"]["date"] for item in cached], ["2026-02-15"] * 5 + ["2026-02-01"] * 3)
+        # Analyses dated after the report being generated are never reused.
+        self.assertEqual(analysis_cache.fresh_analyses(self.conn, self.repos, "2026-01-31", 30)[0], [])
+
+    def test_harvest_is_incremental(self):
+        analysis_cache.harvest(self.conn)
+        with mock.patch.object(analysis_cache, "check_existing_report", side_effect=AssertionError("gate re-ran")):
+            self.assertEqual(
+                analysis_cache.harvest(self.conn),
+                {"harvested": 0, "unchanged": 3, "invalid": 0, "removed": 0},
+            )
+
+        corpus.write_report_dir(self.base_dir / "daily" / "2026-02-16", 10, "daily", "2026-02-16")
+        shutil.rmtree(self.base_dir / "daily" / "2026-02-15")
+        md_file = self.base_dir / "daily" / "2026-02-01" / "report_2026-02-01.md"
+        md_text = md_file.read_text(encoding="utf-8")
+        md_file.write_text(md_text.replace("* **建议**:", "* **建议**", 1), encoding="utf-8")
+        self.assertEqual(
+            analysis_cache.harvest(self.conn),
+            {"harvested": 1, "unchanged": 0, "invalid": 1, "removed": 1},
+        )
+        cached, missing = analysis_cache.fresh_analyses(self.conn, self.repos, "2026-02-17", max_age_days=30)
+        self.assertEqual(len(cached), 10)
+        self.assertEqual({item["cached_from"]["date"] for item in cached}, {"2026-02-16"})
+        self.assertEqual(missing, [])
+
+    def test_harvest_reads_markdown_like_the_validator(self):
+        md_file = self.base_dir / "daily" / "2026-02-15" / "report_2026-02-15.md"
+        # A stray invalid UTF-8 byte: the validator decodes with errors="ignore" and accepts the report.
+        md_bytes = md_file.read_bytes()
+        md_file.write_bytes(md_bytes.replace("* **建议**:".encode(), b"\xff" + "* **建议**:".encode(), 1))
+        self.assertEqual(
+            analysis_cache.harvest(self.conn),
+            {"harvested": 2, "unchanged": 0, "invalid": 1, "removed": 0},
+        )
+        cached, _ = analysis_cache.fresh_analyses(self.conn, self.repos, "2026-02-17", max_age_days=7)
+        self.assertEqual([item["repo"] for item in cached], self.repos[:5])
+
+    def test_harvest_commits_in_batches(self):
+        gate = analysis_cache.check_existing_report
+        calls = []
+
+        def interrupted_gate(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return gate(**kwargs)
+
+        with mock.patch.object(analysis_cache, "HARVEST_BATCH_SIZE", 1), mock.patch.object(
+            analysis_cache, "check_existing_report", side_effect=interrupted_gate
+        ):
+            with self.assertRaises(KeyboardInterrupt):
+                analysis_cache.harvest(self.conn)
+        # The two reports validated before the interruption stay harvested.
+        self.assertEqual(
+            analysis_cache.harvest(self.conn),
+            {"harvested": 0, "unchanged": 2, "invalid": 1, "removed": 0},
+        )
+
+    def test_fresh_cli(self):
+        cmd = [sys.executable, str(CACHE_SCRIPT), "fresh", "--period", "weekly", "--date", "2026-02-17"]
+        result = subprocess.run(
+            cmd + ["--source", str(self.source_file)], capture_output=True, text=True, env=home_env(self.temp_home)
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        reply = json.loads(result.stdout)
+        self.assertEqual(reply["source_count"], 10)
+        self.assertEqual([item["repo"] for item in reply["cached"]], self.repos[:5])
+        self.assertEqual(len(reply["missing"]), 5)
+        self.assertTrue(reply["cached"][0]["analysis"].startswith(f"### 1. [{self.repos[0]}]"))
+
+        missing_source = subprocess.run(cmd, capture_output=True, text=True, env=home_env(self.temp_home))
+        self.assertEqual(missing_source.returncode, 2)
+        self.assertIn("cannot read source file", missing_source.stderr)
+
+        # A compressed source is read decompressed; a truncated one is unreadable.
+        gz_source = self.source_file.with_name("source.html.gz")
+        compress_file(self.source_file, gz_source, "gzip")
+        result = subprocess.run(
+            cmd + ["--source", str(gz_source)], capture_output=True, text=True, env=home_env(self.temp_home)
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        self.assertEqual(json.loads(result.stdout)["source_count"], 10)
+        gz_source.write_bytes(gz_source.read_bytes()[:-20])
+        truncated = subprocess.run(
+            cmd + ["--source", str(gz_source)], capture_output=True, text=True, env=home_env(self.temp_home)
+        )
+        self.assertEqual(truncated.returncode, 2)
+        self.assertIn("cannot read source file", truncated.stderr)
+
+        # Undecodable bytes are dropped as the validator drops them, so the repo still matches its analysis.
+        href = f"/{self.repos[0]}".encode()
+        self.source_file.write_bytes(self.source_file.read_bytes().replace(href, href[:2] + b"\xff" + href[2:]))
+        result = subprocess.run(
+            cmd + ["--source", str(self.source_file)], capture_output=True, text=True, env=home_env(self.temp_home)
+        )
+        self.assertEqual([item["repo"] for item in json.loads(result.stdout)["cached"]], self.repos[:5])
+
+
+if __name__ == "__main__":
+    unittest.main()
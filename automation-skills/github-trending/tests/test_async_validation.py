@@ -0,0 +1,83 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
+from test_validate_report import DATE, FIXTURES, PERIOD, stage_fixture_under_home
+
+import async_validation
+import validate_report
+from check_existing_report import check_existing_report
+
+FIXTURE_DIRS = [FIXTURES / "pass" / PERIOD / DATE, *sorted((FIXTURES / "fail").glob(f"*/{PERIOD}/{DATE}"))]
+
+
+class AsyncValidationTests(unittest.TestCase):
+    def test_results_match_sync_api(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            # Fixtures are weekly reports, so only the weekly one can pass.
+            targets = []
+            for period, fixture in zip(("weekly", "daily", "monthly"), FIXTURE_DIRS):
+                report_dir = stage_fixture_under_home(temp_home, fixture, period=period)
+                targets.append((period, DATE))
+            targets.append((PERIOD, "2026-02-18"))
+
+            expected = validate_report.validate_report_dir(report_dir, "monthly", DATE, source_sidecar=False)
+            actual = asyncio.run(
+                async_validation.validate_report_dir_async(report_dir, "monthly", DATE, source_sidecar=False)
+            )
+            self.assertEqual(actual, expected)
+            self.assertTrue(actual.errors)
+
+            expected = [check_existing_report(period, date, use_cache=False) for period, date in targets]
+            self.assertEqual([code for code, _ in expected], [0, 20, 20, 10])
+            self.assertEqual(asyncio.run(async_validation.check_existing_reports(targets, use_cache=False)), expected)
+            self.assertEqual(asyncio.run(async_validation.check_existing_report_async(*targets[1])), expected[1])
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                actual = asyncio.run(async_validation.check_existing_reports(targets, 2, executor, use_cache=False))
+            self.assertEqual(actual, expected)
+
+    def test_concurrency_limit_and_event_loop_stay_responsive(self):
+        lock = threading.Lock()
+        running = peak = 0
+
+        def slow_check(period, date, **_):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return 10, {"period": period, "date": date}
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.005)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            targets = [(PERIOD, f"2026-01-{day:02d}") for day in range(1, 11)]
+            results = await async_validation.check_existing_reports(targets, limit=3)
+            ticking.cancel()
+            return targets, results, ticks
+
+        with mock.patch.object(async_validation, "check_existing_report", slow_check):
+            targets, results, ticks = asyncio.run(main())
+        self.assertEqual([(payload["period"], payload["date"]) for _, payload in results], targets)
+        self.assertEqual(peak, 3)
+        self.assertGreater(ticks, 10)
+        with self.assertRaises(ValueError):
+            asyncio.run(async_validation.check_existing_reports([], limit=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
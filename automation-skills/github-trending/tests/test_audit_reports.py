@@ -0,0 +1,65 @@
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+from test_validate_report import DATE, FIXTURES, PERIOD, ROOT, home_env, stage_fixture_under_home
+
+AUDIT_SCRIPT = ROOT / "scripts" / "audit_reports.py"
+
+
+def run_audit(env: dict[str, str], extra_args: list[str] | None = None):
+    cmd = [sys.executable, str(AUDIT_SCRIPT), *(extra_args or [])]
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
+
+
+class AuditReportsTests(unittest.TestCase):
+    def test_audit_streams_one_line_per_directory_and_summary(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            stage_fixture_under_home(temp_home, FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE, period="monthly")
+            (Path(temp_home) / ".github_trending" / "daily" / "2026-02-18").mkdir(parents=True)
+            (Path(temp_home) / ".github_trending" / "daily" / "not-a-date").mkdir(parents=True)
+            # A manifest that is not a JSON object makes the validator raise.
+            broken = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE, period="daily")
+            (broken / "report_manifest.json").write_text("[]", encoding="utf-8")
+
+            result = run_audit(env, ["--workers", "2"])
+            self.assertEqual(result.returncode, 20, msg=result.stdout + result.stderr)
+            lines = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual(
+                [(line["period"], line["date"], line["status"]) for line in lines[:-1]],
+                [
+                    ("daily", DATE, "failed"),
+                    ("daily", "2026-02-18", "missing"),
+                    ("monthly", DATE, "existing_invalid"),
+                    ("weekly", DATE, "existing_valid"),
+                ],
+            )
+            self.assertTrue(lines[0]["errors"][0].startswith("Check failed: AttributeError: "))
+            summary = lines[-1]["summary"]
+            self.assertEqual(summary["total"], 4)
+            self.assertEqual(
+                summary["status_counts"], {"existing_invalid": 1, "existing_valid": 1, "failed": 1, "missing": 1}
+            )
+            self.assertIn("wall_time_seconds", summary)
+
+    def test_audit_period_filter(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE, period="monthly")
+
+            result = run_audit(env, ["--period", PERIOD, "--workers", "1"])
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            lines = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(lines[0]["status"], "existing_valid")
+            self.assertEqual(lines[-1]["summary"]["status_counts"], {"existing_valid": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
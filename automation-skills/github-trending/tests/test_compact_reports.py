@@ -0,0 +1,158 @@
+import datetime
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from test_validate_report import (
+    DATE,
+    FIXTURES,
+    PERIOD,
+    ROOT,
+    home_env,
+    run_existing_check,
+    stage_fixture_under_home,
+)
+
+import artifact_io
+import compact_reports
+import corpus
+import validate_report
+import validation_budget
+import validation_cache
+from check_existing_report import build_paths
+
+COMPACT_SCRIPT = ROOT / "scripts" / "compact_reports.py"
+ARTIFACTS = ("original_trending.html", f"report_{DATE}.md", f"report_{DATE}.html", "report_manifest.json")
+
+
+def validate(report_dir, **kwargs):
+    return validate_report.validate_report_dir(report_dir, PERIOD, DATE, html_backend="stdlib", **kwargs).errors
+
+
+def compress_in_place(path: Path) -> Path:
+    target = path.with_name(path.name + ".gz")
+    artifact_io.compress_file(path, target, "gzip")
+    path.unlink()
+    return target
+
+
+class CompressedArtifactTests(unittest.TestCase):
+    def test_compressed_artifacts_validate_like_plain_ones(self):
+        fixtures = [FIXTURES / "pass" / PERIOD / DATE]
+        fixtures += sorted((FIXTURES / "fail").glob(f"*/{PERIOD}/{DATE}"))
+        modes = [{}, {"streaming": True, "chunk_size": 7}, {"fail_fast": True}, {"incremental": True}]
+        for fixture in fixtures:
+            for name in ARTIFACTS:
+                with self.subTest(fixture=fixture.parts[-3], artifact=name), tempfile.TemporaryDirectory() as temp_home:
+                    with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                        report_dir = stage_fixture_under_home(temp_home, fixture)
+                        expected = [validate(report_dir, **mode) for mode in modes]
+                        compress_in_place(report_dir / name)
+                        self.assertEqual([validate(report_dir, **mode) for mode in modes], expected)
+
+    def test_plain_file_wins_and_missing_codec_is_reported(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            source = report_dir / "original_trending.html"
+            (report_dir / "original_trending.html.gz").write_bytes(b"not gzip")
+            self.assertEqual(build_paths(PERIOD, DATE)["source_file"], source)
+            self.assertEqual(validate(report_dir), [])
+
+            (report_dir / "original_trending.html.gz").unlink()
+            zst = source.with_name(source.name + ".zst")
+            source.rename(zst)
+            self.assertEqual(build_paths(PERIOD, DATE)["source_file"], zst)
+            with mock.patch.object(artifact_io, "_zstd", return_value=None):
+                self.assertEqual(
+                    validate(report_dir),
+                    [f"Cannot read {zst}: zstd support requires Python 3.14+ or the zstandard package."],
+                )
+
+    def test_truncated_artifact_is_a_validation_error(self):
+        modes = [
+            {},
+            {"streaming": True, "chunk_size": 7},
+            {"fail_fast": True},
+            {"incremental": True},
+            {"parallel": True},
+            {"budget": validation_budget.ValidationBudget()},
+        ]
+        for name in ARTIFACTS:
+            with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+                report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+                compressed = compress_in_place(report_dir / name)
+                compressed.write_bytes(compressed.read_bytes()[:-30])
+                for mode in modes:
+                    with self.subTest(artifact=name, mode=sorted(mode)):
+                        errors = validate(report_dir, source_sidecar=False, **mode)
+                        self.assertTrue(any(error.startswith(f"Cannot read {compressed}: ") for error in errors), errors)
+                result = run_existing_check(PERIOD, DATE, env=home_env(temp_home))
+                self.assertEqual(result.returncode, 20, msg=result.stdout + result.stderr)
+                self.assertEqual(json.loads(result.stdout)["status"], "existing_invalid")
+
+    def test_gate_finds_compressed_html_report(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            compress_in_place(report_dir / f"report_{DATE}.html")
+            result = run_existing_check(PERIOD, DATE, env=home_env(temp_home))
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertEqual(json.loads(result.stdout)["html_file"], str(report_dir / f"report_{DATE}.html.gz"))
+
+
+class CompactReportsTests(unittest.TestCase):
+    def test_compact_report_replaces_source_and_keeps_gate_cached(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = corpus.write_report_dir(
+                Path(temp_home) / ".github_trending" / PERIOD / DATE, 200, PERIOD, DATE
+            )
+            source_text = (report_dir / "original_trending.html").read_text(encoding="utf-8")
+
+            payload = compact_reports.compact_report(PERIOD, DATE)
+            self.assertEqual(payload["status"], "compacted", msg=payload)
+            self.assertFalse((report_dir / "original_trending.html").exists())
+            compressed = report_dir / "original_trending.html.gz"
+            self.assertEqual(artifact_io.read_artifact_text(compressed), source_text)
+            self.assertLess(compressed.stat().st_size * 5, len(source_text.encode()))
+            self.assertLess(payload["bytes_after"], payload["bytes_before"])
+            self.assertEqual(validation_cache.load_cached_result(build_paths(PERIOD, DATE), "stdlib")[0], 0)
+
+            self.assertEqual(compact_reports.compact_report(PERIOD, DATE)["status"], "already_compact")
+
+    def test_failed_gate_after_compaction_restores_the_original(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            source_bytes = (report_dir / "original_trending.html").read_bytes()
+            gate = compact_reports.check_existing_report
+            replies = iter([gate(PERIOD, DATE), (20, {"errors": ["boom"]})])
+            with mock.patch.object(compact_reports, "check_existing_report", side_effect=lambda **_: next(replies)):
+                payload = compact_reports.compact_report(PERIOD, DATE)
+            self.assertEqual(payload["status"], "error")
+            self.assertEqual((report_dir / "original_trending.html").read_bytes(), source_bytes)
+            self.assertFalse((report_dir / "original_trending.html.gz").exists())
+
+    def test_cli_skips_recent_and_invalid_reports(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            stage_fixture_under_home(temp_home, FIXTURES / "fail" / "count_mismatch" / PERIOD / DATE, period="monthly")
+            today = datetime.date.today().isoformat()
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE, period="daily", date=today)
+
+            result = subprocess.run(
+                [sys.executable, str(COMPACT_SCRIPT)], capture_output=True, text=True, env=home_env(temp_home)
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+            lines = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual(
+                [(line["period"], line["status"]) for line in lines[:-1]],
+                [("daily", "recent"), ("monthly", "invalid"), ("weekly", "compacted")],
+            )
+            self.assertEqual(lines[-1]["summary"]["status_counts"], {"compacted": 1, "invalid": 1, "recent": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
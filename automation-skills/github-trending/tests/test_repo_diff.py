@@ -0,0 +1,82 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from test_validate_report import DATE, FIXTURES, PERIOD, stage_fixture_under_home
+
+import repo_diff
+import validate_report
+from check_existing_report import check_existing_report
+
+
+def lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for item in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if item == other else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def apply_edits(expected, edits):
+    """Rebuild ``actual`` from ``expected`` and the edit script alone."""
+    removed = {edit.expected_rank for edit in edits if edit.op != "insert"}
+    kept = iter(repo for rank, repo in enumerate(expected, start=1) if rank not in removed)
+    placed = {edit.actual_rank: edit.repo for edit in edits if edit.op != "delete"}
+    size = len(expected) - len(removed) + len(placed)
+    return [placed[rank] if rank in placed else next(kept) for rank in range(1, size + 1)]
+
+
+class RepoDiffTests(unittest.TestCase):
+    def test_edit_script_is_minimal_and_rebuilds_actual(self):
+        rng = random.Random(0)
+        for step in range(600):
+            alphabet = rng.choice([3, 8, 40])
+            expected = [f"o/{rng.randrange(alphabet)}" for _ in range(rng.randrange(16))]
+            actual = [f"o/{rng.randrange(alphabet)}" for _ in range(rng.randrange(16))]
+            for max_edits in (repo_diff.MYERS_MAX_EDITS, 0, 3):
+                with self.subTest(step=step, max_edits=max_edits):
+                    with mock.patch.object(repo_diff, "MYERS_MAX_EDITS", max_edits):
+                        edits = repo_diff.diff_repos(expected, actual)
+                    removed = sum(edit.op != "insert" for edit in edits)
+                    self.assertEqual(len(expected) - removed, lcs_length(expected, actual))
+                    self.assertEqual(apply_edits(expected, edits), actual)
+
+    def test_large_similar_lists(self):
+        source = [f"owner{index}/repo{index}" for index in range(5000)]
+        shifted = ["new/repo", *source[:-1]]
+        self.assertEqual(
+            repo_diff.diff_repos(source, shifted),
+            [repo_diff.RepoEdit("delete", source[-1], 5000, None), repo_diff.RepoEdit("insert", "new/repo", None, 1)],
+        )
+        moved = source[:10] + [source[4000]] + source[10:4000] + source[4001:]
+        self.assertEqual(repo_diff.diff_repos(source, moved), [repo_diff.RepoEdit("move", source[4000], 4001, 11)])
+        shuffled = random.Random(1).sample(source, len(source))
+        edits = repo_diff.diff_repos(source, shuffled)
+        self.assertEqual(apply_edits(source, edits), shuffled)
+        self.assertTrue(all(edit.op == "move" for edit in edits))
+
+    def test_mismatch_message_and_structured_diffs(self):
+        message = validate_report.describe_repo_diff(["a/a", "b/b", "c/c", "d/d"], ["d/d", "a/a", "b/b", "x/x"])
+        self.assertEqual(
+            message, "first_mismatch_at=1 expected=a/a actual=d/d; missing=['c/c']; extra=['x/x']; moved=['d/d #4->#1']"
+        )
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE)
+            results = [
+                validate_report.validate_report_dir(report_dir, PERIOD, DATE, **mode)
+                for mode in ({}, {"fail_fast": True}, {"incremental": True}, {"incremental": True})
+            ]
+            self.assertTrue(results[0].repo_diffs)
+            for result in results[1:]:
+                self.assertEqual(result.repo_diffs, results[0].repo_diffs)
+            exit_code, payload = check_existing_report(PERIOD, DATE)
+            self.assertEqual(exit_code, 20)
+            self.assertEqual(payload["repo_diffs"], results[0].repo_diffs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from test_validate_report import DATE, FIXTURES, PERIOD, ROOT, VALIDATE_SCRIPT, home_env, stage_fixture_under_home
+
+import report_watcher
+
+ARTIFACTS = ("original_trending.html", f"report_{DATE}.md", f"report_{DATE}.html", "report_manifest.json")
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class ReportWatcherTests(unittest.TestCase):
+    def run_watch_scenario(self, make_watcher):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_dir = Path(temp_dir)
+            paths = [report_dir / name for name in ARTIFACTS]
+            for path in paths:
+                path.write_text("initial", encoding="utf-8")
+            watcher = make_watcher(report_dir, paths)
+            runs = []
+            thread = threading.Thread(
+                target=report_watcher.watch,
+                args=(watcher, paths, lambda: runs.append(time.monotonic())),
+                kwargs={"debounce": 0.3, "max_runs": 3},
+                daemon=True,
+            )
+            thread.start()
+            try:
+                self.assertTrue(wait_for(lambda: len(runs) == 1))
+
+                # Files other than the artifacts never trigger a run.
+                (report_dir / ".validation_state.json.123.tmp").write_text("x", encoding="utf-8")
+                time.sleep(0.8)
+                self.assertEqual(len(runs), 1)
+
+                # A burst of writes is one revalidation, after the burst.
+                for index in range(5):
+                    if index:
+                        time.sleep(0.05)
+                    paths[index % 4].write_text(f"burst {index}", encoding="utf-8")
+                burst_end = time.monotonic()
+                self.assertTrue(wait_for(lambda: len(runs) == 2))
+                self.assertGreaterEqual(runs[1] - burst_end, 0.25)
+                time.sleep(0.8)
+                self.assertEqual(len(runs), 2)
+
+                paths[2].write_text("final", encoding="utf-8")
+                thread.join(timeout=10)
+                self.assertFalse(thread.is_alive())
+                self.assertEqual(len(runs), 3)
+            finally:
+                watcher.close()
+
+    def test_inotify_watcher(self):
+        try:
+            report_watcher.InotifyWatcher(Path(tempfile.gettempdir()), set()).close()
+        except OSError:
+            self.skipTest("inotify unavailable")
+        self.run_watch_scenario(
+            lambda directory, paths: report_watcher.InotifyWatcher(directory, {path.name for path in paths})
+        )
+
+    def test_polling_watcher(self):
+        self.run_watch_scenario(lambda directory, paths: report_watcher.PollingWatcher(paths, interval=0.05))
+
+    def test_missing_directory_falls_back_to_polling(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            missing = Path(temp_dir) / "not-yet"
+            watcher = report_watcher.make_watcher(missing, [missing / name for name in ARTIFACTS])
+            self.assertEqual(watcher.kind, "polling")
+
+    def test_watch_cli_prints_a_result_per_change(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            cmd = [sys.executable, str(VALIDATE_SCRIPT), "--report-dir", str(report_dir), "--period", PERIOD]
+            cmd += ["--date", DATE, "--watch", "--debounce", "0.1"]
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, cwd=ROOT, env=home_env(temp_home)
+            )
+            lines: queue.Queue[str] = queue.Queue()
+            threading.Thread(target=lambda: [lines.put(line) for line in process.stdout], daemon=True).start()
+
+            def next_result() -> str:
+                while True:
+                    line = lines.get(timeout=10)
+                    if line.startswith("VALIDATION "):
+                        return line.strip()
+
+            try:
+                self.assertEqual(next_result(), "VALIDATION PASSED")
+                html_file = report_dir / f"report_{DATE}.html"
+                html_text = html_file.read_text(encoding="utf-8")
+                html_file.write_text(html_text.replace('class="suggestion-box"', 'class="note"', 1), encoding="utf-8")
+                self.assertEqual(next_result(), "VALIDATION FAILED")
+                html_file.write_text(html_text, encoding="utf-8")
+                self.assertEqual(next_result(), "VALIDATION PASSED")
+            finally:
+                process.send_signal(signal.SIGINT)
+                process.wait(timeout=10)
+                process.stderr.close()
+            self.assertEqual(process.returncode, 0)
+            self.assertFalse((report_dir / ".validation_state.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
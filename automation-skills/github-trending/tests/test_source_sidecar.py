@@ -0,0 +1,106 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from test_validate_report import (
+    DATE,
+    FIXTURES,
+    PERIOD,
+    home_env,
+    run_validator,
+    stage_fixture_under_home,
+)
+
+import corpus
+import source_sidecar
+import validate_report
+
+MODES = [{}, {"streaming": True, "chunk_size": 11}, {"fail_fast": True}, {"incremental": True}]
+
+
+def validate(report_dir, **kwargs):
+    return validate_report.validate_report_dir(report_dir, PERIOD, DATE, html_backend="stdlib", **kwargs).errors
+
+
+def no_source_parse():
+    parse_error = AssertionError("source page re-parsed")
+    return mock.patch.multiple(
+        validate_report,
+        extract_source_repos=mock.Mock(side_effect=parse_error),
+        extract_source_repos_streaming=mock.Mock(side_effect=parse_error),
+        extract_source_repos_mapped=mock.Mock(side_effect=parse_error),
+    )
+
+
+class SourceSidecarTests(unittest.TestCase):
+    def test_unchanged_source_is_not_parsed_again(self):
+        fixtures = [FIXTURES / "pass" / PERIOD / DATE, *sorted((FIXTURES / "fail").glob(f"*/{PERIOD}/{DATE}"))]
+        for fixture in fixtures:
+            for mode in MODES:
+                with self.subTest(fixture=fixture.parts[-3], mode=mode), tempfile.TemporaryDirectory() as temp_home:
+                    with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                        report_dir = stage_fixture_under_home(temp_home, fixture)
+                        state_file = report_dir / ".validation_state.json"
+                        expected = validate(report_dir, source_sidecar=False, **mode)
+                        self.assertFalse((report_dir / source_sidecar.SIDECAR_NAME).exists())
+                        state_file.unlink(missing_ok=True)
+                        self.assertEqual(validate(report_dir, **mode), expected)
+                        if not mode.get("fail_fast"):
+                            # Fail-fast stops before the source page when an earlier stage fails.
+                            self.assertTrue((report_dir / source_sidecar.SIDECAR_NAME).exists())
+                        state_file.unlink(missing_ok=True)
+                        with no_source_parse():
+                            self.assertEqual(validate(report_dir, **mode), expected)
+
+    def test_sidecar_matches_full_parse_across_source_edits(self):
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            corpus.write_report_dir(report_dir, 12, PERIOD, DATE)
+            source_file = report_dir / "original_trending.html"
+            for step in range(30):
+                text = source_file.read_text(encoding="utf-8")
+                start = rng.randrange(len(text) + 1)
+                snippet = rng.choice(["", "<article class=\"Box-row\">", "</div>", '<h2><a href="/x/y">', "\n"])
+                source_file.write_text(text[:start] + snippet + text[start + rng.randint(0, 200) :], encoding="utf-8")
+                with self.subTest(step=step):
+                    self.assertEqual(validate(report_dir), validate(report_dir, source_sidecar=False))
+                    self.assertEqual(validate(report_dir), validate(report_dir, source_sidecar=False))
+
+    def test_sidecar_for_other_content_extractor_or_garbage_is_ignored(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            source_file = report_dir / "original_trending.html"
+            validate(report_dir)
+            digest = source_sidecar.source_digest(source_file)
+            stored = source_sidecar.load_sidecar(source_file, "stdlib", digest)
+            self.assertEqual(stored, (validate_report.extract_source_repos(source_file.read_text(), "stdlib"), True))
+
+            self.assertIsNone(source_sidecar.load_sidecar(source_file, "stdlib", "0" * 64))
+            self.assertIsNone(source_sidecar.load_sidecar(source_file, "lxml", digest))
+            with mock.patch.object(source_sidecar, "extractor_version", return_value="changed"):
+                self.assertIsNone(source_sidecar.load_sidecar(source_file, "stdlib", digest))
+            sidecar = report_dir / source_sidecar.SIDECAR_NAME
+            data = json.loads(sidecar.read_text(encoding="utf-8"))
+            sidecar.write_text(json.dumps({**data, "repos": "owner/repo"}), encoding="utf-8")
+            self.assertIsNone(source_sidecar.load_sidecar(source_file, "stdlib", digest))
+            sidecar.write_text("{", encoding="utf-8")
+            self.assertIsNone(source_sidecar.load_sidecar(source_file, "stdlib", digest))
+            self.assertEqual(validate(report_dir), [])
+
+    def test_cli_flag_bypasses_sidecar(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            env = home_env(temp_home)
+            result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--no-source-sidecar"])
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertFalse((report_dir / source_sidecar.SIDECAR_NAME).exists())
+            run_validator(report_dir, PERIOD, DATE, env=env)
+            self.assertTrue((report_dir / source_sidecar.SIDECAR_NAME).exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
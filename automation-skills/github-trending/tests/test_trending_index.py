@@ -0,0 +1,105 @@
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_validate_report import ROOT, home_env
+
+import corpus
+import trending_index
+
+INDEX_SCRIPT = ROOT / "scripts" / "trending_index.py"
+REPO_POOL = [f"owner{index}/repo{index}" for index in range(40)]
+
+
+def write_manifest(base_dir: Path, period: str, date: str, repos: list[str]) -> Path:
+    report_dir = base_dir / period / date
+    report_dir.mkdir(parents=True, exist_ok=True)
+    manifest = corpus.manifest([tuple(repo.split("/")) for repo in repos], period, date)
+    path = report_dir / "report_manifest.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+class TrendingIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.temp_home = tempfile.mkdtemp()
+        self.base_dir = Path(self.temp_home) / ".github_trending"
+        self.addCleanup(shutil.rmtree, self.temp_home)
+        rng = random.Random(0)
+        self.reports = {}
+        for day in range(1, 29):
+            date = f"2026-02-{day:02d}"
+            self.reports[("daily", date)] = rng.sample(REPO_POOL, 10)
+            write_manifest(self.base_dir, "daily", date, self.reports[("daily", date)])
+        self.reports[("weekly", "2026-02-17")] = REPO_POOL[:25]
+        write_manifest(self.base_dir, "weekly", "2026-02-17", REPO_POOL[:25])
+        self.conn = trending_index.open_index(self.base_dir / trending_index.INDEX_FILE_NAME)
+        self.addCleanup(self.conn.close)
+
+    def test_queries_match_manifests(self):
+        self.assertEqual(trending_index.ingest(self.conn, self.base_dir)["indexed"], 29)
+        daily = {date: repos for (period, date), repos in self.reports.items() if period == "daily"}
+        for repo in REPO_POOL[:10]:
+            with self.subTest(repo=repo):
+                expected = sum(repo in repos for date, repos in daily.items() if "2026-02-05" <= date <= "2026-02-20")
+                days = trending_index.trending_days(self.conn, repo, "daily", "2026-02-05", "2026-02-20")
+                self.assertEqual(days, expected)
+                history = trending_index.repo_history(self.conn, repo)
+                expected_history = sorted(
+                    (date, period, repos.index(repo) + 1)
+                    for (period, date), repos in self.reports.items()
+                    if repo in repos
+                )
+                self.assertEqual([(row["date"], row["period"], row["rank"]) for row in history], expected_history)
+
+        seen_before = {repo for date, repos in daily.items() if date < "2026-02-10" for repo in repos}
+        expected_new = {repo for date, repos in daily.items() if date >= "2026-02-10" for repo in repos} - seen_before
+        new = trending_index.new_repos(self.conn, "daily", "2026-02-10")
+        self.assertEqual({row["repo"] for row in new}, expected_new)
+        self.assertTrue(all(row["first_date"] >= "2026-02-10" for row in new))
+
+    def test_ingest_is_incremental(self):
+        trending_index.ingest(self.conn, self.base_dir)
+        self.assertEqual(
+            trending_index.ingest(self.conn, self.base_dir),
+            {"indexed": 0, "unchanged": 29, "removed": 0, "unreadable": 0},
+        )
+
+        write_manifest(self.base_dir, "daily", "2026-02-01", ["new/arrival"])
+        touched = write_manifest(self.base_dir, "daily", "2026-02-02", self.reports[("daily", "2026-02-02")])
+        os.utime(touched, ns=(0, 10**18))
+        shutil.rmtree(self.base_dir / "daily" / "2026-02-03")
+        (self.base_dir / "daily" / "2026-02-04" / "report_manifest.json").write_text("{", encoding="utf-8")
+        # Nested deeper than the recursion limit: json.loads raises RecursionError.
+        (self.base_dir / "daily" / "2026-02-05" / "report_manifest.json").write_text("[" * 100000, encoding="utf-8")
+        counts = trending_index.ingest(self.conn, self.base_dir)
+        self.assertEqual(counts, {"indexed": 1, "unchanged": 25, "removed": 1, "unreadable": 2})
+        self.assertEqual(trending_index.repo_history(self.conn, "new/arrival")[0]["date"], "2026-02-01")
+        dates = {row[0] for row in self.conn.execute("SELECT DISTINCT date FROM entries WHERE period = 'daily'")}
+        self.assertNotIn("2026-02-03", dates)
+        self.assertNotIn("2026-02-04", dates)
+        self.assertNotIn("2026-02-05", dates)
+
+    def test_cli(self):
+        env = home_env(self.temp_home)
+        ingest = subprocess.run([sys.executable, str(INDEX_SCRIPT), "ingest"], capture_output=True, text=True, env=env)
+        self.assertEqual(ingest.returncode, 0, msg=ingest.stderr)
+        self.assertEqual(json.loads(ingest.stdout)["indexed"], 29)
+
+        repo = self.reports[("weekly", "2026-02-17")][0]
+        cmd = [sys.executable, str(INDEX_SCRIPT), "days", repo, "--period", "weekly", "--since", "2026-02-01"]
+        days = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        self.assertEqual(json.loads(days.stdout)["days"], 1)
+
+        bad_date = subprocess.run(cmd[:-1] + ["02/01/2026"], capture_output=True, text=True, env=env)
+        self.assertEqual(bad_date.returncode, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
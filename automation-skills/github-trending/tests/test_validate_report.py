@@ -1,13 +1,22 @@
 import json
 import os
+import random
 import shutil
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 import unittest
+from unittest import mock
 
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import corpus  # noqa: E402
+import html_backends  # noqa: E402
+import validate_report  # noqa: E402
+
 VALIDATE_SCRIPT = ROOT / "scripts" / "validate_report.py"
 CHECK_SCRIPT = ROOT / "scripts" / "check_existing_report.py"
 FIXTURES = ROOT / "tests" / "fixtures"
@@ -21,6 +30,7 @@ def run_validator(
     date: str,
     allow_small_source: bool = False,
     env: dict[str, str] | None = None,
+    extra_args: list[str] | None = None,
 ):
     cmd = [
         sys.executable,
@@ -34,6 +44,7 @@ def run_validator(
     ]
     if allow_small_source:
         cmd.append("--allow-small-source")
+    cmd.extend(extra_args or [])
     return subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
 
 
@@ -42,6 +53,7 @@ def run_existing_check(
     date: str,
     allow_small_source: bool = False,
     env: dict[str, str] | None = None,
+    extra_args: list[str] | None = None,
 ):
     cmd = [
         sys.executable,
@@ -53,6 +65,7 @@ def run_existing_check(
     ]
     if allow_small_source:
         cmd.append("--allow-small-source")
+    cmd.extend(extra_args or [])
     return subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
 
 
@@ -179,6 +192,616 @@ class ValidateReportTests(unittest.TestCase):
             self.assertEqual(Path(payload["base_dir"]), expected_base_dir)
             self.assertEqual(payload["status"], "missing")
 
+    def test_check_existing_report_missing_skips_cache_and_validator_imports(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            cmd = [sys.executable, "-X", "importtime", str(CHECK_SCRIPT), "--period=weekly", "--date", "2026-02-18"]
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
+            self.assertEqual(result.returncode, 10, msg=result.stdout + result.stderr)
+            for module in ("validate_report", "validation_cache"):
+                self.assertNotRegex(result.stderr, rf"(?m)\|\s+{module}$")
+            with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                import check_existing_report
+
+                _, expected_payload = check_existing_report.check_existing_report(PERIOD, "2026-02-18")
+            self.assertEqual(result.stdout.strip(), json.dumps(expected_payload, ensure_ascii=False))
+            # Abbreviated and "=" forms parse like the full options.
+            for args in (["--per", "weekly", "--date=2026-02-18"], ["--date", "2026-02-18", "--period", "weekly"]):
+                with self.subTest(args=args):
+                    result = subprocess.run(
+                        [sys.executable, str(CHECK_SCRIPT), *args], capture_output=True, text=True, cwd=ROOT, env=env
+                    )
+                    self.assertEqual(result.returncode, 10, msg=result.stderr)
+                    self.assertEqual(result.stdout.strip(), json.dumps(expected_payload, ensure_ascii=False))
+
+    def test_check_report_targets_match_single_gate(self):
+        import gzip
+
+        import check_existing_report
+
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            stage_fixture_under_home(temp_home, FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE, "daily")
+            # Incomplete: no Markdown report, manifest stored gzip-compressed.
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE, "monthly")
+            (report_dir / f"report_{DATE}.md").unlink()
+            manifest = report_dir / "report_manifest.json"
+            Path(f"{manifest}.gz").write_bytes(gzip.compress(manifest.read_bytes()))
+            manifest.unlink()
+            # No HTML report, and a stray file where a date directory would be.
+            (report_dir.parent / "2026-02-16").mkdir()
+            (report_dir.parent / "2026-02-16" / "original_trending.html").write_text("<html></html>", encoding="utf-8")
+            (Path(temp_home) / ".github_trending" / PERIOD / "2026-02-18").write_text("", encoding="utf-8")
+
+            periods, dates = ["monthly", PERIOD, "daily"], ["2026-02-16", DATE, "2026-02-18"]
+            expected = [
+                check_existing_report.check_existing_report(period, date, use_cache=False)
+                for period in periods
+                for date in dates
+            ]
+            with mock.patch.object(
+                check_existing_report, "check_existing_report", wraps=check_existing_report.check_existing_report
+            ) as gate:
+                actual = list(check_existing_report.check_report_targets(periods, dates, use_cache=False))
+            self.assertEqual(actual, expected)
+            self.assertEqual([code for code, _ in actual], [10, 20, 10, 10, 0, 10, 10, 20, 10])
+            self.assertEqual(actual[1][1]["errors"], [f"Missing required file: {report_dir.resolve()}/report_{DATE}.md."])
+            self.assertEqual(sorted(call.args[:2] for call in gate.call_args_list), [("daily", DATE), (PERIOD, DATE)])
+
+    def test_check_existing_report_range_cli(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            args = ["--period", PERIOD, "--period", "daily", "--date-range", f"2026-02-16..{DATE}"]
+            cmd = [sys.executable, str(CHECK_SCRIPT), *args]
+            result = subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
+            self.assertEqual(result.returncode, 10, msg=result.stdout + result.stderr)
+            lines = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual(
+                [(line["period"], line["date"], line["status"]) for line in lines[:-1]],
+                [
+                    (PERIOD, "2026-02-16", "missing"),
+                    (PERIOD, DATE, "existing_valid"),
+                    ("daily", "2026-02-16", "missing"),
+                    ("daily", DATE, "missing"),
+                ],
+            )
+            summary = lines[-1]["summary"]
+            self.assertEqual(summary["status_counts"], {"missing": 3, "existing_valid": 1})
+            self.assertEqual(summary["generate"], [f"{PERIOD}/2026-02-16", "daily/2026-02-16", f"daily/{DATE}"])
+
+            result = subprocess.run([*cmd, "--output", "aggregate"], capture_output=True, text=True, cwd=ROOT, env=env)
+            self.assertEqual(result.returncode, 10, msg=result.stdout + result.stderr)
+            self.assertEqual(json.loads(result.stdout), {"summary": summary, "targets": lines[:-1]})
+
+            result = run_existing_check(PERIOD, DATE, env=env, extra_args=["--output", "jsonl"])
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertEqual(len(result.stdout.splitlines()), 2)
+
+            bad_range = [sys.executable, str(CHECK_SCRIPT), "--period", PERIOD, "--date-range", f"{DATE}..2026-02-16"]
+            result = subprocess.run(bad_range, capture_output=True, text=True, cwd=ROOT, env=env)
+            self.assertEqual(result.returncode, 2)
+            self.assertIn("--date-range", result.stderr)
+
+
+class MarkdownScannerTests(unittest.TestCase):
+    def test_multiline_field_and_tag_semantics(self):
+        md_text = "\n".join(
+            [
+                "### 1. [o/r](https://github.com/o/r)",
+                "`tag",
+                "`",
+                "*",
+                "  **是什么**: continues after a bare bullet",
+                "* **作用**:",
+                "",
+                "  value two lines down",
+                "* **效果**: x",
+                "* **建议**: y",
+                "* **项目分析**: z",
+                "### 2. [a/b](https://github.com/a/b/)",
+                "no tags here",
+                "* **是什么**: x",
+                "* **作用**:x",
+                "* **效果**: x",
+                "* **项目分析**: x",
+                "* **建议**:",
+            ]
+        )
+        result = validate_report.ValidationResult()
+        entries = validate_report.parse_markdown_entries(md_text, result)
+        self.assertEqual(
+            entries,
+            [
+                validate_report.MarkdownEntry(rank=1, repo="o/r", url="https://github.com/o/r"),
+                validate_report.MarkdownEntry(rank=2, repo="a/b", url="https://github.com/a/b"),
+            ],
+        )
+        self.assertEqual(
+            result.errors,
+            [
+                "Markdown repo #1 (o/r) fields are out of order. Expected: 是什么 -> 作用 -> 效果 -> 项目分析 -> 建议.",
+                "Markdown repo #2 (a/b) is missing tags line.",
+                "Markdown repo #2 (a/b) is missing required field: 作用.",
+                "Markdown repo #2 (a/b) is missing required field: 建议.",
+            ],
+        )
+
+    def test_no_headings_and_rank_sequence(self):
+        result = validate_report.ValidationResult()
+        self.assertEqual(validate_report.parse_markdown_entries("# title\n## 🚀 热门项目详细分析\n", result), [])
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("no valid repo headings", result.errors[0])
+
+        result = validate_report.ValidationResult()
+        block = "`t`\n* **是什么**: a\n* **作用**: a\n* **效果**: a\n* **项目分析**: a\n* **建议**: a\n"
+        md_text = "### 2. [a/b](https://github.com/a/b)\n" + block + "### 1. [c/d](https://github.com/c/d)\n" + block
+        validate_report.parse_markdown_entries(md_text, result)
+        self.assertEqual(result.errors, ["Markdown ranking must be sequential 1..N, got: [2, 1]."])
+
+
+class StreamingValidationTests(unittest.TestCase):
+    FIXTURE_DIRS = [
+        FIXTURES / "pass" / PERIOD / DATE,
+        FIXTURES / "fail" / "count_mismatch" / PERIOD / DATE,
+        FIXTURES / "fail" / "html_structure" / PERIOD / DATE,
+        FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE,
+    ]
+
+    def test_streaming_errors_match_in_memory_mode(self):
+        for fixture_dir in self.FIXTURE_DIRS:
+            with self.subTest(fixture=fixture_dir.parent.parent.name), tempfile.TemporaryDirectory() as temp_home:
+                report_dir = stage_fixture_under_home(temp_home, fixture_dir)
+                with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                    expected = validate_report.validate_report_dir(report_dir, PERIOD, DATE)
+                    for chunk_size in (1, 7, 4096):
+                        actual = validate_report.validate_report_dir(
+                            report_dir, PERIOD, DATE, streaming=True, chunk_size=chunk_size
+                        )
+                        self.assertEqual(actual.errors, expected.errors)
+
+    def test_streaming_h2_fallback_matches_regex(self):
+        source_html = (
+            "<html><body>\n<h2 class=\"h3\">\n  <a data-x=\"1\" href=\"/owner1/repo1\">owner1</a></h2>\n"
+            "<H2><A href=\"/owner2/repo2\">owner2</A></H2>\n<h2><span></span><a href=\"/skip/me\"></a></h2>\n"
+        )
+        expected = validate_report.extract_source_repos(source_html)
+        self.assertEqual(expected, ["owner1/repo1", "owner2/repo2"])
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir) / "original_trending.html"
+            source_file.write_text(source_html, encoding="utf-8")
+            for chunk_size in (1, 5, 4096):
+                repos, has_content = validate_report.extract_source_repos_streaming(source_file, chunk_size)
+                self.assertEqual(repos, expected)
+                self.assertTrue(has_content)
+
+    def test_streaming_cli_flag(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            result = run_validator(
+                report_dir, period=PERIOD, date=DATE, env=env, extra_args=["--streaming", "--chunk-size", "16"]
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertIn("VALIDATION PASSED", result.stdout)
+
+
+class SyntheticCorpusTests(unittest.TestCase):
+    def test_generated_report_dir_is_valid(self):
+        for period, repo_count in (("daily", 1), ("weekly", 40)):
+            with self.subTest(period=period, repos=repo_count), tempfile.TemporaryDirectory() as temp_home:
+                report_dir = corpus.write_report_dir(
+                    Path(temp_home) / ".github_trending" / period / DATE, repo_count, period, DATE
+                )
+                with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                    result = validate_report.validate_report_dir(report_dir, period, DATE)
+                self.assertEqual(result.errors, [])
+                manifest = json.loads((report_dir / "report_manifest.json").read_text(encoding="utf-8"))
+                self.assertEqual(manifest["reported_item_count"], repo_count)
+
+
+class SourceExtractionShortcutTests(unittest.TestCase):
+    ROW = '<article class="Box-row"><a href="/sponsors/{0}">s</a><h2><a href="/{0}/{0}">{0}</a></h2></article>\n'
+    PAGES = {
+        "plain": "<html><body><nav><a href='/x/nav'>n</a></nav><div class='Box'>{rows}</div><footer></footer>",
+        "decoys_before_list": (
+            "<!-- <article class='Box-row'><a href='/c/c'>c</a></article> -->"
+            "<script>var t = '<article class=\"Box-row\"><a href=\"/s/s\">';</script>"
+            "<STYLE>.Box-row {{}}</STYLE><script/><div class='Box'>{rows}</div>"
+        ),
+        "rows_after_container": "<div class='Box'>{rows}</div><div><article class='Box-row'><a href='/late/late'>l</a></article></div>",
+        "box_row_text_after_container": "<div class='Box'>{rows}</div><p>Box-row</p>",
+        "tag_inside_attribute": "<div title='<article class=Box-row>'><div class='Box'>{rows}</div></div>",
+        "h2_fallback": "<h2 class='h3'><a href=\"/fallback/repo\">f</a></h2>",
+    }
+
+    def test_shortcuts_match_full_parse(self):
+        rows = "".join(self.ROW.format(f"r{index}") for index in range(5))
+        for name, template in self.PAGES.items():
+            source_html = template.format(rows=rows)
+            for backend in html_backends.available_backends():
+                with self.subTest(page=name, backend=backend):
+                    expected = validate_report.dedupe_in_order(
+                        validate_report.parse_source_chunks([source_html], backend, shortcuts=False)
+                    ) or validate_report.H2_FALLBACK_RE.findall(source_html)
+                    self.assertEqual(validate_report.extract_source_repos(source_html, backend), expected)
+                    with tempfile.TemporaryDirectory() as temp_dir:
+                        source_file = Path(temp_dir) / "original_trending.html"
+                        source_file.write_text(source_html, encoding="utf-8")
+                        for chunk_size in (1, 13, 4096):
+                            repos, _ = validate_report.extract_source_repos_streaming(source_file, chunk_size, backend)
+                            self.assertEqual(repos, expected)
+
+    def test_early_stop_outcomes(self):
+        rows = "".join(self.ROW.format(f"r{index}") for index in range(3))
+        page = self.PAGES["plain"].format(rows=rows)
+        parser = validate_report.TrendingSourceParser()
+        parser.feed(page)
+        self.assertTrue(parser.list_closed)
+        self.assertEqual(validate_report.parse_source_chunks([page], "stdlib"), ["r0/r0", "r1/r1", "r2/r2"])
+        late = self.PAGES["rows_after_container"].format(rows=rows)
+        self.assertIsNone(validate_report.parse_source_chunks(validate_report.iter_text_slices(late, 16), "stdlib"))
+
+    def test_early_stop_matches_full_parse(self):
+        row = "<article class='Box-row'><h2><a href='/a/b'>a</a></h2></article>"
+        # Markup that html.parser reads as text, or that swallows a row.
+        pages = [
+            f"<Box-row<script>{row}",
+            f"<text<!--{row}",
+            f"<![CDATA[ {row} ]]>{row}",
+            f"<div title='<article class=Box-row>'>{row}",
+            f"<script/>{row}",
+            f"<script x=>{row}</script>",
+            f"<!doctype html><!x {row}>{row}",
+            f"</ {row}>{row}",
+            f"<?pi {row}>{row}",
+            f"<a<{row}",
+            f"<!-- --!>{row}-- >{row}",
+        ]
+        rng = random.Random(0)
+        pieces = [
+            "<article class='Box-row'>", "</article>", "<a href='/o/r'>", "<a href='/p/q'>", "<div>", "</div>",
+            "<!--", "-->", "<script>", "</script>", "<style>", "</style>", "<", ">", "'", '"', "x", " ", "\n",
+            "<Box-row", "<text", "<![CDATA[", "]]>", "<!doctype html>", "<!x", "</ ", "<?pi", "<span>", "</span>",
+        ]
+        pages += ["".join(rng.choice(pieces) for _ in range(rng.randrange(25))) for _ in range(3000)]
+        for page in pages:
+            expected = validate_report.parse_source_chunks([page], "stdlib", shortcuts=False)
+            for chunk_size in (len(page) or 1, 3, 1):
+                with self.subTest(page=page, chunk_size=chunk_size):
+                    repos = validate_report.parse_source_chunks(
+                        validate_report.iter_text_slices(page, chunk_size), "stdlib"
+                    )
+                    # None hands the page to the full parse.
+                    self.assertIn(repos, (None, expected))
+
+    def test_stray_end_tag_before_row_across_chunks(self):
+        # The stray </span> looks like the end of the list; the third row crosses a chunk boundary.
+        rows = "".join(self.ROW.format(f"r{index}") for index in range(2))
+        head = f"<html><body><div class='Box'>{rows}</span><article class='Box-row'><p>"
+        padding = "x" * (validate_report.STREAM_CHUNK_SIZE - len(head) + 100)
+        source_html = f"{head}{padding}</p><h2><a href='/r2/r2'>r2</a></h2></article></div></body></html>"
+        expected = ["r0/r0", "r1/r1", "r2/r2"]
+        for backend in html_backends.available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(validate_report.extract_source_repos(source_html, backend), expected)
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    source_file = Path(temp_dir) / "original_trending.html"
+                    source_file.write_text(source_html, encoding="utf-8")
+                    extracts = (validate_report.extract_source_repos_streaming, validate_report.extract_source_repos_mapped)
+                    for extract in extracts:
+                        self.assertEqual(extract(source_file, backend=backend)[0], expected)
+
+
+class MappedSourceTests(unittest.TestCase):
+    SNIPPETS = [
+        b"",
+        b"\xff",
+        b"\xe2\x82",
+        b"\r\n",
+        b"\r",
+        "é 🚀".encode(),
+        b"\xc2\xa0",
+        b'<article class="Box-row">',
+        b"Box-\xffrow",
+        b"</div>",
+        b'<h2><a href="/x/y">',
+        b"<!--",
+        b"<script>",
+    ]
+
+    def assert_matches_decoded_text(self, source_file: Path, backend: str) -> None:
+        text = source_file.read_text(encoding="utf-8", errors="ignore")
+        expected = (validate_report.extract_source_repos(text, backend), bool(text.strip()))
+        for chunk_size in (1, 13, 4096):
+            self.assertEqual(validate_report.extract_source_repos_mapped(source_file, chunk_size, backend), expected)
+
+    def test_mapped_extraction_matches_decoded_text(self):
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir) / "original_trending.html"
+            for page in ["", " \n\t", "\xa0\u3000", "<h2><a href=\"/a/b\">", "Box-row"]:
+                source_file.write_text(page, encoding="utf-8")
+                with self.subTest(page=page):
+                    self.assert_matches_decoded_text(source_file, "stdlib")
+            source_file.write_bytes(b" \xff\n")
+            self.assert_matches_decoded_text(source_file, "stdlib")
+
+            base = corpus.source_page(corpus.synthetic_repos(12)).encode()
+            for step in range(60):
+                data = base
+                for _ in range(rng.randint(1, 4)):
+                    start = rng.randrange(len(data) + 1)
+                    data = data[:start] + rng.choice(self.SNIPPETS) + data[start + rng.randint(0, 120) :]
+                source_file.write_bytes(data)
+                for backend in html_backends.available_backends():
+                    with self.subTest(step=step, backend=backend):
+                        self.assert_matches_decoded_text(source_file, backend)
+
+    def test_rest_of_page_is_searched_as_bytes(self):
+        rows = "".join(SourceExtractionShortcutTests.ROW.format(f"r{index}") for index in range(3))
+        page = SourceExtractionShortcutTests.PAGES["plain"].format(rows=rows) + "<p>x</p>" * 20_000
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_file = Path(temp_dir) / "original_trending.html"
+            for footer, expected in (("", ["r0/r0", "r1/r1", "r2/r2"]), ("<p>Box-\udcffrow</p>", None)):
+                source_file.write_text(page + footer, encoding="utf-8", errors="surrogateescape")
+                with self.subTest(footer=footer), open(source_file, "rb") as handle:
+                    mapped = validate_report.MappedSourcePage(handle)
+                    chunks = mapped.chunks(4096)
+                    repos = validate_report.parse_source_chunks(chunks, "stdlib", True, mapped.rest_has_box_row)
+                    self.assertEqual(repos, expected)
+                    self.assertLess(mapped._decoded_end, 10_000)
+                    chunks.close()
+                    mapped.close()
+            with mock.patch.object(validate_report, "iter_h2_fallback_repos") as fallback:
+                self.assertEqual(validate_report.extract_source_repos_mapped(source_file)[0], ["r0/r0", "r1/r1", "r2/r2"])
+            fallback.assert_not_called()
+
+
+class HtmlBackendTests(unittest.TestCase):
+    FIXTURE_DIRS = StreamingValidationTests.FIXTURE_DIRS
+
+    def test_backends_match_stdlib_on_fixtures(self):
+        for backend in html_backends.available_backends():
+            for fixture_dir in self.FIXTURE_DIRS:
+                with self.subTest(backend=backend, fixture=fixture_dir.parent.parent.name):
+                    source_html = (fixture_dir / "original_trending.html").read_text(encoding="utf-8")
+                    report_html = (fixture_dir / f"report_{DATE}.html").read_text(encoding="utf-8")
+                    self.assertEqual(
+                        validate_report.extract_source_repos(source_html, backend),
+                        validate_report.extract_source_repos(source_html, "stdlib"),
+                    )
+                    expected = validate_report.parse_html_cards(report_html, "stdlib")
+                    actual = validate_report.parse_html_cards(report_html, backend)
+                    self.assertEqual(actual.cards, expected.cards)
+                    self.assertEqual(actual.classes_seen, expected.classes_seen)
+                    self.assertEqual(actual.section_heading_found, expected.section_heading_found)
+                    self.assertEqual(actual.invalid_list_inside_p, expected.invalid_list_inside_p)
+
+                    with tempfile.TemporaryDirectory() as temp_home:
+                        report_dir = stage_fixture_under_home(temp_home, fixture_dir)
+                        with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                            self.assertEqual(
+                                validate_report.validate_report_dir(
+                                    report_dir, PERIOD, DATE, streaming=True, chunk_size=7, html_backend=backend
+                                ).errors,
+                                validate_report.validate_report_dir(report_dir, PERIOD, DATE, html_backend="stdlib").errors,
+                            )
+
+    def test_raw_structure_scanner_matches_stdlib_parser(self):
+        cases = [
+            "<p>intro<ul><li>x</li></ul></p>",
+            "<P class='a'>intro<OL><li>x</li></OL>",
+            "<p>a</p><ul><li>x</li></ul>",
+            "<p/><ul></ul>",
+            "<p>a<!-- <ul> --></p><ol></ol>",
+            "<p>a<script>if (a<b) document.write('<ul>')</script></p>",
+            "<p>a</p></p><p>b</p><ul></ul>",
+            "<div><p>nested<div><ul></ul></div></p></div>",
+        ]
+        for html_text in cases:
+            expected = validate_report.parse_html_cards(html_text, "stdlib").list_in_p_pos
+            for chunk_size in (1, 3, len(html_text)):
+                with self.subTest(html=html_text, chunk_size=chunk_size):
+                    scanner = html_backends.RawStructureScanner()
+                    for start in range(0, len(html_text), chunk_size):
+                        scanner.feed(html_text[start : start + chunk_size])
+                    self.assertEqual(scanner.list_in_p_pos, expected)
+
+    def test_structure_check_positions(self):
+        cases = {
+            "<html><head><title>`x`</title></head>\n<body>\n  <p>a `b`\n  <ul></ul></p>\n</body></html>": ((3, 7), (4, 2)),
+            "<html><body>clean</body>\n<!-- ` after body --></html>": (None, None),
+            "no body tag\n`here`": ((2, 0), None),
+        }
+        for html_text, (backtick_pos, list_pos) in cases.items():
+            for backend in html_backends.available_backends():
+                with self.subTest(html=html_text, backend=backend):
+                    parser = validate_report.parse_html_cards(html_text, backend)
+                    self.assertEqual(parser.body_backtick_pos, backtick_pos)
+                    self.assertEqual(parser.list_in_p_pos, list_pos)
+            chunked = validate_report.HtmlReportParser()
+            for start in range(0, len(html_text), 2):
+                chunked.feed(html_text[start : start + 2])
+            self.assertEqual((chunked.body_backtick_pos, chunked.list_in_p_pos), (backtick_pos, list_pos))
+
+    def test_resolve_backend(self):
+        self.assertEqual(html_backends.resolve_backend("stdlib"), "stdlib")
+        with mock.patch.dict(os.environ, {html_backends.HTML_BACKEND_ENV: "stdlib"}):
+            self.assertEqual(html_backends.resolve_backend(), "stdlib")
+        # auto never depends on which optional packages are installed.
+        with mock.patch.dict(os.environ, {html_backends.HTML_BACKEND_ENV: ""}):
+            self.assertEqual(html_backends.resolve_backend(), "stdlib")
+        self.assertEqual(html_backends.resolve_backend("auto"), "stdlib")
+        with self.assertRaises(ValueError):
+            html_backends.resolve_backend("html5lib")
+
+    def test_default_backend_matches_stdlib_on_malformed_html(self):
+        fixture_dir = FIXTURES / "pass" / PERIOD / DATE
+        lines = (fixture_dir / f"report_{DATE}.html").read_text(encoding="utf-8").split("\n")
+        last_card_end = max(index for index, line in enumerate(lines) if line == "  </div>")
+        rng = random.Random(3)
+        variants = [lines[:last_card_end] + lines[last_card_end + 1 :]]
+        for _ in range(40):
+            variant = list(lines)
+            for _ in range(rng.randrange(1, 4)):
+                index = rng.randrange(len(variant))
+                variant[index] = variant[index].replace(rng.choice(["</div>", "</span>", "<div", "</p>", ">"]), "", 1)
+            variants.append(variant)
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            os.environ.pop(html_backends.HTML_BACKEND_ENV, None)
+            report_dir = stage_fixture_under_home(temp_home, fixture_dir)
+            html_file = report_dir / f"report_{DATE}.html"
+            for index, variant in enumerate(variants):
+                html_file.write_text("\n".join(variant), encoding="utf-8")
+                with self.subTest(variant=index):
+                    expected = validate_report.validate_report_dir(report_dir, PERIOD, DATE, html_backend="stdlib")
+                    actual = validate_report.validate_report_dir(report_dir, PERIOD, DATE)
+                    self.assertEqual(actual.errors, expected.errors)
+            html_file.write_text("\n".join(variants[0]), encoding="utf-8")
+            result = run_validator(report_dir, PERIOD, DATE, env=dict(os.environ))
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("Cross-file count mismatch", result.stdout)
+
+    def test_html_backend_cli_flag(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "fail" / "html_structure" / PERIOD / DATE)
+            for backend in ["auto", *html_backends.available_backends()]:
+                with self.subTest(backend=backend):
+                    result = run_validator(
+                        report_dir, period=PERIOD, date=DATE, env=env, extra_args=["--html-backend", backend]
+                    )
+                    self.assertEqual(result.returncode, 1)
+                    self.assertRegex(result.stdout, r"HTML contains invalid nested structure: <p><ul>/<ol> at line \d+, column \d+\.")
+
+
+class PhaseProfilingTests(unittest.TestCase):
+    PROFILED_PHASES = ("source_extraction", "markdown_parse", "html_parse", "manifest_checks", "report_checks", "cross_file")
+
+    def test_timer_records_phases_without_changing_result(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                untimed = validate_report.validate_report_dir(report_dir, PERIOD, DATE)
+                for streaming in (False, True):
+                    with self.subTest(streaming=streaming):
+                        timer = validate_report.PhaseTimer()
+                        timed = validate_report.validate_report_dir(
+                            report_dir, PERIOD, DATE, streaming=streaming, timer=timer
+                        )
+                        self.assertEqual((timed.errors, timed.warnings), (untimed.errors, untimed.warnings))
+                        self.assertIs(timed.phases, timer.phases)
+                        self.assertEqual(set(timer.phases) - {"read"}, set(self.PROFILED_PHASES))
+                        self.assertEqual("read" in timer.phases, not streaming)
+                        source_size = (report_dir / "original_trending.html").stat().st_size
+                        self.assertEqual(timer.phases["source_extraction"].bytes, source_size)
+            self.assertEqual(untimed.phases, {})
+
+    def test_profile_cli_flags(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            stats_file = Path(temp_home) / "validate.pstats"
+            result = run_validator(
+                report_dir, PERIOD, DATE, env=env, extra_args=["--profile", "--profile-output", str(stats_file)]
+            )
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertIn("VALIDATION PASSED", result.stdout)
+            profile = json.loads(result.stderr)["profile"]
+            self.assertIn("html_parse", profile["phases"])
+            self.assertGreaterEqual(profile["total_wall_ms"], profile["phases"]["html_parse"]["wall_ms"])
+            self.assertTrue(stats_file.stat().st_size > 0)
+
+            plain = run_existing_check(PERIOD, DATE, env=env)
+            miss = run_existing_check(PERIOD, DATE, env=env, extra_args=["--no-cache", "--profile"])
+            hit = run_existing_check(PERIOD, DATE, env=env, extra_args=["--profile"])
+            self.assertEqual(miss.stdout, plain.stdout)
+            self.assertEqual(hit.stdout, plain.stdout)
+            self.assertIn("cross_file", json.loads(miss.stderr)["profile"]["phases"])
+            self.assertEqual(set(json.loads(hit.stderr)["profile"]["phases"]), {"cache_lookup"})
+
+
+class FailFastTests(unittest.TestCase):
+    def test_fail_fast_errors_are_a_subset_of_exhaustive_errors(self):
+        fixtures = [FIXTURES / "pass" / PERIOD / DATE]
+        fixtures += [path / PERIOD / DATE for path in sorted((FIXTURES / "fail").iterdir())]
+        for fixture in fixtures:
+            with self.subTest(fixture=fixture.parts[-3]), tempfile.TemporaryDirectory() as temp_home:
+                report_dir = stage_fixture_under_home(temp_home, fixture)
+                with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                    exhaustive = validate_report.validate_report_dir(report_dir, PERIOD, DATE)
+                    for streaming in (False, True):
+                        fast = validate_report.validate_report_dir(
+                            report_dir, PERIOD, DATE, streaming=streaming, fail_fast=True
+                        )
+                        self.assertEqual(bool(fast.errors), bool(exhaustive.errors))
+                        self.assertLessEqual(set(fast.errors), set(exhaustive.errors))
+                        if not fast.errors:
+                            self.assertEqual(fast.skipped, [])
+                self.assertEqual(exhaustive.skipped, [])
+
+    def test_fail_fast_stops_before_parsing_reports(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            manifest_file = report_dir / "report_manifest.json"
+            manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+            manifest["reported_item_count"] += 1
+            manifest_file.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+            with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                with mock.patch("validate_report.parse_html_cards", side_effect=AssertionError("HTML parsed")):
+                    fast = validate_report.validate_report_dir(report_dir, PERIOD, DATE, fail_fast=True)
+            self.assertEqual(fast.skipped, ["markdown", "html", "source"])
+            self.assertTrue(all("reported_item_count" in error for error in fast.errors))
+
+            result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--fail-fast"])
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("SKIPPED (fail-fast)\n1. markdown: ", result.stdout)
+            self.assertIn("3. source: ", result.stdout)
+            exhaustive = run_validator(report_dir, PERIOD, DATE, env=env)
+            self.assertNotIn("SKIPPED", exhaustive.stdout)
+
+
+class ParallelParsingTests(unittest.TestCase):
+    def test_parallel_errors_match_serial_run(self):
+        fixtures = [FIXTURES / "pass" / PERIOD / DATE]
+        fixtures += [path / PERIOD / DATE for path in sorted((FIXTURES / "fail").iterdir())]
+        for fixture in fixtures:
+            with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+                report_dir = stage_fixture_under_home(temp_home, fixture)
+                serial = validate_report.validate_report_dir(report_dir, PERIOD, DATE)
+                for streaming in (False, True):
+                    with self.subTest(fixture=fixture.parts[-3], streaming=streaming):
+                        timer = validate_report.PhaseTimer()
+                        with mock.patch.object(validate_report, "usable_cpus", return_value=2):
+                            parallel = validate_report.validate_report_dir(
+                                report_dir, PERIOD, DATE, streaming=streaming, timer=timer, parallel=True
+                            )
+                        self.assertEqual(parallel.errors, serial.errors)
+                        self.assertIn("parallel_wait", timer.phases)
+                        self.assertNotIn("html_parse", timer.phases)
+
+    def test_single_cpu_parses_serially(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            timer = validate_report.PhaseTimer()
+            with mock.patch.object(validate_report, "usable_cpus", return_value=1):
+                result = validate_report.validate_report_dir(report_dir, PERIOD, DATE, timer=timer, parallel=True)
+            self.assertEqual(result.errors, [])
+            self.assertNotIn("parallel_wait", timer.phases)
+            self.assertIn("html_parse", timer.phases)
+
+    def test_parallel_cli_flag(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE)
+            serial = run_validator(report_dir, PERIOD, DATE, env=env)
+            parallel = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--parallel"])
+            self.assertEqual((parallel.returncode, parallel.stdout), (serial.returncode, serial.stdout))
+            both = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--parallel", "--fail-fast"])
+            self.assertEqual(both.returncode, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,183 @@
+import os
+import random
+import re
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from test_validate_report import DATE, FIXTURES, PERIOD, home_env, run_validator, stage_fixture_under_home
+
+import corpus
+import html_backends
+import validate_report
+import validation_budget
+from artifact_io import compress_file
+from check_existing_report import check_existing_report
+
+# The single regexes that _match_tag and iter_h2_fallback_matches replace.
+TAG_RE = re.compile(r"""<(/?)([a-zA-Z][^\s/>]*)(?:[^>"']|"[^"]*"|'[^']*')*>""")
+FIXTURE_DIRS = [FIXTURES / "pass" / PERIOD / DATE, *sorted((FIXTURES / "fail").glob(f"*/{PERIOD}/{DATE}"))]
+
+
+def validate(report_dir, **kwargs):
+    return validate_report.validate_report_dir(report_dir, PERIOD, DATE, **kwargs)
+
+
+class GuardedValidationTests(unittest.TestCase):
+    def test_guarded_matches_unguarded_on_fixtures(self):
+        budget = validation_budget.ValidationBudget()
+        modes = [{"html_backend": backend} for backend in html_backends.available_backends()]
+        modes.append({"streaming": True, "chunk_size": 7})
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            for fixture_dir in FIXTURE_DIRS:
+                report_dir = stage_fixture_under_home(temp_home, fixture_dir)
+                for mode in modes:
+                    with self.subTest(fixture=fixture_dir.parts[-3], mode=mode):
+                        expected = validate(report_dir, source_sidecar=False, **mode)
+                        actual = validate(report_dir, source_sidecar=False, budget=budget, **mode)
+                        self.assertEqual(actual.errors, expected.errors)
+                        self.assertEqual(actual.repo_diffs, expected.repo_diffs)
+            with self.assertRaises(ValueError):
+                validate(report_dir, budget=budget, fail_fast=True)
+
+    def test_size_budget(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            md_file = report_dir / f"report_{DATE}.md"
+            budget = validation_budget.ValidationBudget(max_bytes={"md_file": 100})
+            self.assertEqual(
+                validate(report_dir, budget=budget).errors,
+                [
+                    f"{md_file.name} is {md_file.stat().st_size} bytes, over its size budget of 100 bytes.",
+                    "Cross-file checks skipped; unfinished checks: markdown.",
+                ],
+            )
+
+            source = report_dir / "original_trending.html"
+            compress_file(source, report_dir / "original_trending.html.gz", "gzip")
+            source.unlink()
+            budget = validation_budget.make_budget(max_artifact_bytes=400)
+            errors = validate(report_dir, budget=budget).errors
+            self.assertEqual(
+                errors[0], "original_trending.html.gz decompresses to more than its size budget of 400 bytes."
+            )
+            self.assertEqual(errors[-1], "Cross-file checks skipped; unfinished checks: source, markdown, html.")
+            self.assertEqual(validate(report_dir, budget=validation_budget.make_budget()).errors, [])
+
+    def test_check_runner_time_budget(self):
+        with validation_budget.CheckRunner(validation_budget.ValidationBudget(0.3)) as runner:
+            started = time.perf_counter()
+            overrun = r"^slow check exceeded its time budget of 0\.3 s\.$"
+            with self.assertRaisesRegex(validation_budget.CheckFailed, overrun):
+                runner.run("slow", time.sleep, 30)
+            self.assertLess(time.perf_counter() - started, 10)
+            # The killed worker is replaced.
+            self.assertEqual(runner.run("fast", abs, -1), 1)
+            with self.assertRaisesRegex(validation_budget.CheckFailed, r"^bad check failed: ValueError: "):
+                runner.run("bad", int, "x")
+
+        with mock.patch("multiprocessing.get_context", side_effect=OSError):
+            runner = validation_budget.CheckRunner(validation_budget.ValidationBudget(0.05))
+            self.assertEqual(runner.run("fast", abs, -1), 1)
+            with self.assertRaisesRegex(validation_budget.CheckFailed, "exceeded its time budget"):
+                runner.run("slow", time.sleep, 0.2)
+
+    def test_crashing_inputs_become_errors(self):
+        cases = [
+            ("report_manifest.json", "[" * 100000, "Manifest JSON parse error: "),
+            ("report_manifest.json", '{"source_item_count": ' + "9" * 5000 + "}", "Manifest JSON parse error: "),
+            (f"report_{DATE}.md", "### " + "9" * 5000 + ". [a/b](https://github.com/a/b)\n", "rank"),
+        ]
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            for name, text, expected in cases:
+                path = report_dir / name
+                original = path.read_text(encoding="utf-8")
+                path.write_text(text, encoding="utf-8")
+                for budget in (None, validation_budget.ValidationBudget()):
+                    with self.subTest(name=name, text=text[:30], guarded=budget is not None):
+                        errors = validate(report_dir, budget=budget).errors
+                        self.assertTrue(any(expected in error for error in errors), errors)
+                        self.assertFalse(any("check failed" in error for error in errors), errors)
+                path.write_text(original, encoding="utf-8")
+        self.assertEqual(validate_report.parse_rank("9" * 5000), 0)
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--guarded"])
+            self.assertEqual(result.returncode, 0, result.stdout + result.stderr)
+
+            result = run_validator(
+                report_dir, PERIOD, DATE, env=env, extra_args=["--guarded", "--max-artifact-bytes", "100"]
+            )
+            self.assertEqual(result.returncode, 1)
+            self.assertIn("over its size budget of 100 bytes", result.stdout)
+
+            result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--guarded", "--fail-fast"])
+            self.assertEqual(result.returncode, 2)
+            result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--guarded", "--check-seconds", "0"])
+            self.assertEqual(result.returncode, 2)
+
+            with mock.patch.dict(os.environ, {"HOME": temp_home}):
+                budget = validation_budget.make_budget(max_artifact_bytes=100)
+                self.assertEqual(check_existing_report(PERIOD, DATE, use_cache=True, budget=budget)[0], 20)
+                # A result over budget is not cached, so an unguarded check does not reuse it.
+                self.assertEqual(check_existing_report(PERIOD, DATE, use_cache=True)[0], 0)
+
+
+class PathologicalInputTests(unittest.TestCase):
+    def test_stress_corpus_stays_within_budget(self):
+        budget = validation_budget.ValidationBudget(60)
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = Path(temp_home) / "report"
+            for artifact, cases in corpus.STRESS_CASES.items():
+                # Markdown and manifest checks do not use the HTML backend.
+                parsed_as_html = artifact in ("source_file", "html_file")
+                backends = html_backends.available_backends() if parsed_as_html else ["stdlib"]
+                for case in cases:
+                    corpus.write_stress_report_dir(report_dir, artifact, case, 20000, PERIOD, DATE)
+                    for backend in backends:
+                        with self.subTest(artifact=artifact, case=case, backend=backend):
+                            errors = validate(report_dir, html_backend=backend, budget=budget).errors
+                            self.assertTrue(errors)
+                            self.assertFalse(any("check failed" in error or "time budget" in error for error in errors))
+
+    def test_formerly_superlinear_inputs_are_fast(self):
+        size = 400000
+        inputs = {
+            "unclosed_tag_run": "<a" * (size // 2),
+            "tag_name_then_stray_quote": "<a" + "b" * size + ' ">',
+            "unclosed_h2_run": "<h2" * (size // 3),
+            "h2_tags_sharing_one_end": "<h2 " * (size // 4) + ">",
+            "body_end_flood": "<body>" + "</body>\n" * (size // 8),
+            "backtick_lines": "<body>" + "`\n" * (size // 2),
+        }
+        for name, text in inputs.items():
+            with self.subTest(name=name):
+                started = time.perf_counter()
+                scanner = html_backends.RawStructureScanner()
+                scanner.feed(text)
+                list(validate_report.iter_h2_fallback_matches(text))
+                validate_report.parse_html_cards(text, "stdlib")
+                # Quadratic at this size would take minutes.
+                self.assertLess(time.perf_counter() - started, 10)
+
+    def test_linear_rewrites_match_the_regexes(self):
+        rng = random.Random(0)
+        pieces = ["<h2", "<H2 x>", ">", " ", "<a ", 'href="https://github.com/o/r"', "\n", "x"]
+        for _ in range(10000):
+            text = "".join(rng.choice("<<aA/ >\"'b\n2hH=") for _ in range(rng.randrange(16)))
+            for lt in (index for index, char in enumerate(text) if char == "<"):
+                match = TAG_RE.match(text, lt)
+                expected = match and (match.group(1), match.group(2), match.end())
+                self.assertEqual(html_backends.RawStructureScanner._match_tag(text, lt), expected, (text, lt))
+            text = "".join(rng.choice(pieces) for _ in range(rng.randrange(12)))
+            expected = [(m.start(), m.end(), m.group(1)) for m in validate_report.H2_FALLBACK_RE.finditer(text)]
+            self.assertEqual(list(validate_report.iter_h2_fallback_matches(text)), expected, text)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+from test_validate_report import DATE, FIXTURES, PERIOD, home_env, run_existing_check, stage_fixture_under_home
+
+import check_existing_report as gate
+import html_backends
+import validation_cache
+
+
+class ValidationCacheTests(unittest.TestCase):
+    def test_unchanged_artifacts_reuse_cached_payload(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            first = gate.check_existing_report(PERIOD, DATE)
+            self.assertEqual(first[0], 0)
+            self.assertTrue((report_dir / validation_cache.CACHE_FILE_NAME).exists())
+
+            with mock.patch("validate_report.validate_report_dir", side_effect=AssertionError("cache bypassed")):
+                self.assertEqual(gate.check_existing_report(PERIOD, DATE), first)
+
+    def test_same_size_and_mtime_rewrite_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            self.assertEqual(gate.check_existing_report(PERIOD, DATE)[0], 0)
+
+            manifest_file = report_dir / "report_manifest.json"
+            stat = manifest_file.stat()
+            manifest = manifest_file.read_text(encoding="utf-8")
+            manifest_file.write_text(manifest.replace('"rank": 1', '"rank": 9'), encoding="utf-8")
+            os.utime(manifest_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            exit_code, payload = gate.check_existing_report(PERIOD, DATE)
+            self.assertEqual(exit_code, 20)
+            self.assertIn("Manifest repos[1] rank must be 1, got 9.", payload["errors"])
+
+    def test_validator_change_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            gate.check_existing_report(PERIOD, DATE)
+            with mock.patch.object(validation_cache, "validator_fingerprint", return_value="changed"):
+                self.assertIsNone(validation_cache.load_cached_result(gate.build_paths(PERIOD, DATE), "stdlib"))
+
+    def test_result_is_reused_only_for_the_same_html_backend(self):
+        if not html_backends.backend_available("lxml"):
+            self.skipTest("lxml not installed")
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            os.environ.pop(html_backends.HTML_BACKEND_ENV, None)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            # Without the last card's closing tag lxml repairs the markup and stdlib does not.
+            html_file = report_dir / f"report_{DATE}.html"
+            lines = html_file.read_text(encoding="utf-8").split("\n")
+            del lines[max(index for index, line in enumerate(lines) if line == "  </div>")]
+            html_file.write_text("\n".join(lines), encoding="utf-8")
+
+            self.assertEqual(gate.check_existing_report(PERIOD, DATE, html_backend="lxml")[0], 0)
+            exit_code, payload = gate.check_existing_report(PERIOD, DATE)
+            self.assertEqual(exit_code, 20)
+            self.assertTrue(any("Cross-file count mismatch" in error for error in payload["errors"]))
+
+            with mock.patch.dict(os.environ, {html_backends.HTML_BACKEND_ENV: "lxml"}):
+                self.assertEqual(gate.check_existing_report(PERIOD, DATE)[0], 0)
+            self.assertEqual(gate.check_existing_report(PERIOD, DATE, html_backend="stdlib")[0], 20)
+
+    def test_no_cache_flag_skips_cache_file(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            env = home_env(temp_home)
+            result = run_existing_check(period=PERIOD, date=DATE, env=env, extra_args=["--no-cache"])
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertEqual(json.loads(result.stdout)["status"], "existing_valid")
+            self.assertFalse((report_dir / validation_cache.CACHE_FILE_NAME).exists())
+
+    def test_concurrent_writers_use_separate_temp_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            target = Path(temp_dir) / validation_cache.CACHE_FILE_NAME
+            values = [{"writer": index, "padding": [index] * 20000} for index in range(8)]
+            with ThreadPoolExecutor(max_workers=len(values)) as pool:
+                for _ in pool.map(lambda value: validation_cache.write_json_atomically(target, value), values * 5):
+                    pass
+            self.assertIn(json.loads(target.read_text(encoding="utf-8")), values)
+            self.assertEqual(os.listdir(temp_dir), [target.name])
+            # A directory that cannot be written to is skipped.
+            validation_cache.write_json_atomically(Path(temp_dir) / "missing" / target.name, values[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from test_validate_report import (
+    DATE,
+    FIXTURES,
+    PERIOD,
+    home_env,
+    run_validator,
+    stage_fixture_under_home,
+)
+
+import corpus
+import validate_report
+import validation_state
+
+ARTIFACTS = ("original_trending.html", f"report_{DATE}.md", f"report_{DATE}.html", "report_manifest.json")
+
+
+def validate(report_dir, **kwargs):
+    return validate_report.validate_report_dir(report_dir, PERIOD, DATE, html_backend="stdlib", **kwargs)
+
+
+class IncrementalValidationTests(unittest.TestCase):
+    def test_incremental_errors_match_full_run_across_edits(self):
+        rng = random.Random(0)
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            corpus.write_report_dir(report_dir, 12, PERIOD, DATE)
+            for step in range(40):
+                target = report_dir / rng.choice(ARTIFACTS)
+                text = target.read_text(encoding="utf-8")
+                start = rng.randrange(len(text))
+                snippet = rng.choice(["", "`", "<p><ul>", "{", "\n### 3. [a/b](https://github.com/a/b)\n", "Box-row"])
+                target.write_text(text[:start] + snippet + text[start + rng.randint(0, 80) :], encoding="utf-8")
+                streaming = step % 2 == 0
+                with self.subTest(step=step, artifact=target.name):
+                    self.assertEqual(
+                        validate(report_dir, streaming=streaming, incremental=True).errors,
+                        validate(report_dir, streaming=streaming).errors,
+                    )
+
+    def test_only_changed_artifacts_are_reparsed(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            self.assertEqual(validate(report_dir, incremental=True).errors, [])
+            self.assertTrue(validation_state.state_file(report_dir).exists())
+
+            html_file = report_dir / f"report_{DATE}.html"
+            html_text = html_file.read_text(encoding="utf-8")
+            html_file.write_text(html_text.replace('class="suggestion-box"', 'class="note"', 1), encoding="utf-8")
+            untouched = ("extract_source_repos", "parse_markdown_lines", "validate_manifest")
+            with mock.patch.multiple(validate_report, **{name: mock.DEFAULT for name in untouched}) as mocks:
+                for name in untouched:
+                    mocks[name].side_effect = AssertionError(f"{name} re-ran")
+                errors = validate(report_dir, incremental=True).errors
+            self.assertEqual(errors, validate(report_dir).errors)
+            self.assertTrue(errors)
+
+            # Rewriting identical bytes keeps every node.
+            html_file.write_bytes(html_file.read_bytes())
+            with mock.patch.object(validate_report, "parse_html_cards", side_effect=AssertionError("HTML re-parsed")):
+                self.assertEqual(validate(report_dir, incremental=True).errors, errors)
+
+    def test_state_is_discarded_for_other_backend_or_validator(self):
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            validate(report_dir, incremental=True)
+            self.assertTrue(validation_state.load_state(report_dir, PERIOD, DATE, "stdlib"))
+            self.assertEqual(validation_state.load_state(report_dir, PERIOD, DATE, "lxml"), {})
+            with mock.patch.object(validation_state, "validator_fingerprint", return_value="changed"):
+                self.assertEqual(validation_state.load_state(report_dir, PERIOD, DATE, "stdlib"), {})
+
+    def test_incremental_cli_flag(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "fail" / "count_mismatch" / PERIOD / DATE)
+            full = run_validator(report_dir, PERIOD, DATE, env=env)
+            for _ in range(2):
+                result = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--incremental"])
+                self.assertEqual((result.returncode, result.stdout), (full.returncode, full.stdout))
+            self.assertTrue(validation_state.state_file(report_dir).exists())
+
+            both = run_validator(report_dir, PERIOD, DATE, env=env, extra_args=["--incremental", "--fail-fast"])
+            self.assertEqual(both.returncode, 2)
+            self.assertIn("not allowed with argument", both.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+from unittest import mock
+
+from test_validate_report import (
+    DATE,
+    FIXTURES,
+    PERIOD,
+    ROOT,
+    home_env,
+    run_existing_check,
+    run_validator,
+    stage_fixture_under_home,
+)
+
+DAEMON_SCRIPT = ROOT / "scripts" / "validator_daemon.py"
+
+
+def run_daemon_command(env: dict[str, str], *args: str):
+    cmd = [sys.executable, str(DAEMON_SCRIPT), *args]
+    return subprocess.run(cmd, capture_output=True, text=True, cwd=ROOT, env=env)
+
+
+class ValidatorDaemonTests(unittest.TestCase):
+    def test_clients_use_running_daemon(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "fail" / "source_repo_mismatch" / PERIOD / DATE)
+            expected = run_existing_check(period=PERIOD, date=DATE, env=env, extra_args=["--no-cache"])
+
+            daemon = subprocess.Popen(
+                [sys.executable, str(DAEMON_SCRIPT)], stdout=subprocess.PIPE, text=True, cwd=ROOT, env=env
+            )
+            try:
+                self.assertEqual(json.loads(daemon.stdout.readline())["status"], "listening")
+
+                gate = run_existing_check(period=PERIOD, date=DATE, env=env, extra_args=["--no-cache", "--use-daemon"])
+                self.assertEqual(gate.returncode, 20, msg=gate.stdout + gate.stderr)
+                self.assertEqual(json.loads(gate.stdout), json.loads(expected.stdout))
+
+                validation = run_validator(report_dir, period=PERIOD, date=DATE, env=env, extra_args=["--use-daemon"])
+                self.assertEqual(validation.returncode, 1)
+                self.assertIn("Source vs Markdown repo mismatch", validation.stdout)
+                options = ["--use-daemon", "--streaming", "--chunk-size", "7", "--allow-small-source"]
+                streamed = run_validator(report_dir, period=PERIOD, date=DATE, env=env, extra_args=options)
+                self.assertEqual(streamed.stdout, validation.stdout)
+
+                status = run_daemon_command(env, "--status")
+                self.assertEqual(json.loads(status.stdout)["served"], 3)
+            finally:
+                run_daemon_command(env, "--stop")
+                daemon.wait(timeout=10)
+            self.assertFalse((Path(temp_home) / ".github_trending" / ".validator.sock").exists())
+
+    def test_clients_fall_back_without_daemon(self):
+        with tempfile.TemporaryDirectory() as temp_home:
+            env = home_env(temp_home)
+            stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            result = run_existing_check(period=PERIOD, date=DATE, env=env, extra_args=["--use-daemon"])
+            self.assertEqual(result.returncode, 0, msg=result.stdout + result.stderr)
+            self.assertEqual(json.loads(result.stdout)["status"], "existing_valid")
+            self.assertEqual(run_daemon_command(env, "--status").returncode, 1)
+
+    def test_validator_forwards_options_to_daemon(self):
+        import validate_report
+        import validator_client
+
+        with tempfile.TemporaryDirectory() as temp_home, mock.patch.dict(os.environ, {"HOME": temp_home}):
+            report_dir = stage_fixture_under_home(temp_home, FIXTURES / "pass" / PERIOD / DATE)
+            argv = ["validate_report.py", "--report-dir", str(report_dir), "--period", PERIOD, "--date", DATE]
+            argv += ["--use-daemon", "--streaming", "--chunk-size", "7", "--allow-small-source"]
+            with mock.patch.object(sys, "argv", argv), mock.patch.object(
+                validator_client, "request", return_value=None
+            ) as request, contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(validate_report.main(), 0)
+            message = request.call_args.args[0]
+            self.assertEqual((message["chunk_size"], message["allow_small_source"]), (7, True))
+
+
+if __name__ == "__main__":
+    unittest.main()